@@ -1,5 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Iterator
+
+import numpy as np
 import pandas as pd
 
+from .config import PAGE_ROWS
+from .metrics import timer
+from .render import TABLE_SLOT, PageTemplate, publish_table, table_body, write_if_changed
+
+_EMPTY = "<p>No all-rounder records found.</p>"
+
+
+def _percentile(sorted_points: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """rank(pct=True, method="max") of `points` among `sorted_points`; 0 for no points."""
+    if not len(sorted_points):
+        return np.zeros(len(points))
+    return np.where(points > 0, np.searchsorted(sorted_points, points, side="right") / len(sorted_points), 0.0)
+
+
+# (player, points, klasse) arrays for one side's scored rows
+Side = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _best(codes: np.ndarray, points: np.ndarray, klasse: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Each player's highest points (as int) and that row's klasse; the first such row wins, as groupby.idxmax."""
+    rows = np.flatnonzero(codes >= 0)  # -1: no player name
+    order = rows[np.lexsort((-points[rows], codes[rows]))]
+    first = order[np.r_[True, codes[order][1:] != codes[order][:-1]]] if len(order) else order
+    best_pts, best_klasse = np.zeros(n, dtype=np.int64), np.full(n, np.nan, dtype=object)
+    best_pts[codes[first]] = points[first].astype(np.int64)
+    best_klasse[codes[first]] = klasse[first]
+    return best_pts, best_klasse
+
+
+@dataclass
+class AllRounderIndex:
+    """Best batting/bowling points per player plus each side's sorted points (players with points > 0).
+
+    Percentiles are computed once, so ARI for any weight pair, or a whole grid of them, is one
+    vectorized expression with no re-ranking. Built over full-league tables, `percentiles` also
+    places any points (e.g. one club's players) within the league.
+    """
+    frame: pd.DataFrame         # Player, Bat Points, Bowl Points, Bat %ile, Bowl %ile, Bat Klasse, Bowl Klasse
+    bat_sorted: np.ndarray
+    bowl_sorted: np.ndarray
+
+    @classmethod
+    def build(cls, bat: Side, bowl: Side) -> AllRounderIndex:
+        """From each side's (player, points, klasse) arrays; a player missing on one side gets 0 points there."""
+        codes, players = pd.factorize(np.concatenate([bat[0], bowl[0]]), sort=True)
+        n = len(players)
+        bat_pts, bat_klasse = _best(codes[:len(bat[0])], bat[1], bat[2], n)
+        bowl_pts, bowl_klasse = _best(codes[len(bat[0]):], bowl[1], bowl[2], n)
+        bat_sorted, bowl_sorted = np.sort(bat_pts[bat_pts > 0]), np.sort(bowl_pts[bowl_pts > 0])
+        frame = pd.DataFrame({
+            "Player": np.asarray(players, dtype=object),
+            "Bat Points": bat_pts,
+            "Bowl Points": bowl_pts,
+            "Bat %ile": _percentile(bat_sorted, bat_pts),
+            "Bowl %ile": _percentile(bowl_sorted, bowl_pts),
+            "Bat Klasse": bat_klasse,
+            "Bowl Klasse": bowl_klasse,
+        })
+        return cls(frame, bat_sorted, bowl_sorted)
+
+    def percentiles(self, bat_points, bowl_points) -> tuple[np.ndarray, np.ndarray]:
+        return (_percentile(self.bat_sorted, np.asarray(bat_points)),
+                _percentile(self.bowl_sorted, np.asarray(bowl_points)))
+
+    def sweep(self, weights: Iterable[tuple[float, float]]) -> np.ndarray:
+        """ARI per player (rows) for each (bat, bowl) weight pair (columns)."""
+        w = np.asarray(list(weights), dtype=float).reshape(-1, 2)
+        bat = self.frame["Bat %ile"].to_numpy()[:, None]
+        bowl = self.frame["Bowl %ile"].to_numpy()[:, None]
+        return np.round(1000.0 * (bat * w[:, 0] + bowl * w[:, 1])).astype(np.int64)
+
+    def ari(self, bat_weight: float, bowl_weight: float) -> np.ndarray:
+        return self.sweep([(bat_weight, bowl_weight)])[:, 0]
+
+    def sensitivity(self, weights: Iterable[tuple[float, float]]) -> pd.DataFrame:
+        """Player plus one ARI column per weight pair, labelled "bat/bowl" (e.g. "0.55/0.45")."""
+        weights = [(float(b), float(w)) for b, w in weights]
+        table = pd.DataFrame(self.sweep(weights), columns=[f"{b:g}/{w:g}" for b, w in weights])
+        table.insert(0, "Player", self.frame["Player"].to_numpy())
+        return table
+
+
 class AllRounderLeaderboard:
     HTML_PATH: str
 
@@ -10,59 +99,37 @@ class AllRounderLeaderboard:
         self.bat_weight = float(bat_weight)
         self.bowl_weight = float(bowl_weight)
 
-    def _best_per_player(self, df: pd.DataFrame,
-                         points_col: str = "Points",
-                         klasse_candidates: tuple[str, ...] = ("Klasse", "Klasse Mix", "klasse", "klasse_mix")
-                         ) -> pd.DataFrame:
+    @staticmethod
+    def _side(df: pd.DataFrame | None, points_col: str = "Points",
+              klasse_candidates: tuple[str, ...] = ("Klasse", "Klasse Mix", "klasse", "klasse_mix")) -> Side:
         if df is None or df.empty:
-            return pd.DataFrame(columns=["Player", points_col, "Klasse"])
+            return np.empty(0, dtype=object), np.empty(0), np.empty(0, dtype=object)
         klasse_col = next((c for c in klasse_candidates if c in df.columns), None)
-        cols = ["Player", points_col] + ([klasse_col] if klasse_col else [])
-        df2 = df[[c for c in cols if c in df.columns]].copy()
-        df2[points_col] = pd.to_numeric(df2[points_col], errors="coerce").fillna(0)
-        idx = df2.groupby("Player")[points_col].idxmax()
-        best = df2.loc[idx].reset_index(drop=True)
-        if klasse_col and klasse_col in best.columns:
-            best.rename(columns={klasse_col: "Klasse"}, inplace=True)
-        else:
-            best["Klasse"] = ""
-        return best[["Player", points_col, "Klasse"]]
-
-    def compute(self, df_bat_scored: pd.DataFrame, df_bowl_scored: pd.DataFrame) -> pd.DataFrame:
-        bat_best = self._best_per_player(df_bat_scored).rename(columns={"Points": "Bat Points", "Klasse": "Bat Klasse"})
-        bowl_best = self._best_per_player(df_bowl_scored).rename(columns={"Points": "Bowl Points", "Klasse": "Bowl Klasse"})
-        allr = pd.merge(bat_best, bowl_best, on="Player", how="outer")
-        for c in ["Bat Points", "Bowl Points"]:
-            if c not in allr.columns: allr[c] = 0
-            allr[c] = pd.to_numeric(allr[c], errors="coerce").fillna(0).astype(int)
-
-        allr["Bat %ile"] = 0.0
-        mask_b = allr["Bat Points"] > 0
-        if mask_b.any(): allr.loc[mask_b, "Bat %ile"] = allr.loc[mask_b, "Bat Points"].rank(pct=True, method="max")
-        allr["Bowl %ile"] = 0.0
-        mask_bo = allr["Bowl Points"] > 0
-        if mask_bo.any(): allr.loc[mask_bo, "Bowl %ile"] = allr.loc[mask_bo, "Bowl Points"].rank(pct=True, method="max")
-
-        allr["ARI"] = (1000.0 * (0.55 * allr["Bat %ile"] + 0.45 * allr["Bowl %ile"])).round(0).astype(int)
-
-        keep = ["Player", "Bat Points", "Bowl Points", "Bat %ile", "Bowl %ile", "ARI", "Bat Klasse", "Bowl Klasse"]
-        keep = [c for c in keep if c in allr.columns]
-        allr = allr[keep].sort_values("ARI", ascending=False).reset_index(drop=True)
+        return (df["Player"].to_numpy(dtype=object),
+                pd.to_numeric(df[points_col], errors="coerce").fillna(0).to_numpy(dtype=float),
+                df[klasse_col].to_numpy(dtype=object) if klasse_col else np.full(len(df), "", dtype=object))
+
+    def index(self, df_bat_scored: pd.DataFrame, df_bowl_scored: pd.DataFrame) -> AllRounderIndex:
+        return AllRounderIndex.build(self._side(df_bat_scored), self._side(df_bowl_scored))
+
+    def compute(self, df_bat_scored: pd.DataFrame, df_bowl_scored: pd.DataFrame,
+                index: AllRounderIndex | None = None) -> pd.DataFrame:
+        """Ranked board at (bat_weight, bowl_weight); pass `index` to reuse one built from the same frames."""
+        with timer("score.allrounder"):
+            idx = self.index(df_bat_scored, df_bowl_scored) if index is None else index
+            allr = idx.frame.copy()
+            allr.insert(5, "ARI", idx.ari(self.bat_weight, self.bowl_weight))
+            allr = allr.sort_values("ARI", ascending=False).reset_index(drop=True)
 
         allr.insert(0, "Club Ranking", (allr.index + 1).astype(int))
         allr.insert(1, "Badge", allr["Club Ranking"].map({1:"🥇",2:"🥈",3:"🥉"}).fillna(""))
         return allr
 
-    @staticmethod
-    def _table_html(df: pd.DataFrame) -> str:
-        html = df.to_html(index=False, escape=False)
-        for col in ["Club Ranking", "ARI", "Bat Points", "Bowl Points"]:
-            html = html.replace(f"<th>{col}</th>", f'<th data-sort-method="number">{col}</th>')
-        return html
-
-    def generate_html(self, df_allr: pd.DataFrame) -> str:
-        body = "<p>No all-rounder records found.</p>" if df_allr.empty else self._table_html(df_allr)
-        return f"""<!DOCTYPE html>
+    SORTABLE = ("Club Ranking", "ARI", "Bat Points", "Bowl Points")
+
+    @cached_property
+    def page(self) -> PageTemplate:
+        return PageTemplate(f"""<!DOCTYPE html>
 <html>
 <head>
   <meta charset="utf-8" />
@@ -80,13 +147,28 @@ class AllRounderLeaderboard:
 </head>
 <body>
   <h2>ECC All-Rounder Leaderboard {self.season} — {self.club}</h2>
-  {body}
+  {TABLE_SLOT}
   <script>document.querySelectorAll('table').forEach(t => new Tablesort(t));</script>
   <div class="meta">
     <b>How ARI is calculated:</b><br>
     • Best batting & best bowling ICC-style points per player (klasse-weighted).<br>
-    • Convert to percentiles; ARI = 1000 × (0.55 × Bat %ile + 0.45 × Bowl %ile).<br>
+    • Convert to percentiles; ARI = 1000 × ({self.bat_weight:g} × Bat %ile + {self.bowl_weight:g} × Bowl %ile).<br>
     • Missing side counts as 0; badges show overall club rank.
   </div>
 </body>
-</html>"""
+</html>""")
+
+    def generate_html(self, df_allr: pd.DataFrame, page_rows: int = 0) -> str:
+        return "".join(self.iter_html(df_allr, page_rows))
+
+    def iter_html(self, df_allr: pd.DataFrame, page_rows: int = 0) -> Iterator[str]:
+        """`generate_html` as a stream of chunks (see render.write_if_changed)."""
+        if df_allr.empty:
+            return self.page.stream([_EMPTY])
+        return self.page.stream(table_body(df_allr, self.SORTABLE, self.HTML_PATH, page_rows))
+
+    def write_html(self, df_allr: pd.DataFrame, page_rows: int = PAGE_ROWS) -> bool:
+        """Write HTML_PATH (paged past `page_rows` rows); True if any file changed."""
+        if df_allr.empty:
+            return write_if_changed(self.HTML_PATH, self.page.stream([_EMPTY]))
+        return publish_table(self.HTML_PATH, self.page, df_allr, self.SORTABLE, page_rows)
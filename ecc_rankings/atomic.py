@@ -0,0 +1,68 @@
+"""Atomic file replacement: write a uniquely named temp file beside the target, then os.replace it.
+
+Readers only ever see the old file or the complete new one, and concurrent writers never share a
+temp file (each gets its own from `tempfile`).
+
+    with AtomicFile(path) as f:
+        f.write(text)
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import IO
+
+
+class AtomicFile:
+    """Temp file that replaces `path` on `commit()` (or a clean exit from the with-block).
+
+    `discard()` drops it and leaves `path` untouched; an exception in the block discards too.
+    """
+
+    def __init__(self, path: str, mode: str = "w", encoding: str | None = "utf-8"):
+        self.path = path
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        self.file: IO = tempfile.NamedTemporaryFile(
+            mode, encoding=None if "b" in mode else encoding, dir=directory,
+            prefix=os.path.basename(path) + ".", suffix=".tmp", delete=False,
+        )
+        self.tmp = self.file.name
+        self._done = False
+
+    def write(self, data) -> None:
+        self.file.write(data)
+
+    def close(self) -> None:
+        """Finish writing (the temp file can then be read back before committing)."""
+        self.file.close()
+
+    def commit(self) -> None:
+        if not self._done:
+            self._done = True
+            self.file.close()
+            os.replace(self.tmp, self.path)
+
+    def discard(self) -> None:
+        if not self._done:
+            self._done = True
+            self.file.close()
+            try:
+                os.remove(self.tmp)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "AtomicFile":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+
+def atomic_write(path: str, data: str | bytes) -> None:
+    """Replace `path` with `data` (text as UTF-8)."""
+    with AtomicFile(path, "wb" if isinstance(data, bytes) else "w") as f:
+        f.write(data)
@@ -1,51 +1,114 @@
-import time
+from contextlib import nullcontext
+from typing import Iterator
 import numpy as np
 import pandas as pd
-from selenium.webdriver.common.by import By
-from .config import BATTING_URLS, KLASSE_WEIGHTS, SEASON, CLUB_NAME
-from .driver import get_driver
-from .config import CHROME_PATH, HEADLESS, WINDOW_SIZE
+from .config import BATTING_URLS, FULL_LEAGUE, KLASSE_WEIGHTS, PAGE_ROWS, SEASON, CLUB_NAME
+from .fetch import ROWS, Fetcher, make_fetcher
+from .league import iter_league_pages
+from .memo import ScoreMemo
+from .metrics import timer
+from .render import TABLE_SLOT, PageTemplate, publish_table, table_body
+from .pool import DriverPool
+
+def _group_sums(values: np.ndarray, codes: np.ndarray, ngroups: int) -> np.ndarray:
+    """Per-group float sums, bit-identical to calling Series.sum() on each group.
+
+    numpy's pairwise summation depends on the element count, so groups of equal size are
+    stacked and summed row-wise together.
+    """
+    order = np.argsort(codes, kind="stable")
+    sizes = np.bincount(codes, minlength=ngroups)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    v = values[order]
+    out = np.zeros(ngroups)
+    for k in np.unique(sizes[sizes > 0]):
+        groups = np.flatnonzero(sizes == k)
+        out[groups] = v[starts[groups][:, None] + np.arange(k)].sum(axis=1)
+    return out
 
 class BattingScraper:
     HTML_PATH: str
+    SORTABLE = ("Club Ranking", "Points", "Runs", "matches", "average", "strike_rate")
+    PAGE = PageTemplate(f"""<!DOCTYPE html>
+                    <html>
+                    <head>
+                      <meta charset="utf-8" />
+                      <title>KNCB Batting Stats {SEASON}</title>
+                      <style>
+                        table {{ border-collapse: collapse; width: 100%; }}
+                        th, td {{ border: 1px solid #ddd; padding: 8px; }}
+                        th {{ background-color: #f2f2f2; cursor: pointer; }}
+                        tr:nth-child(even) {{ background-color:#fafafa; }}
+                        body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, Arial, sans-serif; margin: 24px; }}
+                      </style>
+                      <script src="https://unpkg.com/tablesort@5.2.1/dist/tablesort.min.js"></script>
+                    </head>
+                    <body>
+                      <h2>KNCB Batting Stats {SEASON} — {CLUB_NAME}</h2>
+                      {TABLE_SLOT}
+                      <script>new Tablesort(document.querySelector("table"));</script>
+                      <br>
+                      <div style="font-size:0.95em;color:#555;">
+                        <b>Scoring & merging:</b><br>
+                        Player appears once: stats merged across klassen (runs/inn/not-outs/matches summed; SR/AVG recomputed; highest=max).
+                        Klasse difficulty = match-weighted average; ICC-style multi-factor (tanh) score with sample-size.
+                      </div>
+                    </body>
+                    </html>
+                """)
 
     def __init__(self, html_path: str):
         self.HTML_PATH = html_path
-
-    def scrape(self) -> pd.DataFrame:
-        driver = get_driver(CHROME_PATH, HEADLESS, WINDOW_SIZE)
-        all_data = []
-        try:
-            for klasse, url in BATTING_URLS.items():
-                driver.get(url)
-                time.sleep(6)
-                rows = driver.find_elements(By.XPATH, "//*[@id='page-wrap']/div[4]/div/div[4]/div/div")
-                counter = 0
-                for row in rows[1:]:
-                    if counter >= 10:
-                        break
-                    cols = row.text.split("\n")
-                    if len(cols) > 8 and cols[2].strip() == CLUB_NAME:
-                        all_data.append({
-                            "KNCB Ranking": cols[0].strip(),
-                            "Klasse": klasse,
-                            "Player": cols[1].strip(),
-                            "matches": cols[3].strip(),
-                            "innings": cols[4].strip(),
-                            "not_outs": cols[5].strip(),
-                            "Runs": cols[6].strip(),
-                            "highest": cols[7].strip(),
-                            "average": cols[8].strip(),
-                            "strike_rate": cols[9].strip(),
-                            "Season": SEASON,
-                        })
-                        counter += 1
-        finally:
-            driver.quit()
-        return pd.DataFrame(all_data)
+        self.scores = ScoreMemo()
+
+    def _parse_klasse(self, klasse: str, rows: list[list[str]], full: bool = False) -> list[dict]:
+        """Club rows (first 10) of a klasse page; with `full`, every complete row plus its Team."""
+        data = []
+        for cols in rows[1:]:
+            if not full and len(data) >= 10:
+                break
+            if full and len(cols) >= 10:
+                data.append({**self._row(klasse, cols), "Team": cols[2].strip()})
+            elif not full and len(cols) > 8 and cols[2].strip() == CLUB_NAME:
+                data.append(self._row(klasse, cols))
+        return data
+
+    def _row(self, klasse: str, cols: list[str]) -> dict:
+        return {
+            "KNCB Ranking": cols[0].strip(),
+            "Klasse": klasse,
+            "Player": cols[1].strip(),
+            "matches": cols[3].strip(),
+            "innings": cols[4].strip(),
+            "not_outs": cols[5].strip(),
+            "Runs": cols[6].strip(),
+            "highest": cols[7].strip(),
+            "average": cols[8].strip(),
+            "strike_rate": cols[9].strip(),
+            "Season": SEASON,
+        }
+
+    def iter_rows(self, fetcher: Fetcher, full: bool = FULL_LEAGUE, throughput: list[dict] | None = None) -> Iterator[dict]:
+        """Rows as each klasse page is parsed; `full` walks every page of every klasse (see league.py)."""
+        if not full:
+            pages = fetcher.fetch_all(list(BATTING_URLS.values()), kind=ROWS)
+            for klasse, page in zip(BATTING_URLS, pages):
+                yield from self._parse_klasse(klasse, page.stat_rows())
+            return
+        for klasse, page in iter_league_pages(fetcher, BATTING_URLS, throughput=throughput):
+            yield from self._parse_klasse(klasse, page.stat_rows(), full=True)
+
+    def scrape(self, pool: DriverPool | None = None, fetcher: Fetcher | None = None, full: bool = FULL_LEAGUE) -> pd.DataFrame:
+        with make_fetcher(pool) if fetcher is None else nullcontext(fetcher) as f:
+            return pd.DataFrame(list(self.iter_rows(f, full=full)))
 
     # Merge across klassen and recompute once per player
     def combine_and_score(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Memoized on the frame's content: the same rows are scored once per scraper."""
+        with timer("score.batting"):
+            return self.scores(df, self._combine_and_score)
+
+    def _combine_and_score(self, df: pd.DataFrame) -> pd.DataFrame:
         if df.empty:
             return df.copy()
 
@@ -67,89 +130,83 @@ class BattingScraper:
         d["balls_est"] = np.where(valid_sr, d["Runs"] * 100.0 / d["strike_rate"], np.nan)
         d["klasse_w"] = d["Klasse"].map(KLASSE_WEIGHTS).fillna(1.0)
 
-        rows = []
-        for player, g in d.groupby("Player", dropna=False):
-            runs_total = int(g["Runs"].sum())
-            innings_total = int(g["innings"].sum())
-            notouts_total = int(g["not_outs"].sum())
-            matches_total = int(g["matches"].sum())
-            highest_total = int(g["highest_num"].max()) if len(g) else 0
-
-            balls_total = g["balls_est"].sum(skipna=True)
-            if pd.isna(balls_total) or balls_total <= 0:
-                sr_total = float((g["strike_rate"] * g["Runs"]).sum() / max(1, g["Runs"].sum())) if g["Runs"].sum() > 0 else 0.0
-            else:
-                sr_total = float(100.0 * runs_total / balls_total)
-
-            outs = max(1, innings_total - notouts_total)
-            avg_total = float(runs_total / outs) if runs_total > 0 else 0.0
-            w_combined = float((g["matches"] * g["klasse_w"]).sum() / matches_total) if matches_total > 0 else 1.0
-
-            dom_klasse = ""
-            if matches_total > 0:
-                km = g.groupby("Klasse")["matches"].sum().sort_values(ascending=False)
-                dom_klasse = km.index[0] if len(km) else ""
-
-            runs_c = 300.0 * np.tanh(runs_total / 600.0)
-            avg_c  = 350.0 * np.tanh(avg_total / 75.0)
-            sr_c   = 200.0 * np.tanh(sr_total / 130.0)
-            no_rate = (notouts_total / max(1, innings_total)) if innings_total > 0 else 0.0
-            cons_c = 100.0 * np.tanh(no_rate / 0.4)
-            milestone = 60.0 if highest_total >= 100 else (25.0 if highest_total >= 50 else 0.0)
-
-            raw = runs_c + avg_c + sr_c + cons_c + milestone
-            sf  = np.tanh(matches_total / 6.0)
-            points = int(round(raw * sf * w_combined))
-
-            rows.append({
-                "Player": player,
-                "Runs": runs_total,
-                "innings": innings_total,
-                "not_outs": notouts_total,
-                "matches": matches_total,
-                "highest": highest_total,
-                "average": round(avg_total, 2),
-                "strike_rate": round(sr_total, 2),
-                "Klasse Mix": dom_klasse,
-                "Klasse Weight": round(w_combined, 3),
-                "Points": points,
-                "Season": SEASON,
-            })
-        return pd.DataFrame(rows)
-
-    def generate_html(self, df: pd.DataFrame) -> str:
-        d = self.combine_and_score(df).sort_values("Points", ascending=False).reset_index(drop=True).copy()
+        # One aggregation pass over all players (groups sorted by Player, NaN last)
+        grouped = d.groupby("Player", dropna=False)
+        agg = grouped.agg(
+            Runs=("Runs", "sum"),
+            innings=("innings", "sum"),
+            not_outs=("not_outs", "sum"),
+            matches=("matches", "sum"),
+            highest=("highest_num", "max"),
+        )
+        codes, n = grouped.ngroup().to_numpy(), len(agg)
+        balls = _group_sums(d["balls_est"].fillna(0.0).to_numpy(dtype=float), codes, n)
+        sr_runs = _group_sums((d["strike_rate"] * d["Runs"]).to_numpy(dtype=float), codes, n)
+        w_matches = _group_sums((d["matches"] * d["klasse_w"]).to_numpy(dtype=float), codes, n)
+
+        runs = agg["Runs"].to_numpy(dtype=np.int64)
+        innings = agg["innings"].to_numpy(dtype=np.int64)
+        not_outs = agg["not_outs"].to_numpy(dtype=np.int64)
+        matches = agg["matches"].to_numpy(dtype=np.int64)
+        highest = agg["highest"].to_numpy(dtype=np.int64)
+
+        # SR from estimated balls faced; run-weighted SR when no balls could be estimated
+        sr_weighted = np.where(runs > 0, sr_runs / np.maximum(1, runs), 0.0)
+        sr = np.where(balls > 0, 100.0 * runs / np.where(balls > 0, balls, 1.0), sr_weighted)
+        avg = np.where(runs > 0, runs / np.maximum(1, innings - not_outs), 0.0)
+        w = np.where(matches > 0, w_matches / np.where(matches > 0, matches, 1), 1.0)
+
+        # Dominant klasse: most matches; ties go to the alphabetically first klasse (stable sort)
+        km = (d.dropna(subset=["Klasse"]).groupby(["Player", "Klasse"], dropna=False)["matches"].sum()
+              .reset_index().sort_values(["Player", "matches", "Klasse"], ascending=[True, False, True], kind="mergesort")
+              .drop_duplicates("Player").set_index("Player")["Klasse"])
+        dom = agg.index.to_series().map(km).where(matches > 0, "").fillna("").to_numpy(dtype=object)
+
+        runs_c = 300.0 * np.tanh(runs / 600.0)
+        avg_c = 350.0 * np.tanh(avg / 75.0)
+        sr_c = 200.0 * np.tanh(sr / 130.0)
+        no_rate = np.where(innings > 0, not_outs / np.maximum(1, innings), 0.0)
+        cons_c = 100.0 * np.tanh(no_rate / 0.4)
+        milestone = np.select([highest >= 100, highest >= 50], [60.0, 25.0], 0.0)
+
+        raw = runs_c + avg_c + sr_c + cons_c + milestone
+        sf = np.tanh(matches / 6.0)
+        points = np.round(raw * sf * w).astype(np.int64)
+
+        return pd.DataFrame({
+            "Player": list(agg.index),
+            "Runs": runs,
+            "innings": innings,
+            "not_outs": not_outs,
+            "matches": matches,
+            "highest": highest,
+            # Python round() so 2/3-decimal output matches the previous per-player scoring exactly
+            "average": [round(x, 2) for x in avg.tolist()],
+            "strike_rate": [round(x, 2) for x in sr.tolist()],
+            "Klasse Mix": dom,
+            "Klasse Weight": [round(x, 3) for x in w.tolist()],
+            "Points": points,
+            "Season": SEASON,
+        })
+
+    def generate_html(self, df: pd.DataFrame, page_rows: int = 0) -> str:
+        return self.render_html(self.combine_and_score(df), page_rows)
+
+    def render_html(self, scored: pd.DataFrame, page_rows: int = 0) -> str:
+        """HTML page for rows already merged and scored by `combine_and_score`."""
+        return "".join(self.iter_html(scored, page_rows))
+
+    def table(self, scored: pd.DataFrame) -> pd.DataFrame:
+        """Leaderboard rows as shown: by Points, with Club Ranking + Badge."""
+        d = scored.sort_values("Points", ascending=False).reset_index(drop=True).copy()
         d.insert(0, "Club Ranking", (d.index + 1).astype(int))
         d.insert(1, "Badge", d["Club Ranking"].map({1:"🥇",2:"🥈",3:"🥉"}).fillna(""))
+        return d
 
-        html_table = d.to_html(index=False, escape=False)
-        for col in ["Club Ranking", "Points", "Runs", "matches", "average", "strike_rate"]:
-            html_table = html_table.replace(f"<th>{col}</th>", f'<th data-sort-method="number">{col}</th>')
+    def iter_html(self, scored: pd.DataFrame, page_rows: int = 0) -> Iterator[str]:
+        """`render_html` as a stream of chunks (see render.write_if_changed)."""
+        return self.PAGE.stream(table_body(self.table(scored), self.SORTABLE, self.HTML_PATH, page_rows))
 
-        return f"""<!DOCTYPE html>
-                    <html>
-                    <head>
-                      <meta charset="utf-8" />
-                      <title>KNCB Batting Stats {SEASON}</title>
-                      <style>
-                        table {{ border-collapse: collapse; width: 100%; }}
-                        th, td {{ border: 1px solid #ddd; padding: 8px; }}
-                        th {{ background-color: #f2f2f2; cursor: pointer; }}
-                        tr:nth-child(even) {{ background-color:#fafafa; }}
-                        body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, Arial, sans-serif; margin: 24px; }}
-                      </style>
-                      <script src="https://unpkg.com/tablesort@5.2.1/dist/tablesort.min.js"></script>
-                    </head>
-                    <body>
-                      <h2>KNCB Batting Stats {SEASON} — {CLUB_NAME}</h2>
-                      {html_table}
-                      <script>new Tablesort(document.querySelector("table"));</script>
-                      <br>
-                      <div style="font-size:0.95em;color:#555;">
-                        <b>Scoring & merging:</b><br>
-                        Player appears once: stats merged across klassen (runs/inn/not-outs/matches summed; SR/AVG recomputed; highest=max).
-                        Klasse difficulty = match-weighted average; ICC-style multi-factor (tanh) score with sample-size.
-                      </div>
-                    </body>
-                    </html>
-                """
\ No newline at end of file
+    def write_html(self, scored: pd.DataFrame, page_rows: int = PAGE_ROWS) -> bool:
+        """Write HTML_PATH (paged past `page_rows` rows); True if any file changed."""
+        return publish_table(self.HTML_PATH, self.PAGE, self.table(scored), self.SORTABLE, page_rows)
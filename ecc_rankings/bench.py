@@ -0,0 +1,280 @@
+"""Benchmarks over synthetic league-scale data, with saved baselines.
+
+    python -m ecc_rankings.bench                       # 10^2 and 10^4 rows, compare with the baseline
+    python -m ecc_rankings.bench --sizes 100,10000,1000000 --save
+
+Each case is timed best-of-`repeat` on generated rows shaped like the scraped ones (string cells,
+players spread over klassen, scorecards with extras/total rows), plus the checked-in published
+pages under docs/ with their rows cycled to each size, so parsing real markup is measured too. `--save` records the timings as
+the baseline (per machine: keep it next to where deploys run); without it, any case slower than
+its baseline by more than `--tolerance` fails the run with exit status 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from .all_rounder import AllRounderLeaderboard
+from .batting import BattingScraper
+from .bowling import BowlingScraper
+from .config import BENCH_BASELINE, CLUB_NAME, EINDHOVEN_NAME_MAP, KLASSE_WEIGHTS, SEASON
+from .fantasy_points import (
+    FantasyRules,
+    _batting_from_tables,
+    _bowling_from_tables,
+    _merge_numeric,
+    _name_aliases,
+    _points_batch,
+    _points_from_row,
+)
+from .fetch import Page
+
+SIZES = (100, 10_000)
+NOISE_FLOOR = 0.005  # seconds; faster cases are never flagged
+
+
+# --- synthetic data ---
+def _players(rng: np.random.Generator, n: int) -> np.ndarray:
+    # About three rows per player, as players turn out in more than one klasse
+    return np.array([f"Player {i}" for i in range(max(1, n // 3))], dtype=object)[rng.integers(0, max(1, n // 3), n)]
+
+
+def batting_rows(n: int, seed: int = 0) -> pd.DataFrame:
+    """Raw batting rows as `BattingScraper.scrape` returns them (every cell a string)."""
+    rng = np.random.default_rng(seed)
+    innings = rng.integers(1, 15, n)
+    not_outs = np.minimum(rng.integers(0, 4, n), innings)
+    runs = rng.integers(0, 700, n)
+    return pd.DataFrame({
+        "KNCB Ranking": np.arange(1, n + 1).astype(str),
+        "Klasse": rng.choice(list(KLASSE_WEIGHTS), n),
+        "Player": _players(rng, n),
+        "matches": (innings + rng.integers(0, 3, n)).astype(str),
+        "innings": innings.astype(str),
+        "not_outs": not_outs.astype(str),
+        "Runs": runs.astype(str),
+        "highest": [f"{h}{'*' if s else ''}" for h, s in zip(rng.integers(0, 130, n), rng.random(n) < 0.2)],
+        "average": np.round(runs / np.maximum(1, innings - not_outs), 2).astype(str),
+        "strike_rate": np.round(rng.uniform(40, 180, n), 2).astype(str),
+        "Season": SEASON,
+    })
+
+
+def bowling_rows(n: int, seed: int = 1) -> pd.DataFrame:
+    """Raw bowling rows as `BowlingScraper.scrape` returns them."""
+    rng = np.random.default_rng(seed)
+    wickets = rng.integers(0, 35, n)
+    return pd.DataFrame({
+        "KNCB Ranking": np.arange(1, n + 1).astype(str),
+        "Klasse": rng.choice(list(KLASSE_WEIGHTS), n),
+        "Player": _players(rng, n),
+        "Matches": rng.integers(1, 15, n).astype(str),
+        "Wickets": wickets.astype(str),
+        "Best": [f"{w}/{r}" for w, r in zip(rng.integers(0, 8, n), rng.integers(5, 60, n))],
+        "Avg": np.round(rng.uniform(8, 60, n), 2).astype(str),
+        "Eco": np.round(rng.uniform(2.5, 9, n), 2).astype(str),
+        "Strike Rate": np.round(rng.uniform(10, 60, n), 1).astype(str),
+        "Season": SEASON,
+    })
+
+
+def scorecard_html(n: int, seed: int = 2) -> tuple[str, str]:
+    """(batting, bowling) scorecard HTML holding `n` player rows in innings of 11, with extras/total rows."""
+    rng = np.random.default_rng(seed)
+    names = list(EINDHOVEN_NAME_MAP) + [f"X Opponent{i}" for i in range(50)]
+    bat, bowl = [], []
+    for start in range(0, n, 11):
+        k = min(11, n - start)
+        who = rng.choice(names, k)
+        bat.append("<table><tr><th>Batter</th><th>R</th><th>B</th><th>4s</th><th>6s</th></tr>"
+                   + "".join(f"<tr><td>{p}</td><td>{r}</td><td>{r + b}</td><td>{f}</td><td>{s}</td></tr>"
+                             for p, r, b, f, s in zip(who, rng.integers(0, 120, k), rng.integers(0, 40, k),
+                                                      rng.integers(0, 12, k), rng.integers(0, 6, k)))
+                   + "<tr><td>Extras</td><td>12</td><td></td><td></td><td></td></tr>"
+                   + "<tr><td>Total</td><td>180</td><td></td><td></td><td></td></tr></table>")
+        bowl.append("<table><tr><th>Bowler</th><th>O</th><th>M</th><th>R</th><th>W</th><th>Econ</th></tr>"
+                    + "".join(f"<tr><td>{p}</td><td>{o}</td><td>{m}</td><td>{r}</td><td>{w}</td><td>{r / o:.2f}</td></tr>"
+                              for p, o, m, r, w in zip(who, rng.integers(1, 11, k), rng.integers(0, 3, k),
+                                                       rng.integers(5, 70, k), rng.integers(0, 6, k)))
+                    + "</table>")
+    return f"<html><body>{''.join(bat)}</body></html>", f"<html><body>{''.join(bowl)}</body></html>"
+
+
+def fantasy_parts(n: int, seed: int = 3, per_part: int = 11) -> list[pd.DataFrame]:
+    """Per-scorecard player frames (as `_batting_from_tables` gives) totalling `n` rows."""
+    rng = np.random.default_rng(seed)
+    names = np.array(sorted(set(EINDHOVEN_NAME_MAP.values())), dtype=object)
+    parts = []
+    for start in range(0, n, per_part):
+        k = min(per_part, n - start)
+        runs = rng.integers(0, 120, k)
+        parts.append(pd.DataFrame({"player_name": rng.choice(names, k), "runs": runs, "Four": rng.integers(0, 12, k),
+                                   "Sixes": rng.integers(0, 6, k), "Balls": runs + rng.integers(0, 40, k),
+                                   "50 runs": (runs >= 50).astype(np.int64), "100 runs": (runs >= 100).astype(np.int64)}))
+    return parts
+
+
+def _points_rows(n: int, seed: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"runs": rng.integers(0, 150, n), "Four": rng.integers(0, 15, n), "Sixes": rng.integers(0, 8, n),
+                         "Overs": rng.integers(0, 11, n).astype(float), "Maiden": rng.integers(0, 3, n),
+                         "Economy": np.round(rng.uniform(2, 13, n), 2), "wickets": rng.integers(0, 7, n)})
+
+
+# --- cases ---
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[int], tuple]   # n -> arguments (untimed)
+    run: Callable[..., Any]
+
+
+def _scored(n: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return (BattingScraper("")._combine_and_score(batting_rows(n)),
+            BowlingScraper("")._calculate_icc_points(bowling_rows(n)))
+
+
+DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "docs")
+REAL_PAGES = tuple(f"kncb_{kind}_stats_{SEASON}.html" for kind in ("batting", "bowling", "allrounder"))
+
+
+def real_page(name: str, n: int) -> str:
+    """A published page from docs/ with its table body rows cycled to `n` rows."""
+    with open(os.path.join(DOCS_DIR, name), encoding="utf-8") as f:
+        head, _, rest = f.read().partition("<tbody>")
+    body, _, tail = rest.partition("</tbody>")
+    rows = re.findall(r"<tr.*?</tr>", body, re.S)
+    return head + "<tbody>" + "".join(rows[i % len(rows)] for i in range(n)) + "</tbody>" + tail
+
+
+def _generate(board, df: pd.DataFrame) -> str:
+    return board.generate_html(df)
+
+
+def _cases(out_dir: str) -> list[Case]:
+    # Scoring calls bypass the ScoreMemo so every repeat does the work; the html cases warm it in
+    # setup, so generate_html times the (memo hit and) render, not the scoring
+    def bat_html(n):
+        board, rows = BattingScraper(os.path.join(out_dir, "batting.html")), batting_rows(n)
+        board.combine_and_score(rows)
+        return board, rows
+
+    def bowl_html(n):
+        board, rows = BowlingScraper(os.path.join(out_dir, "bowling.html")), bowling_rows(n)
+        board.calculate_icc_points(rows)
+        return board, rows
+
+    def allr_html(n):
+        board = AllRounderLeaderboard(SEASON, CLUB_NAME, os.path.join(out_dir, "allrounder.html"))
+        return board, board.compute(*_scored(n))
+
+    real = [] if not all(os.path.isfile(os.path.join(DOCS_DIR, p)) for p in REAL_PAGES) else [
+        Case("real.parse_leaderboards", lambda n: ([real_page(p, n) for p in REAL_PAGES],),
+             lambda pages: [Page("bench", html, "http").tables() for html in pages]),
+    ]
+    return [
+        Case("batting.combine_and_score", lambda n: (batting_rows(n),), BattingScraper("")._combine_and_score),
+        Case("bowling.calculate_icc_points", lambda n: (bowling_rows(n),), BowlingScraper("")._calculate_icc_points),
+        Case("allrounder.compute", _scored, AllRounderLeaderboard(SEASON, CLUB_NAME, "").compute),
+        Case("fantasy.parse_batting", lambda n: (scorecard_html(n)[0], _name_aliases()),
+             lambda html, aliases: _batting_from_tables(Page("bench", html, "http").tables(), aliases)),
+        Case("fantasy.parse_bowling", lambda n: (scorecard_html(n)[1], _name_aliases()),
+             lambda html, aliases: _bowling_from_tables(Page("bench", html, "http").tables(), aliases)),
+        Case("fantasy.merge_numeric", lambda n: (fantasy_parts(n),), _merge_numeric),
+        Case("fantasy.points_from_row", lambda n: (_points_rows(n).to_dict("records"), FantasyRules()),
+             lambda rows, rules: [_points_from_row(r, rules) for r in rows]),
+        Case("fantasy.points_batch", lambda n: (_points_rows(n),), _points_batch),
+        Case("html.batting", bat_html, _generate),
+        Case("html.bowling", bowl_html, _generate),
+        Case("html.allrounder", allr_html, _generate),
+    ] + real
+
+
+def run_benchmarks(sizes=SIZES, repeat: int = 3, only: str = "") -> dict[str, dict[str, float]]:
+    """{case: {rows: best seconds}}; `only` keeps cases whose name contains it."""
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as out_dir:
+        for case in _cases(out_dir):
+            if only and only not in case.name:
+                continue
+            for n in sizes:
+                args = case.setup(n)
+                best = float("inf")
+                for _ in range(max(1, repeat)):
+                    start = time.perf_counter()
+                    case.run(*args)
+                    best = min(best, time.perf_counter() - start)
+                results.setdefault(case.name, {})[str(n)] = best
+                print(f"[ecc] {case.name:<30} {n:>9,} rows  {best * 1000:10.1f} ms")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> list[str]:
+    """Cases more than `tolerance` slower than the baseline (ignoring anything under NOISE_FLOOR)."""
+    slower = []
+    for name, by_n in results.items():
+        for n, secs in by_n.items():
+            base = baseline.get(name, {}).get(n)
+            if base is not None and secs > NOISE_FLOOR and secs > base * (1 + tolerance):
+                slower.append(f"{name} @ {n} rows: {secs * 1000:.1f} ms vs baseline {base * 1000:.1f} ms")
+    return slower
+
+
+def load_baseline(path: str = BENCH_BASELINE) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(results: dict, path: str = BENCH_BASELINE) -> None:
+    merged = {**load_baseline(path)}
+    for name, by_n in results.items():
+        merged[name] = {**merged.get(name, {}), **by_n}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = {"python": platform.python_version(), "pandas": pd.__version__, "numpy": np.__version__,
+            "machine": platform.machine(), "saved": time.strftime("%Y-%m-%d %H:%M:%S"), "results": merged}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m ecc_rankings.bench")
+    ap.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma-separated row counts")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--only", default="", help="run cases whose name contains this")
+    ap.add_argument("--baseline", default=BENCH_BASELINE)
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    ap.add_argument("--save", action="store_true", help="record these timings as the baseline")
+    args = ap.parse_args(argv)
+
+    results = run_benchmarks([int(s) for s in args.sizes.split(",") if s], args.repeat, args.only)
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"[ecc] Baseline saved: {args.baseline}")
+        return 0
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"[ecc] No baseline at {args.baseline}; run with --save to record one")
+        return 0
+    slower = compare(results, baseline, args.tolerance)
+    for line in slower:
+        print(f"[ecc] SLOWER {line}")
+    print(f"[ecc] {len(slower)} regression(s) beyond {args.tolerance:.0%}")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
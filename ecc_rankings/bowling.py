@@ -1,10 +1,14 @@
-import time
+from contextlib import nullcontext
+from typing import Iterator
 import numpy as np
 import pandas as pd
-from selenium.webdriver.common.by import By
-from .config import BOWLING_URLS, KLASSE_WEIGHTS, SEASON, CLUB_NAME
-from .driver import get_driver
-from .config import CHROME_PATH, HEADLESS, WINDOW_SIZE
+from .config import BOWLING_URLS, FULL_LEAGUE, KLASSE_WEIGHTS, PAGE_ROWS, SEASON, CLUB_NAME
+from .fetch import ROWS, Fetcher, make_fetcher
+from .league import iter_league_pages
+from .memo import ScoreMemo
+from .metrics import timer
+from .render import TABLE_SLOT, PageTemplate, publish_table, table_body
+from .pool import DriverPool
 
 class BowlingScraper:
     URLS = {
@@ -13,49 +17,99 @@ class BowlingScraper:
         "Vierde_Klasse": "https://matchcentre.kncb.nl/statistics/bowling?entity=134453&grade=73942&season=19",
     }
     HTML_PATH:str
+    SORTABLE = ("Club Ranking", "Points", "Wickets", "matches", "Eco", "strike_rate")
+    PAGE = PageTemplate(f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>KNCB Bowling Stats 2025</title>
+            <style>
+                table {{ border-collapse: collapse; width: 100%; }}
+                th, td {{ border: 1px solid #ddd; padding: 8px; }}
+                th {{ background-color: #f2f2f2; cursor: pointer; }}
+            </style>
+            <script src="https://unpkg.com/tablesort@5.2.1/dist/tablesort.min.js"></script>
+        </head>
+        <body>
+            <h2>KNCB Batting Stats {SEASON} — {CLUB_NAME}</h2>
+            {TABLE_SLOT}
+            <script>
+                new Tablesort(document.querySelector("table"));
+            </script>
+            <br>
+            <div style="font-size: 0.95em; color: #555;">
+                  <b>Points Calculation (ECC model):</b><br>
+                  Multi-factor with diminishing returns: wickets, bowling average (lower better), economy (lower better),
+                  strike rate (lower better), best-innings wickets. Adjusted by sample size and klasse weights
+                  (Eerste 1.15, Tweede 1.07, Vierde 1.00).
+        </div>
+        </body>
+        </html>
+        """)
 
     def __init__(self, html_path: str):
         self.HTML_PATH = html_path
-
-    def scrape(self):
+        self.scores = ScoreMemo()
+
+    def _parse_klasse(self, klasse: str, rows: list[list[str]], full: bool = False) -> list[dict]:
+        """Club rows (first 10) of a klasse page; with `full`, every complete row plus its Team."""
+        data = []
+        for cols in rows[1:]:
+            if not full and len(data) >= 10:
+                break
+            if full and len(cols) >= 11:
+                data.append({**self._row(klasse, cols), "Team": cols[2].strip()})
+            elif not full and len(cols) > 8 and cols[2].strip() == CLUB_NAME:
+                data.append(self._row(klasse, cols))
+        return data
+
+    def _row(self, klasse: str, cols: list[str]) -> dict:
+        return {
+            "KNCB Ranking": cols[0].strip(),
+            "Klasse": klasse,
+            "Player": cols[1].strip(),
+            "Matches": cols[3].strip(),
+            "Wickets": cols[6].strip(),
+            "Best": cols[7].strip(),
+            "Avg": cols[8].strip(),
+            "Eco": cols[9].strip(),
+            "Strike Rate": cols[10].strip(),
+            "Season": SEASON,
+        }
+
+    def iter_rows(self, fetcher: Fetcher, full: bool = FULL_LEAGUE, throughput: list[dict] | None = None) -> Iterator[dict]:
+        """Rows as each klasse page is parsed; `full` walks every page of every klasse (see league.py)."""
+        if not full:
+            pages = fetcher.fetch_all(list(BOWLING_URLS.values()), kind=ROWS)
+            for klasse, page in zip(BOWLING_URLS, pages):
+                yield from self._parse_klasse(klasse, page.stat_rows())
+            return
+        for klasse, page in iter_league_pages(fetcher, BOWLING_URLS, throughput=throughput):
+            yield from self._parse_klasse(klasse, page.stat_rows(), full=True)
+
+    def scrape(self, pool: DriverPool | None = None, fetcher: Fetcher | None = None, full: bool = FULL_LEAGUE):
         """Scrapes bowling statistics for Eindhoven CC from KNCB website.
 
+        Klasse pages go through `fetcher` (plain HTTP first, then Chrome from `pool` per URL
+        that needs rendering); row order follows BOWLING_URLS. With `full`, every club's rows
+        from every page, with a Team column (filter with `league.club_rows`).
+
         Returns:
             pd.DataFrame: DataFrame containing scraped bowling statistics.
         """
-        driver = get_driver(CHROME_PATH, HEADLESS, WINDOW_SIZE)
-        all_data = []
-        for klasse, url in BOWLING_URLS.items():
-            driver.get(url)
-            time.sleep(6)
-            rows = driver.find_elements(By.XPATH, "//*[@id='page-wrap']/div[4]/div/div[4]/div/div")
-            counter = 0
-            for row in rows[1:]:
-                if counter >= 10:
-                    break
-                cols = row.text.split("\n")
-                if len(cols) > 8 and cols[2].strip() == CLUB_NAME:
-                    all_data.append({
-                        "KNCB Ranking": cols[0].strip(),
-                        "Klasse": klasse,
-                        "Player": cols[1].strip(),
-                        "Matches": cols[3].strip(),
-                        "Wickets": cols[6].strip(),
-                        "Best": cols[7].strip(),
-                        "Avg": cols[8].strip(),
-                        "Eco": cols[9].strip(),
-                        "Strike Rate": cols[10].strip(),
-                        "Season": SEASON,
-                    })
-                    counter += 1
-        driver.quit()
-        return pd.DataFrame(all_data)
+        with make_fetcher(pool) if fetcher is None else nullcontext(fetcher) as f:
+            return pd.DataFrame(list(self.iter_rows(f, full=full)))
 
     def calculate_icc_points(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         ICC-like bowling score on ~0–1000 scale with klasse difficulty.
         Robust to missing/odd 'matches' so Points never silently zero out.
+        Memoized on the frame's content: the same rows are scored once per scraper.
         """
+        with timer("score.bowling"):
+            return self.scores(df, self._calculate_icc_points)
+
+    def _calculate_icc_points(self, df: pd.DataFrame) -> pd.DataFrame:
         def _pick_numeric_series(df: pd.DataFrame, candidates: list[str], default: int | float = 0,
                                  as_int: bool = True) -> pd.Series:
             """
@@ -128,45 +182,27 @@ class BowlingScraper:
         d["Points"] = d["Points"].round(0).astype(int)
         return d
 
-    def generate_html(self, df):
+    def generate_html(self, df, page_rows: int = 0):
         """Generates an HTML table from the bowling statistics DataFrame (with 🥇🥈🥉 badges)."""
-        df = self.calculate_icc_points(df)
+        return self.render_html(self.calculate_icc_points(df), page_rows)
+
+    def render_html(self, df: pd.DataFrame, page_rows: int = 0) -> str:
+        """HTML page for rows already scored by `calculate_icc_points`."""
+        return "".join(self.iter_html(df, page_rows))
 
+    def table(self, df: pd.DataFrame) -> pd.DataFrame:
         # Sort by Points and add Club Ranking + Badge
         df_sorted = df.sort_values("Points", ascending=False).reset_index(drop=True).copy()
         df_sorted.insert(0, "Club Ranking", (df_sorted.index + 1).astype(int))
         badge_map = {1: "🥇", 2: "🥈", 3: "🥉"}
         df_sorted.insert(1, "Badge", df_sorted["Club Ranking"].map(badge_map).fillna(""))
+        return df_sorted
+
+    def iter_html(self, df: pd.DataFrame, page_rows: int = 0) -> Iterator[str]:
+        """`render_html` as a stream of chunks (see render.write_if_changed)."""
+        return self.PAGE.stream(table_body(self.table(df), self.SORTABLE, self.HTML_PATH, page_rows))
+
+    def write_html(self, df: pd.DataFrame, page_rows: int = PAGE_ROWS) -> bool:
+        """Write HTML_PATH (paged past `page_rows` rows); True if any file changed."""
+        return publish_table(self.HTML_PATH, self.PAGE, self.table(df), self.SORTABLE, page_rows)
 
-        # Build HTML (escape=False so emoji render)
-        html_table = df_sorted.to_html(index=False, escape=False)
-        for col in ["Club Ranking", "Points", "Wickets", "matches", "Eco", "strike_rate"]:
-            html_table = html_table.replace(f"<th>{col}</th>", f'<th data-sort-method="number">{col}</th>')
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>KNCB Bowling Stats 2025</title>
-            <style>
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; }}
-                th {{ background-color: #f2f2f2; cursor: pointer; }}
-            </style>
-            <script src="https://unpkg.com/tablesort@5.2.1/dist/tablesort.min.js"></script>
-        </head>
-        <body>
-            <h2>KNCB Batting Stats {SEASON} — {CLUB_NAME}</h2>
-            {html_table}
-            <script>
-                new Tablesort(document.querySelector("table"));
-            </script>
-            <br>
-            <div style="font-size: 0.95em; color: #555;">
-                  <b>Points Calculation (ECC model):</b><br>
-                  Multi-factor with diminishing returns: wickets, bowling average (lower better), economy (lower better),
-                  strike rate (lower better), best-innings wickets. Adjusted by sample size and klasse weights
-                  (Eerste 1.15, Tweede 1.07, Vierde 1.00).
-        </div>
-        </body>
-        </html>
-        """
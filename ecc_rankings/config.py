@@ -6,6 +6,8 @@ SEASON = "2025"
 
 # Output directory for GitHub Pages
 OUTPUT_DIR = os.environ.get("ECC_OUTPUT_DIR", "docs")
+# Leaderboards longer than this are paged: first page in the HTML, all rows in an NDJSON file next to it; 0 = one table
+PAGE_ROWS = int(os.environ.get("ECC_PAGE_ROWS", "500"))
 
 # Klasse difficulty multipliers
 KLASSE_WEIGHTS = {
@@ -31,6 +33,60 @@ BATTING_URLS = {
 CHROME_PATH = os.environ.get("CHROME_PATH", "")  # leave empty to auto-manage
 HEADLESS = os.environ.get("HEADLESS", "1") != "0"
 WINDOW_SIZE = os.environ.get("WINDOW_SIZE", "1920,1080")
+# Resolved chromedriver path, reused while the binary's mtime/size are unchanged
+DRIVER_CACHE_PATH = os.environ.get(
+    "ECC_DRIVER_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "ecc_rankings", "chromedriver.json")
+)
+
+# Page readiness: poll for the rendered rows/tables instead of sleeping a fixed time
+STATS_ROWS_XPATH = "//*[@id='page-wrap']/div[4]/div/div[4]/div/div"
+PAGE_READY_TIMEOUT = float(os.environ.get("PAGE_READY_TIMEOUT", "20"))  # seconds
+PAGE_READY_POLL = float(os.environ.get("PAGE_READY_POLL", "0.25"))      # seconds
+
+# Fetch backend: "auto" tries plain HTTP first and falls back to Chrome per URL,
+# "http" never starts a browser, "browser" always renders, "replay" serves recorded snapshots only
+FETCH_MODE = os.environ.get("ECC_FETCH_MODE", "auto")
+RECORD_SNAPSHOTS = os.environ.get("ECC_RECORD", "0") == "1"   # save every fetched page to SNAPSHOT_DIR
+SNAPSHOT_DIR = os.environ.get("ECC_SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "snapshots"))
+HTTP_POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", "8"))   # keep-alive connections / concurrent requests
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "15"))    # seconds
+
+# Raw page cache (HTML + parsed rows/tables), e.g. ECC_PAGE_CACHE=~/.cache/ecc_rankings/pages; "" = off
+PAGE_CACHE_DIR = os.path.expanduser(os.environ.get("ECC_PAGE_CACHE", ""))
+PAGE_CACHE_TTL = float(os.environ.get("PAGE_CACHE_TTL", str(6 * 3600)))    # seconds; final pages never expire
+PAGE_CACHE_MAX_MB = float(os.environ.get("PAGE_CACHE_MAX_MB", "256"))      # LRU-evicted above this
+
+# Partitioned Parquet store of scraped/scored rows (season/klasse/match); set ECC_STORE_DIR="" to disable
+STORE_DIR = os.environ.get("ECC_STORE_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "store"))
+
+# Full-league mode: every row of every klasse page (all clubs, all pages); club filtering happens downstream
+FULL_LEAGUE = os.environ.get("ECC_FULL_LEAGUE", "0") == "1"
+LEAGUE_MAX_PAGES = int(os.environ.get("LEAGUE_MAX_PAGES", "50"))            # per klasse, when paginated
+LAZY_LOAD_TIMEOUT = float(os.environ.get("LAZY_LOAD_TIMEOUT", "3"))         # seconds to wait for more rows after a scroll
+
+# Scorecard discovery (opt-in): the club's fixture/results pages for SEASON, followed through pagination,
+# e.g. https://matchcentre.kncb.nl/matches/?entity=134453&team=136540&season=19; "" = the SCORECARD_*_URLS lists below
+FIXTURES_URL = os.environ.get("ECC_FIXTURES_URL", "")
+FIXTURES_MAX_PAGES = int(os.environ.get("FIXTURES_MAX_PAGES", "20"))
+
+# Incremental fantasy update: running per-player totals + ledger of folded scorecards; "" = full rebuild
+FANTASY_LEDGER_PATH = os.environ.get("ECC_FANTASY_LEDGER", "")
+
+# Number of Chrome workers used to fetch klasse pages / scorecards in parallel
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "3"))
+
+# Per-task timeout when `python -m ecc_rankings.orchestrate` runs batting, bowling and fantasy together
+TASK_TIMEOUT = float(os.environ.get("ECC_TASK_TIMEOUT", "900"))  # seconds
+
+# Run instrumentation (metrics.py): "<dir>/<job>.json" run reports and "<dir>/ecc_<job>.prom" files
+# for the node_exporter textfile collector; "" = off (a timing summary is still printed)
+METRICS_DIR = os.environ.get("ECC_METRICS_DIR", "")
+PROM_TEXTFILE_DIR = os.environ.get("ECC_PROM_TEXTFILE_DIR", "")
+
+# Timings recorded by `python -m ecc_rankings.bench --save`, compared against on later runs
+BENCH_BASELINE = os.environ.get(
+    "ECC_BENCH_BASELINE", os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks", "baseline.json")
+)
 
 # Scorecard URLs provided for Eindhoven fantasy extraction
 SCORECARD_BATTING_URLS = [
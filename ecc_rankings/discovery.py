@@ -0,0 +1,121 @@
+"""Scorecard discovery: walk the club's fixture/results pages and list every completed match's innings.
+
+Fixture pages link to `/match/<id>/...`; a match counts as completed when its entry carries a
+result ("won by", "no result", ...). Each completed match's scorecard page links to one
+`?period=<id>` tab per innings, labelled with the batting side, which tells the club's batting
+innings from its bowling innings.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlsplit
+
+from lxml import etree, html as lxml_html
+
+from .config import CLUB_NAME, FIXTURES_MAX_PAGES, FIXTURES_URL
+from .fetch import LINKS, Fetcher
+
+# Match id in a match-centre URL, and the result line of a finished match (fixture entry or scorecard)
+MATCH_RE = re.compile(r"/match/([\w-]+)/")
+RESULT_RE = re.compile(r"\bwon by\b|\bmatch (?:tied|drawn|abandoned)\b|\bno result\b", re.I)
+_MATCH_PREFIX_RE = re.compile(r"^(.*?/match/[\w-]+/)")
+
+
+@dataclass
+class Scorecards:
+    batting_urls: list[str] = field(default_factory=list)
+    bowling_urls: list[str] = field(default_factory=list)
+    matches: list[str] = field(default_factory=list)     # every completed match id seen on the fixture pages
+    skipped: list[str] = field(default_factory=list)     # completed matches whose innings could not be told apart
+
+
+def _anchors(html: str, base_url: str) -> list[tuple[str, etree._Element]]:
+    if not html or not html.strip():
+        return []
+    try:
+        doc = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
+    return [(urljoin(base_url, a.get("href")), a) for a in doc.iter("a") if a.get("href")]
+
+
+def _match_id(url: str) -> str | None:
+    m = MATCH_RE.search(urlsplit(url).path + "/")
+    return m.group(1) if m else None
+
+
+def match_links(html: str, base_url: str) -> dict[str, bool]:
+    """{scorecard URL: completed} for every match linked from a fixture/results page, in page order.
+
+    A match's entry is the largest element around its link that mentions no other match.
+    """
+    out: dict[str, bool] = {}
+    for url, a in _anchors(html, base_url):
+        match_id = _match_id(url)
+        if match_id is None:
+            continue
+        entry = a
+        while entry.getparent() is not None and {
+            _match_id(urljoin(base_url, h)) for h in entry.getparent().xpath(".//a/@href")
+        } - {None} == {match_id}:
+            entry = entry.getparent()
+        scorecard = _MATCH_PREFIX_RE.match(url).group(1) + "scorecard/"
+        out[scorecard] = out.get(scorecard, False) or bool(RESULT_RE.search(" ".join(entry.itertext())))
+    return out
+
+
+def next_pages(html: str, base_url: str) -> list[str]:
+    """Pagination links: same path as `base_url`, different query."""
+    base = urlsplit(base_url)
+    out = []
+    for url, _ in _anchors(html, base_url):
+        parts = urlsplit(url)
+        if (parts.netloc, parts.path) == (base.netloc, base.path) and parts.query != base.query and url not in out:
+            out.append(url.split("#")[0])
+    return out
+
+
+def innings_links(html: str, base_url: str, club: str = CLUB_NAME) -> tuple[list[str], list[str]]:
+    """(club batting period URLs, club bowling period URLs) from a scorecard page's innings tabs."""
+    token = club.split()[0].casefold()
+    batting, bowling = [], []
+    for url, a in _anchors(html, base_url):
+        if "period=" not in urlsplit(url).query or url in batting or url in bowling:
+            continue
+        (batting if token in a.text_content().casefold() else bowling).append(url)
+    return batting, bowling
+
+
+def discover_scorecards(fetcher: Fetcher, fixtures_url: str = FIXTURES_URL, seen_matches: set[str] | frozenset = frozenset(),
+                        max_pages: int = FIXTURES_MAX_PAGES) -> Scorecards:
+    """Crawl fixture pages from `fixtures_url`, then fetch every new completed match's scorecard concurrently.
+
+    Matches in `seen_matches` (e.g. `FantasyLedger.matches()`) are listed but not fetched again.
+    """
+    found = Scorecards()
+    completed: dict[str, None] = {}
+    frontier, visited = [fixtures_url], set()
+    while frontier and len(visited) < max_pages:
+        frontier = frontier[: max_pages - len(visited)]
+        visited.update(frontier)
+        pages = fetcher.fetch_all(frontier, kind=LINKS)
+        frontier = []
+        for page in pages:
+            for url, done in match_links(page.html, page.url).items():
+                if done:
+                    completed.setdefault(url)
+            frontier += [u for u in next_pages(page.html, page.url) if u not in visited and u not in frontier]
+
+    found.matches = [_match_id(url) for url in completed]
+    new = [url for url in completed if _match_id(url) not in seen_matches]
+    for page in fetcher.fetch_all(new, kind=LINKS, final=True):
+        batting, bowling = innings_links(page.html, page.url)
+        if not batting or not bowling:
+            found.skipped.append(_match_id(page.url))
+            continue
+        found.batting_urls += batting
+        found.bowling_urls += bowling
+    print(f"[ecc] Discovered {len(found.matches)} completed matches ({len(new)} new) over {len(visited)} fixture pages"
+          + (f"; innings unclear for {found.skipped}" if found.skipped else ""))
+    return found
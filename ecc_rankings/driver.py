@@ -1,7 +1,11 @@
-import os, subprocess
+import json, os, subprocess, threading
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+from .atomic import atomic_write
+from .config import DRIVER_CACHE_PATH
 
 def verify_executable(path: str) -> bool:
     try:
@@ -12,7 +16,58 @@ def verify_executable(path: str) -> bool:
     except Exception:
         return False
 
-def prepare_service(chrome_path: str | None) -> Service:
+def _fingerprint(path: str) -> dict:
+    st = os.stat(path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+def _load_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache_path: str, data: dict) -> None:
+    try:
+        atomic_write(cache_path, json.dumps(data, indent=2))
+    except OSError:
+        pass  # cache is an optimisation only
+
+def _cached_driver_path(chrome_path: str | None, cache_path: str) -> str | None:
+    """Cached driver path for `chrome_path` if the binary is unchanged (no subprocess)."""
+    data = _load_cache(cache_path)
+    entry = data.get(chrome_path or "")
+    if not entry:
+        return None
+    path = entry.get("driver_path", "")
+    try:
+        if os.path.isfile(path) and _fingerprint(path) == entry.get("fingerprint"):
+            return path
+    except OSError:
+        pass
+    # Binary changed or vanished: re-verify once, otherwise drop the entry
+    if verify_executable(path):
+        remember_driver_path(chrome_path, path, cache_path)
+        return path
+    invalidate_cached_driver(chrome_path, cache_path)
+    return None
+
+def remember_driver_path(chrome_path: str | None, driver_path: str, cache_path: str = DRIVER_CACHE_PATH) -> None:
+    data = _load_cache(cache_path)
+    data[chrome_path or ""] = {"driver_path": driver_path, "fingerprint": _fingerprint(driver_path)}
+    _save_cache(cache_path, data)
+
+def invalidate_cached_driver(chrome_path: str | None, cache_path: str = DRIVER_CACHE_PATH) -> None:
+    data = _load_cache(cache_path)
+    if data.pop(chrome_path or "", None) is not None:
+        _save_cache(cache_path, data)
+
+def resolve_driver_path(chrome_path: str | None, cache_path: str = DRIVER_CACHE_PATH) -> str:
+    cached = _cached_driver_path(chrome_path, cache_path)
+    if cached:
+        return cached
+
     candidates = []
     if chrome_path:
         candidates += [chrome_path, chrome_path + '.exe']
@@ -23,15 +78,20 @@ def prepare_service(chrome_path: str | None) -> Service:
 
     for c in candidates:
         if verify_executable(c):
-            return Service(c)
+            remember_driver_path(chrome_path, c, cache_path)
+            return c
 
     # Fallback: webdriver-manager
     from webdriver_manager.chrome import ChromeDriverManager
     driver_path = ChromeDriverManager().install()
     if verify_executable(driver_path):
-        return Service(driver_path)
+        remember_driver_path(chrome_path, driver_path, cache_path)
+        return driver_path
     raise RuntimeError("Could not prepare ChromeDriver")
 
+def prepare_service(chrome_path: str | None, cache_path: str = DRIVER_CACHE_PATH) -> Service:
+    return Service(resolve_driver_path(chrome_path, cache_path))
+
 def build_options(headless: bool = True, window_size: str = "1920,1080") -> Options:
     opts = Options()
     if headless:
@@ -46,4 +106,66 @@ def build_options(headless: bool = True, window_size: str = "1920,1080") -> Opti
 def get_driver(chrome_path: str | None, headless: bool, window_size: str) -> webdriver.Chrome:
     svc = prepare_service(chrome_path)
     opts = build_options(headless=headless, window_size=window_size)
-    return webdriver.Chrome(service=svc, options=opts)
+    try:
+        return webdriver.Chrome(service=svc, options=opts)
+    except WebDriverException:
+        # e.g. cached driver no longer matches the installed Chrome; resolve afresh next time
+        invalidate_cached_driver(chrome_path)
+        raise
+
+
+class BrowserClosed(RuntimeError):
+    """A browser was needed after its session (or pool) was closed."""
+
+
+class BrowserSession:
+    """One Chrome launched on first use and reused for every page.
+
+    The driver is only recycled (quit + relaunched on next use) after a WebDriver error,
+    so repeated scrapes skip browser startup and `prepare_service`. Once `closed` is set
+    (by `close()` or the owning pool), no browser is launched again: a worker still running
+    after its pool shut down gets BrowserClosed instead of starting a Chrome nobody will quit.
+    """
+
+    def __init__(self, factory, closed: threading.Event | None = None):
+        self._factory = factory
+        self._driver = None
+        self.closed = closed or threading.Event()
+        self.launches = 0
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            if self.closed.is_set():
+                raise BrowserClosed("browser session is closed")
+            self._driver = self._factory()
+            self.launches += 1
+        return self._driver
+
+    def recycle(self):
+        drv, self._driver = self._driver, None
+        if drv is not None:
+            try:
+                drv.quit()
+            except Exception:
+                pass
+
+    def run(self, fn, *args, retries: int = 1):
+        """fn(driver, *args); on a WebDriver error recycle the browser and retry."""
+        for attempt in range(retries + 1):
+            try:
+                return fn(self.driver, *args)
+            except WebDriverException:
+                self.recycle()
+                if attempt == retries:
+                    raise
+
+    def close(self):
+        self.closed.set()
+        self.recycle()
+
+    def __enter__(self) -> "BrowserSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,91 @@
+"""Running per-player fantasy totals plus the ledger of scorecards already folded into them.
+
+Only completed scorecards are folded in, so an in-progress match is re-read on the next run
+instead of being counted twice. The ledger is reset when the player-name mapping (or how names
+resolve, see names.RESOLVER_VERSION) changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pandas as pd
+
+from .atomic import atomic_write
+from .config import FANTASY_LEDGER_PATH
+from .names import RESOLVER_VERSION
+
+
+class FantasyLedger:
+    def __init__(self, path: str):
+        self.path = path
+        self.fingerprint = ""
+        self.processed: dict[str, str] = {}
+        self._totals = pd.DataFrame(columns=["player_name"])
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        self.fingerprint = data.get("aliases", "")
+        self.processed = dict(data.get("processed", {}))
+        totals = pd.DataFrame(data.get("totals", []), columns=data.get("columns") or ["player_name"])
+        self._totals = totals.astype(data.get("dtypes", {}))
+
+    def check_aliases(self, aliases: dict[str, str]) -> None:
+        """Drop everything folded so far if the name mapping (or resolver) differs from the one it was built with."""
+        payload = json.dumps([RESOLVER_VERSION, aliases], sort_keys=True)
+        fingerprint = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        if self.processed and fingerprint != self.fingerprint:
+            print(f"[ecc] Fantasy ledger reset (name mapping changed): {self.path}")
+            self.processed = {}
+            self._totals = pd.DataFrame(columns=["player_name"])
+        self.fingerprint = fingerprint
+
+    def save(self) -> None:
+        data = {
+            "aliases": self.fingerprint,
+            "processed": self.processed,
+            "columns": list(self._totals.columns),
+            "dtypes": {c: str(t) for c, t in self._totals.dtypes.items()},
+            "totals": self._totals.to_dict("records"),
+        }
+        atomic_write(self.path, json.dumps(data, ensure_ascii=False))
+
+    def seen(self, key: str) -> bool:
+        return key in self.processed
+
+    def matches(self) -> set[str]:
+        """Match ids with both a batting and a bowling scorecard folded in.
+
+        A match with only one side folded (the other innings didn't parse or wasn't final yet)
+        is left out, so discovery lists it again and the missing side is retried.
+        """
+        sides: dict[str, set[str]] = {}
+        for key in self.processed:
+            if key.count(":") == 2:
+                side, match_id, _ = key.split(":")
+                sides.setdefault(match_id, set()).add(side)
+        return {match_id for match_id, s in sides.items() if s >= {"bat", "bowl"}}
+
+    def totals(self) -> pd.DataFrame:
+        return self._totals.copy()
+
+    def fold(self, parts: dict[str, tuple[str, pd.DataFrame]]) -> None:
+        """Add {key: (url, per-player frame)} into the running totals and record the keys."""
+        from .fantasy_points import _merge_numeric
+
+        if not parts:
+            return
+        self._totals = _merge_numeric([self._totals] + [df for _, df in parts.values()])
+        self.processed.update({key: url for key, (url, _) in parts.items()})
+
+
+def default_fantasy_ledger() -> FantasyLedger | None:
+    """FantasyLedger at FANTASY_LEDGER_PATH, or None for a full rebuild every run."""
+    return FantasyLedger(FANTASY_LEDGER_PATH) if FANTASY_LEDGER_PATH else None
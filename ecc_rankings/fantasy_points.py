@@ -2,25 +2,30 @@ from __future__ import annotations
 
 import json
 import re
-import time
-from io import StringIO
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
-from selenium.webdriver.common.by import By
 
 from .config import (
-    CHROME_PATH,
     CLUB_NAME,
     EINDHOVEN_NAME_MAP,
-    HEADLESS,
     SCORECARD_BATTING_URLS,
     SCORECARD_BOWLING_URLS,
-    WINDOW_SIZE,
 )
-from .driver import get_driver
+from .discovery import MATCH_RE, RESULT_RE
+from .fetch import TABLES, Fetcher, Page, default_fetcher, make_fetcher
+from .metrics import count, timed, timer
+from .names import NameIndex, canon, name_index
+from .pool import DriverPool
+from .store import SeasonStore
+
+if TYPE_CHECKING:
+    from .fantasy_ledger import FantasyLedger
 
 
 @dataclass(frozen=True)
@@ -58,64 +63,52 @@ def _to_num(v: Any, default: float = 0.0) -> float:
 
 
 def _canon_name(name: Any) -> str:
-    s = str(name or "").strip().casefold()
-    s = s.replace(".", " ")
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return canon(str(name or ""))
 
 
-def _name_aliases() -> dict[str, str]:
-    return {_canon_name(k): v for k, v in EINDHOVEN_NAME_MAP.items()}
+def _name_index() -> NameIndex:
+    """The club's compiled name index (see names.py), built once per process."""
+    return name_index(EINDHOVEN_NAME_MAP)
 
 
-def _clean_player_label(name: Any) -> str:
-    s = str(name or "").strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+def _name_aliases() -> dict[str, str]:
+    return _name_index().aliases
 
 
-def _is_non_player_row(name: Any) -> bool:
-    s = _canon_name(name)
-    bad = ("extras", "total", "did not bat", "fall of wickets", "yet to bat")
-    return any(b in s for b in bad) or s in {"", "nan", "none"}
+def _index_for(aliases: dict[str, str]) -> NameIndex:
+    idx = _name_index()
+    return idx if aliases is idx.aliases else name_index(aliases)
 
 
 def _resolve_name(name: Any, aliases: dict[str, str]) -> str | None:
-    if _is_non_player_row(name):
-        return None
-
-    k = _canon_name(name)
-    if k in aliases:
-        return aliases[k]
-
-    # Fallback for scorecards like "A Manohar" / "J K Singh"
-    compact = re.sub(r"\s+", " ", k)
-    if compact in aliases:
-        return aliases[compact]
+    # Unmapped players keep their cleaned label (prevents empty outputs when scorecards use full names)
+    return _index_for(aliases).resolve(name)
 
-    # Keep original player if alias is missing (prevents empty outputs when scorecard uses full names)
-    cleaned = _clean_player_label(name)
-    return cleaned if cleaned else None
 
+@lru_cache(maxsize=1024)
+def _header_labels(columns: tuple) -> tuple[tuple[Any, str, frozenset[str]], ...]:
+    """(column, normalized label, label tokens) per header, once per distinct header layout."""
+    out = []
+    for col in columns:
+        label = re.sub(r"\s+", " ", str(col).strip().lower())
+        out.append((col, label, frozenset(t for t in re.split(r"[^a-z0-9]+", label) if t)))
+    return tuple(out)
 
-def _choose_col(df: pd.DataFrame, candidates: tuple[str, ...]) -> str | None:
-    labels = [(c, re.sub(r"\s+", " ", str(c).strip().lower())) for c in df.columns]
 
+def _pick_col(labels: tuple[tuple[Any, str, frozenset[str]], ...], candidates: tuple[str, ...]) -> Any:
     for cand in candidates:
         c = cand.strip().lower()
-        best: tuple[int, str] | None = None
+        best: tuple[int, Any] | None = None
 
-        for col, label in labels:
+        for col, label, tokens in labels:
             if label == c:
                 score = 3
+            elif c in tokens:
+                score = 2
+            elif len(c) > 1 and c in label:
+                score = 1
             else:
-                tokens = [t for t in re.split(r"[^a-z0-9]+", label) if t]
-                if c in tokens:
-                    score = 2
-                elif len(c) > 1 and c in label:
-                    score = 1
-                else:
-                    score = -1
+                score = -1
 
             if score >= 0 and (best is None or score > best[0]):
                 best = (score, col)
@@ -125,137 +118,199 @@ def _choose_col(df: pd.DataFrame, candidates: tuple[str, ...]) -> str | None:
     return None
 
 
-def _is_batting_table(df: pd.DataFrame) -> bool:
-    c_runs = _choose_col(df, ("R", "Runs"))
-    c_balls = _choose_col(df, ("B", "BF", "Balls"))
-    return bool(c_runs and c_balls)
+def _choose_col(df: pd.DataFrame, candidates: tuple[str, ...]) -> str | None:
+    return _pick_col(_header_labels(tuple(df.columns)), candidates)
 
 
-def _is_bowling_table(df: pd.DataFrame) -> bool:
-    c_overs = _choose_col(df, ("O", "Overs"))
-    c_runs = _choose_col(df, ("R", "Runs"))
-    c_wkts = _choose_col(df, ("W", "Wkts", "Wickets"))
-    return bool(c_overs and c_runs and c_wkts)
+# Scorecard column roles -> accepted header names, in order of preference
+_ROLES = {
+    "runs": ("R", "Runs"),
+    "balls": ("B", "BF", "Balls"),
+    "fours": ("4s", "4", "fours"),
+    "sixes": ("6s", "6", "sixes"),
+    "overs": ("O", "Overs"),
+    "maidens": ("M", "Mdns", "Maidens"),
+    "wickets": ("W", "Wkts", "Wickets"),
+    "economy": ("Econ", "Economy", "ER"),
+}
 
 
-def _numbers_from_row(row: pd.Series) -> list[float]:
-    nums = []
-    for v in row.tolist():
-        n = _to_num(v, default=float("nan"))
-        if not (isinstance(n, float) and (n != n)):
-            nums.append(float(n))
-    return nums
+@dataclass(frozen=True)
+class _Schema:
+    """Column per role for one header layout (None where the table has no such header).
 
+    The player name is always the first column.
+    """
+    runs: Any
+    balls: Any
+    fours: Any
+    sixes: Any
+    overs: Any
+    maidens: Any
+    wickets: Any
+    economy: Any
 
-def _tables_from_rendered_div_rows(driver) -> list[pd.DataFrame]:
-    rows = driver.find_elements(By.XPATH, "//*[@id='page-wrap']/div[4]/div/div[4]/div/div")
-    if not rows:
-        return []
-    raw = [r.text.split("\n") for r in rows if r.text.strip()]
-    if len(raw) < 2:
-        return []
-    header = raw[0]
-    body = [r[: len(header)] for r in raw[1:]]
-    return [pd.DataFrame(body, columns=header)]
+    @property
+    def batting(self) -> bool:
+        return bool(self.runs and self.balls)
 
+    @property
+    def bowling(self) -> bool:
+        return bool(self.overs and self.runs and self.wickets)
 
-def _safe_read_tables(url: str, driver=None) -> list[pd.DataFrame]:
-    try:
-        tables = pd.read_html(url)
-        if tables:
-            return tables
-    except ValueError:
-        pass
 
-    if driver is None:
-        return []
+@lru_cache(maxsize=1024)
+def _header_schema(columns: tuple) -> _Schema:
+    labels = _header_labels(columns)
+    return _Schema(**{role: _pick_col(labels, names) for role, names in _ROLES.items()})
+
+
+def _schema(df: pd.DataFrame) -> _Schema:
+    """Roles of `df`'s columns; scorecards share a few layouts, so this is nearly always cached."""
+    return _header_schema(tuple(df.columns))
+
+
+def _to_num_series(s: pd.Series, default: float = 0.0) -> np.ndarray:
+    """Column-wise `_to_num`: one to_numeric pass, per-cell `_to_num` only for cells it can't parse."""
+    if s.dtype.kind in "iuf":
+        return s.to_numpy(dtype=float)
+    cleaned = s.astype(str).str.strip().str.replace("*", "", regex=False)
+    vals = pd.to_numeric(cleaned, errors="coerce").to_numpy(dtype=float)
+    redo = np.isnan(vals)
+    if redo.any():
+        vals[redo] = [_to_num(v, default) for v in s.to_numpy(dtype=object)[redo]]
+    return vals
+
+
+def _as_int(a: np.ndarray) -> np.ndarray:
+    # int(float) semantics (truncate); empty cells (NaN) count as 0
+    return np.nan_to_num(np.trunc(a), nan=0.0).astype(np.int64)
+
+
+class _RowNumbers:
+    """The k-th numeric cell of every row (what the old per-row `nums[k]` fallback read), built on first use."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._m: np.ndarray | None = None
+
+    def nth(self, k: int) -> np.ndarray:
+        if self._m is None:
+            m = np.column_stack([_to_num_series(self._df.iloc[:, j], float("nan")) for j in range(self._df.shape[1])])
+            self._valid = ~np.isnan(m)
+            self._rank = np.cumsum(self._valid, axis=1) - 1
+            self._m = m
+        hit = self._valid & (self._rank == k)
+        return np.where(hit.any(axis=1), self._m[np.arange(len(self._m)), hit.argmax(axis=1)], 0.0)
+
+
+def _column_values(df: pd.DataFrame, col, nums: _RowNumbers, k: int) -> np.ndarray:
+    return _to_num_series(df[col]) if col is not None else nums.nth(k)
+
+
+@timed("names")
+def _resolve_names(s: pd.Series, aliases: dict[str, str]) -> pd.Series:
+    """`_resolve_name` over a column (once per distinct label); None for non-player rows."""
+    return _index_for(aliases).resolve_series(s)
+
+
+_PERIOD_RE = re.compile(r"[?&]period=(\d+)")
+
+
+def _scorecard_key(url: str) -> tuple[str, str]:
+    """(match_id, period) from a match-centre scorecard URL; empty strings when absent."""
+    m, p = MATCH_RE.search(url), _PERIOD_RE.search(url)
+    return (m.group(1) if m else ""), (p.group(1) if p else "")
+
+
+def _ledger_key(url: str, side: str) -> str:
+    match_id, period = _scorecard_key(url)
+    return f"{side}:{match_id}:{period}" if match_id and period else f"{side}:{url}"
 
-    driver.get(url)
-    time.sleep(3)
-    try:
-        tables = pd.read_html(StringIO(driver.page_source))
-        if tables:
-            return tables
-    except ValueError:
-        pass
 
-    return _tables_from_rendered_div_rows(driver)
+def _is_completed_scorecard(page: Page) -> bool:
+    # A scorecard carrying a result line never changes again, so it is cached as final
+    return bool(RESULT_RE.search(page.html))
+
+
+def _safe_read_tables(url: str, driver=None, fetcher: Fetcher | None = None) -> list[pd.DataFrame]:
+    # Plain HTTP first (served HTML or embedded JSON), rendered page via `driver` only if that has no tables
+    return (fetcher or default_fetcher()).fetch(url, kind=TABLES, driver=driver).tables()
 
 
 def _batting_from_url(url: str, aliases: dict[str, str], driver=None) -> pd.DataFrame:
-    out = []
-    tables = _safe_read_tables(url, driver=driver)
+    return _batting_from_tables(_safe_read_tables(url, driver=driver), aliases)
+
+
+def _batting_from_tables(tables: list[pd.DataFrame], aliases: dict[str, str]) -> pd.DataFrame:
+    parts = []
     for df in tables:
-        if not _is_batting_table(df):
+        schema = _schema(df)
+        if not schema.batting:
             continue
 
-        player_col = df.columns[0]
-        c_runs = _choose_col(df, ("R", "Runs"))
-        c_balls = _choose_col(df, ("B", "BF", "Balls"))
-        c_fours = _choose_col(df, ("4s", "4", "fours"))
-        c_sixes = _choose_col(df, ("6s", "6", "sixes"))
-
-        for _, r in df.iterrows():
-            full = _resolve_name(r.get(player_col), aliases)
-            if not full:
-                continue
-            nums = _numbers_from_row(r)
-            runs = int(_to_num(r.get(c_runs, nums[0] if nums else 0)))
-            balls = int(_to_num(r.get(c_balls, nums[1] if len(nums) > 1 else 0)))
-            fours = int(_to_num(r.get(c_fours, nums[2] if len(nums) > 2 else 0)))
-            sixes = int(_to_num(r.get(c_sixes, nums[3] if len(nums) > 3 else 0)))
-            out.append(
+        names = _resolve_names(df.iloc[:, 0], aliases)
+        keep = names.notna().to_numpy()
+        if not keep.any():
+            continue
+        nums = _RowNumbers(df)
+        runs = _as_int(_column_values(df, schema.runs, nums, 0))[keep]
+        balls = _as_int(_column_values(df, schema.balls, nums, 1))[keep]
+        fours = _as_int(_column_values(df, schema.fours, nums, 2))[keep]
+        sixes = _as_int(_column_values(df, schema.sixes, nums, 3))[keep]
+        parts.append(
+            pd.DataFrame(
                 {
-                    "player_name": full,
+                    "player_name": names[keep].to_numpy(dtype=object),
                     "runs": runs,
                     "Four": fours,
                     "Sixes": sixes,
                     "Balls": balls,
-                    "50 runs": 1 if runs >= 50 else 0,
-                    "100 runs": 1 if runs >= 100 else 0,
+                    "50 runs": (runs >= 50).astype(np.int64),
+                    "100 runs": (runs >= 100).astype(np.int64),
                 }
             )
-    return pd.DataFrame(out)
+        )
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
 
 
 def _bowling_from_url(url: str, aliases: dict[str, str], driver=None) -> pd.DataFrame:
-    out = []
-    tables = _safe_read_tables(url, driver=driver)
+    return _bowling_from_tables(_safe_read_tables(url, driver=driver), aliases)
+
+
+def _bowling_from_tables(tables: list[pd.DataFrame], aliases: dict[str, str]) -> pd.DataFrame:
+    parts = []
     for df in tables:
-        if not _is_bowling_table(df):
+        schema = _schema(df)
+        if not schema.bowling:
             continue
 
-        player_col = df.columns[0]
-        c_overs = _choose_col(df, ("O", "Overs"))
-        c_maid = _choose_col(df, ("M", "Mdns", "Maidens"))
-        c_runs = _choose_col(df, ("R", "Runs"))
-        c_wkts = _choose_col(df, ("W", "Wkts", "Wickets"))
-        c_econ = _choose_col(df, ("Econ", "Economy", "ER"))
-
-        for _, r in df.iterrows():
-            full = _resolve_name(r.get(player_col), aliases)
-            if not full:
-                continue
-            nums = _numbers_from_row(r)
-            overs = float(_to_num(r.get(c_overs, nums[0] if nums else 0)))
-            maid = int(_to_num(r.get(c_maid, nums[1] if len(nums) > 1 else 0)))
-            runs = int(_to_num(r.get(c_runs, nums[2] if len(nums) > 2 else 0)))
-            wkts = int(_to_num(r.get(c_wkts, nums[3] if len(nums) > 3 else 0)))
-            econ = float(_to_num(r.get(c_econ, nums[4] if len(nums) > 4 else 0)))
-            out.append(
+        names = _resolve_names(df.iloc[:, 0], aliases)
+        keep = names.notna().to_numpy()
+        if not keep.any():
+            continue
+        nums = _RowNumbers(df)
+        overs = _column_values(df, schema.overs, nums, 0)[keep]
+        maid = _as_int(_column_values(df, schema.maidens, nums, 1))[keep]
+        runs = _as_int(_column_values(df, schema.runs, nums, 2))[keep]
+        wkts = _as_int(_column_values(df, schema.wickets, nums, 3))[keep]
+        econ = _column_values(df, schema.economy, nums, 4)[keep]
+        parts.append(
+            pd.DataFrame(
                 {
-                    "player_name": full,
+                    "player_name": names[keep].to_numpy(dtype=object),
                     "Overs": overs,
                     "Maiden": maid,
                     "Runs": runs,
                     "Economy": econ,
                     "wickets": wkts,
-                    "3 Wicket": 1 if wkts >= 3 else 0,
-                    "5 Wicket": 1 if wkts >= 5 else 0,
-                    "10 Wicket": 1 if wkts >= 10 else 0,
+                    "3 Wicket": (wkts >= 3).astype(np.int64),
+                    "5 Wicket": (wkts >= 5).astype(np.int64),
+                    "10 Wicket": (wkts >= 10).astype(np.int64),
                 }
             )
-    return pd.DataFrame(out)
+        )
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
 
 
 def _points_from_row(row: dict[str, Any], rules: FantasyRules) -> int:
@@ -304,16 +359,98 @@ def _points_from_row(row: dict[str, Any], rules: FantasyRules) -> int:
     return int(batting_points + bowling_points + fielding_points)
 
 
+# Inputs to the fantasy scorer: column -> parsed as int (True) or float (False)
+_POINT_INPUTS = {
+    "runs": True,
+    "Four": True,
+    "Sixes": True,
+    "Overs": False,
+    "Maiden": True,
+    "Economy": False,
+    "wickets": True,
+    "catches": True,
+    "run_outs_direct": True,
+    "run_outs_shared": True,
+}
+
+
+def _num_column(data: pd.DataFrame | dict[str, Any], name: str, as_int: bool, n: int) -> np.ndarray:
+    if name not in data:
+        return np.zeros(n, dtype=np.int64 if as_int else float)
+    v = data[name]
+    v = _to_num_series(v) if isinstance(v, pd.Series) else np.asarray(v, dtype=float)
+    return _as_int(v) if as_int else v
+
+
+def _point_inputs(data: pd.DataFrame | dict[str, Any]) -> dict[str, np.ndarray]:
+    """Parse the scorer's input columns once; missing columns score as 0."""
+    n = len(data) if isinstance(data, pd.DataFrame) else len(next(iter(data.values()), ()))
+    return {name: _num_column(data, name, as_int, n) for name, as_int in _POINT_INPUTS.items()}
+
+
+def _points_batch(data: pd.DataFrame | dict[str, Any], rules: FantasyRules = FantasyRules()) -> np.ndarray:
+    """Vectorized `_points_from_row` over a whole player table (DataFrame or dict of arrays)."""
+    x = _point_inputs(data)
+    runs, wickets, overs, econ = x["runs"], x["wickets"], x["Overs"], x["Economy"]
+
+    batting_points = (
+        runs * rules.run
+        + x["Four"] * rules.four
+        + x["Sixes"] * rules.six
+        + np.where(runs >= 50, rules.fifty_bonus, 0)
+        + np.where(runs >= 100, rules.hundred_bonus, 0)
+    )
+    haul_bonus = np.select(
+        [wickets >= 10, wickets >= 5, wickets >= 3],
+        [rules.ten_wicket_bonus, rules.five_wicket_bonus, rules.three_wicket_bonus],
+        0,
+    )
+    economy_points = np.where(
+        overs >= 4,
+        np.select(
+            [econ < 3, econ > 12, econ > 8, econ > 6],
+            [rules.econ_under3, rules.econ_over12, rules.econ_over8, rules.econ_over6],
+            0,
+        ),
+        0,
+    )
+    bowling_points = wickets * rules.wicket + x["Maiden"] * rules.maiden + haul_bonus + economy_points
+    fielding_points = (
+        x["catches"] * rules.catch
+        + x["run_outs_direct"] * rules.runout_direct
+        + x["run_outs_shared"] * rules.runout_shared
+    )
+    return (batting_points + bowling_points + fielding_points).astype(np.int64)
+
+
+def score_rule_sets(data: pd.DataFrame, rule_sets: dict[str, FantasyRules]) -> pd.DataFrame:
+    """Fantasy points for each named what-if rule set; inputs are parsed once and shared."""
+    x = _point_inputs(data)
+    return pd.DataFrame({name: _points_batch(x, rules) for name, rules in rule_sets.items()}, index=data.index)
+
+
 def _merge_numeric(frames: list[pd.DataFrame]) -> pd.DataFrame:
-    merged = pd.DataFrame(columns=["player_name"])
-    for part in frames:
-        if part is None or part.empty:
-            continue
-        part = part.copy().fillna(0)
-        num_cols = [c for c in part.columns if c != "player_name"]
-        part = part.groupby("player_name", as_index=False)[num_cols].sum()
-        merged = part if merged.empty else pd.merge(merged, part, on="player_name", how="outer")
-    return merged.fillna(0)
+    """Sum every numeric column per player across all frames in one concat + groupby.
+
+    Columns keep first-seen order; integer columns stay integer even when some frames lack them.
+    """
+    parts = [p for p in frames if p is not None and not p.empty]
+    if not parts:
+        return pd.DataFrame(columns=["player_name"])
+    dtypes: dict[str, list[np.dtype]] = {}
+    for part in parts:
+        for col, dt in part.dtypes.items():
+            if col != "player_name":
+                dtypes.setdefault(col, []).append(dt)
+
+    stacked = pd.concat(parts, ignore_index=True, sort=False)
+    num_cols = [c for c in stacked.columns if c != "player_name"]
+    merged = stacked.groupby("player_name", as_index=False, sort=True)[num_cols].sum()
+    for col in num_cols:
+        common = np.result_type(*dtypes[col])
+        if common.kind in "iu":
+            merged[col] = merged[col].astype(common)
+    return merged
 
 
 def build_fantasy_points_json(
@@ -324,51 +461,100 @@ def build_fantasy_points_json(
     batting_urls: list[str] | None = None,
     bowling_urls: list[str] | None = None,
     rules: FantasyRules = FantasyRules(),
+    pool: DriverPool | None = None,
+    fetcher: Fetcher | None = None,
+    store: SeasonStore | None = None,
+    ledger: FantasyLedger | None = None,
 ) -> dict[str, Any]:
-    aliases = _name_aliases()
+    """Fantasy payload for every scorecard URL.
 
-    batting_urls = batting_urls or list(SCORECARD_BATTING_URLS)
-    bowling_urls = bowling_urls or list(SCORECARD_BOWLING_URLS)
-
-    driver = get_driver(CHROME_PATH, HEADLESS, WINDOW_SIZE)
-    try:
-        batting_df = _merge_numeric([_batting_from_url(u, aliases, driver=driver) for u in batting_urls])
-        bowling_df = _merge_numeric([_bowling_from_url(u, aliases, driver=driver) for u in bowling_urls])
-    finally:
-        driver.quit()
-    merged = _merge_numeric([batting_df, bowling_df])
+    With a `ledger`, scorecards it has already folded in are not fetched at all; newly completed
+    ones are added to its running totals, and in-progress ones only count towards this payload.
+    """
+    aliases = _name_aliases()
+    names = _index_for(aliases)
+    names.unresolved.clear()
+    names.fuzzy.clear()
+
+    batting_urls = list(SCORECARD_BATTING_URLS) if batting_urls is None else list(batting_urls)
+    bowling_urls = list(SCORECARD_BOWLING_URLS) if bowling_urls is None else list(bowling_urls)
+    sides = [(url, "bat") for url in batting_urls] + [(url, "bowl") for url in bowling_urls]
+    if ledger is not None:
+        ledger.check_aliases(aliases)
+        sides = [(url, side) for url, side in sides if not ledger.seen(_ledger_key(url, side))]
+        print(f"[ecc] Fantasy ledger: {len(ledger.processed)} scorecards folded, {len(sides)} to fetch")
+
+    # Every batting and bowling scorecard is fetched in one batch; pages keep URL order
+    urls = [url for url, _ in sides]
+    with make_fetcher(pool) if fetcher is None else nullcontext(fetcher) as f:
+        pages = f.fetch_all(urls, kind=TABLES, final=_is_completed_scorecard) if urls else []
+        print(f"[ecc] Scorecards served by: {f.report()}")
+    parsers = {"bat": _batting_from_tables, "bowl": _bowling_from_tables}
+    with timer("parse.scorecards"):
+        parts = [parsers[side](p.tables(), aliases) for (_, side), p in zip(sides, pages)]
+    if names.unresolved or names.fuzzy:
+        # Unresolved: usually opponents or club players missing from EINDHOVEN_NAME_MAP; matched
+        # outside the map: check these, a wrong merge is fixed by adding the label to the map
+        count("names.unresolved", len(names.unresolved))
+        count("names.fuzzy", len(names.fuzzy))
+        print(f"[ecc] Names: {names.report()}")
+    if ledger is None:
+        merged = _merge_numeric(parts)
+    else:
+        ledger.fold({
+            _ledger_key(url, side): (url, part)
+            for (url, side), page, part in zip(sides, pages, parts)
+            if page.tables() and _is_completed_scorecard(page)
+        })
+        pending = [part for (url, side), part in zip(sides, parts) if not ledger.seen(_ledger_key(url, side))]
+        merged = _merge_numeric([ledger.totals()] + pending)
+        ledger.save()
+    if store is not None:
+        # `side` tells batting runs from bowling runs conceded once the innings share a table
+        innings = [
+            part.assign(match_id=key[0], period=key[1], side=side)
+            for part, (_, side), key in zip(parts, sides, map(_scorecard_key, urls))
+            if not part.empty
+        ]
+        if innings:
+            store.write("fantasy_innings", pd.concat(innings, ignore_index=True))
 
     if merged.empty:
         raise RuntimeError("No player rows extracted from scorecards. Check scorecard URLs/period IDs and mapping.")
 
-    players = []
-    for _, r in merged.iterrows():
-        runs = int(_to_num(r.get("runs", 0)))
-        wickets = int(_to_num(r.get("wickets", 0)))
-        rec = {
-            "player_name": str(r.get("player_name", "")),
+    n = len(merged)
+    runs = _num_column(merged, "runs", True, n)
+    wickets = _num_column(merged, "wickets", True, n)
+    zeros = np.zeros(n, dtype=np.int64)
+    records = pd.DataFrame(
+        {
+            "player_name": merged["player_name"].astype(str).to_numpy(dtype=object),
             "team_name": team_name,
             "runs": runs,
-            "Four": int(_to_num(r.get("Four", 0))),
-            "Sixes": int(_to_num(r.get("Sixes", 0))),
-            "Balls": int(_to_num(r.get("Balls", 0))),
-            "50 runs": 1 if runs >= 50 else 0,
-            "100 runs": 1 if runs >= 100 else 0,
-            "Overs": float(_to_num(r.get("Overs", 0))),
-            "Maiden": int(_to_num(r.get("Maiden", 0))),
-            "Runs": int(_to_num(r.get("Runs", 0))),
-            "Economy": float(_to_num(r.get("Economy", 0))),
+            "Four": _num_column(merged, "Four", True, n),
+            "Sixes": _num_column(merged, "Sixes", True, n),
+            "Balls": _num_column(merged, "Balls", True, n),
+            "50 runs": (runs >= 50).astype(np.int64),
+            "100 runs": (runs >= 100).astype(np.int64),
+            "Overs": _num_column(merged, "Overs", False, n),
+            "Maiden": _num_column(merged, "Maiden", True, n),
+            "Runs": _num_column(merged, "Runs", True, n),
+            "Economy": _num_column(merged, "Economy", False, n),
             "wickets": wickets,
-            "3 Wicket": 1 if wickets >= 3 else 0,
-            "5 Wicket": 1 if wickets >= 5 else 0,
-            "10 Wicket": 1 if wickets >= 10 else 0,
-            "catches": 0,
-            "stumpings": 0,
-            "run_outs": 0,
-            "fantasy_points": 0,
+            "3 Wicket": (wickets >= 3).astype(np.int64),
+            "5 Wicket": (wickets >= 5).astype(np.int64),
+            "10 Wicket": (wickets >= 10).astype(np.int64),
+            "catches": zeros,
+            "stumpings": zeros,
+            "run_outs": zeros,
         }
-        rec["fantasy_points"] = _points_from_row(rec, rules)
-        players.append(rec)
+    )
+    with timer("score.fantasy"):
+        records["fantasy_points"] = _points_batch(records, rules)
+    count("fantasy.players", n)
+    if store is not None:
+        store.write("fantasy_points", records)
+    players = records.to_dict("records")
 
     return {
         "source": "manual",
@@ -388,6 +574,6 @@ def build_fantasy_points_json(
 
 def save_fantasy_points_json(path: str, **kwargs: Any) -> str:
     payload = build_fantasy_points_json(**kwargs)
-    with open(path, "w", encoding="utf-8") as f:
+    with timer("write"), open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
     return path
@@ -0,0 +1,308 @@
+"""Pluggable page fetching: plain HTTP first, Chrome only for URLs whose data needs rendering."""
+from __future__ import annotations
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Callable
+
+import pandas as pd
+import requests
+from lxml import etree, html as lxml_html
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+
+from .config import FETCH_MODE, HTTP_POOL_SIZE, HTTP_TIMEOUT, STATS_ROWS_XPATH
+from .metrics import count, timed, timer
+from .page_ready import MATCH_LINKS, SCORECARD_TABLE, STATS_ROWS, load_page, scroll_until_stable
+from .pool import DriverPool
+
+if TYPE_CHECKING:
+    from .page_cache import PageCache
+    from .replay import SnapshotStore
+
+# What a caller needs from a page: leaderboard row text (ALL_ROWS: scrolled until no more lazy-load),
+# scorecard tables, or match/innings links
+ROWS = "rows"
+ALL_ROWS = "all_rows"
+TABLES = "tables"
+LINKS = "links"
+
+_LINK_RE = re.compile(r"href=[\"'][^\"']*(?:/match/|[?&]period=)", re.I)
+_JSON_SCRIPT_RE = re.compile(r"<script[^>]*type=[\"']application/(?:ld\+)?json[\"'][^>]*>(.*?)</script>", re.S | re.I)
+
+
+def rows_from_html(html: str) -> list[list[str]]:
+    """Text lines of each stats-row container, as Selenium's `row.text.split("\\n")` would give."""
+    if not html or not html.strip():
+        return []
+    try:
+        doc = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
+    return [[t.strip() for t in el.itertext() if t.strip()] for el in doc.xpath(STATS_ROWS_XPATH)]
+
+
+def _record_lists(obj: Any):
+    if isinstance(obj, list):
+        if obj and all(isinstance(x, dict) for x in obj) and any(
+            not isinstance(v, (dict, list)) for x in obj for v in x.values()
+        ):
+            yield obj
+        for x in obj:
+            yield from _record_lists(x)
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            yield from _record_lists(v)
+
+
+def embedded_json_tables(html: str) -> list[pd.DataFrame]:
+    """Tables from JSON payloads embedded in the page (e.g. `__NEXT_DATA__`): every list of records."""
+    out = []
+    for blob in _JSON_SCRIPT_RE.findall(html or ""):
+        try:
+            data = json.loads(blob)
+        except ValueError:
+            continue
+        for records in _record_lists(data):
+            flat = [{k: v for k, v in r.items() if not isinstance(v, (dict, list))} for r in records]
+            out.append(pd.DataFrame(flat))
+    return out
+
+
+@dataclass
+class Page:
+    url: str
+    html: str
+    backend: str  # "http" | "browser" | "cache" | "revalidated" | "none"
+    rows: list[list[str]] | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    _html_tables: list[pd.DataFrame] | None = field(default=None, repr=False)
+    _tables: list[pd.DataFrame] | None = field(default=None, repr=False)
+
+    def stat_rows(self) -> list[list[str]]:
+        if self.rows is None:
+            with timer("parse.rows"):
+                self.rows = rows_from_html(self.html)
+        return self.rows
+
+    def html_tables(self) -> list[pd.DataFrame]:
+        if self._html_tables is None:
+            with timer("parse.tables"):
+                try:
+                    self._html_tables = pd.read_html(StringIO(self.html)) if self.html else []
+                except ValueError:
+                    self._html_tables = []
+        return self._html_tables
+
+    def tables(self) -> list[pd.DataFrame]:
+        if self._tables is None:
+            self._tables = self.html_tables() or embedded_json_tables(self.html) or self._row_tables()
+        return self._tables
+
+    def _row_tables(self) -> list[pd.DataFrame]:
+        raw = [r for r in self.stat_rows() if any(c.strip() for c in r)]
+        if len(raw) < 2:
+            return []
+        header = raw[0]
+        return [pd.DataFrame([r[: len(header)] for r in raw[1:]], columns=header)]
+
+    def has_data(self, kind: str) -> bool:
+        if kind in (ROWS, ALL_ROWS):
+            return len(self.stat_rows()) > 1
+        if kind == LINKS:
+            return bool(_LINK_RE.search(self.html or ""))
+        return bool(self.tables())
+
+
+class HttpBackend:
+    """requests.Session with a pooled keep-alive adapter."""
+
+    name = "http"
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, timeout: float = HTTP_TIMEOUT):
+        self.pool_size = max(1, int(pool_size))
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": "Mozilla/5.0 (ecc_rankings)"})
+
+    def fetch(self, url: str, etag: str | None = None, last_modified: str | None = None) -> Page | None:
+        """GET url; with validators this is a conditional request and None means 304 Not Modified."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        with timer("fetch.http"):
+            resp = self.session.get(url, timeout=self.timeout, headers=headers)
+        if resp.status_code == 304 and headers:
+            return None
+        resp.raise_for_status()
+        return Page(url, resp.text, self.name,
+                    etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+
+    def close(self):
+        self.session.close()
+
+
+class BrowserBackend:
+    """Renders a URL in a (pooled) Chrome and waits for its data to appear."""
+
+    name = "browser"
+
+    @timed("fetch.browser")
+    def fetch(self, driver, url: str, kind: str) -> Page:
+        if kind in (ROWS, ALL_ROWS):
+            load_page(driver, url, (STATS_ROWS,), min_count=2)
+            if kind == ALL_ROWS:
+                scroll_until_stable(driver, STATS_ROWS)
+        elif kind == LINKS:
+            load_page(driver, url, (MATCH_LINKS,))
+            return Page(url, driver.page_source, self.name)
+        else:
+            load_page(driver, url, (SCORECARD_TABLE, STATS_ROWS))
+        page = Page(url, driver.page_source, self.name)
+        if kind != TABLES or not page.html_tables():
+            page.rows = [el.text.split("\n") for el in driver.find_elements(By.XPATH, STATS_ROWS_XPATH)]
+        return page
+
+
+class Fetcher:
+    """HTTP-first fetcher with per-URL browser fallback and an optional PageCache.
+
+    Fresh cache entries are served without touching the network; stale ones are revalidated
+    with ETag/Last-Modified when they came over HTTP. With `snapshots`, every page is recorded,
+    and mode "replay" serves only recorded pages. `served` records which backend produced
+    each URL's page.
+    """
+
+    def __init__(self, mode: str = FETCH_MODE, pool: DriverPool | None = None, http: HttpBackend | None = None,
+                 cache: PageCache | None = None, snapshots: SnapshotStore | None = None):
+        if mode not in ("auto", "http", "browser", "replay"):
+            raise ValueError(f"Unknown fetch mode: {mode!r}")
+        if mode == "replay" and snapshots is None:
+            raise ValueError("Replay mode needs a SnapshotStore")
+        self.mode = mode
+        self.pool = pool
+        self.http = http or HttpBackend()
+        self.browser = BrowserBackend()
+        self.cache = cache
+        self.snapshots = snapshots
+        self.served: dict[str, str] = {}
+
+    def _from_cache(self, url: str) -> tuple[Page | None, dict | None]:
+        """(fresh cached page, None) or (None, stale entry usable for revalidation)."""
+        if self.mode == "replay":
+            page = self.snapshots.load(url)
+            if page is None:
+                print(f"[ecc] No snapshot recorded for {url}")
+            return page or Page(url, "", "none"), None
+        entry = self.cache.get(url) if self.cache is not None else None
+        if entry is None:
+            return None, None
+        if self.cache.is_fresh(entry):
+            return self.cache.load(url, entry), None
+        return None, entry
+
+    def _try_http(self, url: str, kind: str, stale: dict | None = None) -> Page | None:
+        if self.mode == "browser":
+            return None
+        try:
+            page = self.http.fetch(url, etag=(stale or {}).get("etag"), last_modified=(stale or {}).get("last_modified"))
+        except requests.RequestException as e:
+            print(f"[ecc] HTTP fetch failed ({type(e).__name__}): {url}")
+            return None
+        if page is None:
+            self.cache.touch(url)
+            return self.cache.load(url, stale, backend="revalidated")
+        return page if page.has_data(kind) or self.mode == "http" else None
+
+    def _done(self, page: Page, kind: str, final: bool | Callable[[Page], bool]) -> Page:
+        self.served[page.url] = page.backend
+        count(f"pages.{page.backend}")
+        if self.snapshots is not None and self.mode != "replay":
+            self.snapshots.save(page)
+        if self.cache is not None and page.backend in ("http", "browser"):
+            self.cache.put(page, kind, final=final(page) if callable(final) else final)
+        return page
+
+    def fetch(self, url: str, kind: str = TABLES, driver=None, final: bool | Callable[[Page], bool] = False) -> Page:
+        """Fetch one URL. The browser fallback needs `driver` or a pool; otherwise a miss yields an empty page.
+
+        `final` (or a predicate on the fetched page) marks content that never changes, e.g. a completed scorecard.
+        """
+        page, stale = self._from_cache(url)
+        if page is None:
+            page = self._try_http(url, kind, stale)
+        if page is None and self.mode != "http" and (driver is not None or self.pool is not None):
+            if driver is not None:
+                page = self.browser.fetch(driver, url, kind)
+            else:
+                page = self.pool.map(lambda d, u: self.browser.fetch(d, u, kind), [url])[0]
+        return self._done(page or Page(url, "", "none"), kind, final)
+
+    def fetch_all(self, urls: list[str], kind: str = TABLES, final: bool | Callable[[Page], bool] = False) -> list[Page]:
+        """Fetch every URL concurrently; pages come back in `urls` order.
+
+        As with `fetch`, misses are only rendered on the fetcher's pool; without one they yield empty pages.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        cached = [self._from_cache(u) for u in urls]
+        pending = [i for i, (p, _) in enumerate(cached) if p is None]
+        pages: list[Page | None] = [p for p, _ in cached]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(len(pending), self.http.pool_size)) as ex:
+                fetched = list(ex.map(lambda i: self._try_http(urls[i], kind, cached[i][1]), pending))
+            for i, page in zip(pending, fetched):
+                pages[i] = page
+
+        misses = [i for i, p in enumerate(pages) if p is None]
+        if misses and self.mode != "http" and self.pool is not None:
+            rendered = self.pool.map(lambda d, u: self.browser.fetch(d, u, kind), [urls[i] for i in misses])
+            for i, page in zip(misses, rendered):
+                pages[i] = page
+        return [self._done(p or Page(u, "", "none"), kind, final) for u, p in zip(urls, pages)]
+
+    def report(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for backend in self.served.values():
+            counts[backend] = counts.get(backend, 0) + 1
+        return counts
+
+    def close(self):
+        self.http.close()
+        if self.cache is not None:
+            self.cache.flush()
+
+    def __enter__(self) -> "Fetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def make_fetcher(pool: DriverPool | None = None) -> Fetcher:
+    """Fetcher wired from config: FETCH_MODE, the page cache and record/replay snapshots."""
+    from .page_cache import default_page_cache
+    from .replay import default_snapshot_store
+
+    return Fetcher(pool=pool, cache=default_page_cache(), snapshots=default_snapshot_store())
+
+
+_default: Fetcher | None = None
+
+
+def default_fetcher() -> Fetcher:
+    """Process-wide fetcher so ad-hoc calls still share keep-alive connections."""
+    global _default
+    if _default is None:
+        _default = make_fetcher()
+    return _default
@@ -0,0 +1,64 @@
+"""Full-league mode: every row of every klasse page, streamed one page at a time.
+
+Pages are followed through their "next" links (and lazy-load scrolling when rendered in Chrome),
+parsed, handed to the caller and dropped, so memory stays bounded by one page whatever the
+league size. Each page's throughput is printed and, with `throughput`, recorded.
+"""
+from __future__ import annotations
+
+import time
+from typing import Iterator
+from urllib.parse import urljoin
+
+import pandas as pd
+from lxml import etree, html as lxml_html
+
+from .config import CLUB_NAME, LEAGUE_MAX_PAGES
+from .fetch import ALL_ROWS, Fetcher, Page
+
+_NEXT_LABELS = {"next", "volgende", "›", "»", ">"}
+
+
+def next_page_url(html: str, url: str) -> str | None:
+    """Target of the page's rel="next" link, or of a link labelled Next/›/»; None on the last page."""
+    if not html or not html.strip():
+        return None
+    try:
+        doc = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+    for a in doc.iter("a"):
+        href = a.get("href")
+        if href and ("next" in (a.get("rel") or "").split() or a.text_content().strip().casefold() in _NEXT_LABELS):
+            return urljoin(url, href)
+    return None
+
+
+def iter_league_pages(fetcher: Fetcher, urls: dict[str, str], max_pages: int = LEAGUE_MAX_PAGES,
+                      throughput: list[dict] | None = None) -> Iterator[tuple[str, Page]]:
+    """Yield (klasse, page) for every page of every klasse leaderboard, in order."""
+    for klasse, url in urls.items():
+        seen: set[str] = set()
+        while url and url not in seen and len(seen) < max_pages:
+            seen.add(url)
+            start = time.perf_counter()
+            page = fetcher.fetch_all([url], kind=ALL_ROWS)[0]
+            n = max(len(page.stat_rows()) - 1, 0)
+            secs = time.perf_counter() - start
+            print(f"[ecc] {klasse} page {len(seen)}: {n} rows in {secs:.2f}s "
+                  f"({n / secs if secs > 0 else 0:.0f} rows/s, {page.backend})")
+            if throughput is not None:
+                throughput.append({"klasse": klasse, "url": url, "page": len(seen), "rows": n,
+                                   "seconds": secs, "backend": page.backend})
+            yield klasse, page
+            url = next_page_url(page.html, page.url)
+
+
+def club_rows(df: pd.DataFrame, club: str = CLUB_NAME, top: int | None = 10) -> pd.DataFrame:
+    """Downstream club filter over full-league rows: the club's first `top` rows per klasse, in page order."""
+    if df.empty or "Team" not in df.columns:
+        return df
+    d = df[df["Team"] == club]
+    if top is not None:
+        d = d.groupby("Klasse", sort=False).head(top)
+    return d.drop(columns="Team").reset_index(drop=True)
@@ -0,0 +1,38 @@
+"""Memoized scoring: results keyed by a content fingerprint of the input frame."""
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Callable
+
+import pandas as pd
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """sha1 over column names, dtypes and every cell (index included)."""
+    h = hashlib.sha1()
+    h.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+class ScoreMemo:
+    """Small LRU of scored frames. Each call returns a copy, so consumers can't alter the cached result."""
+
+    def __init__(self, size: int = 4):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[str, pd.DataFrame] = OrderedDict()
+
+    def __call__(self, df: pd.DataFrame, score: Callable[[pd.DataFrame], pd.DataFrame]) -> pd.DataFrame:
+        key = frame_fingerprint(df)
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            self.misses += 1
+            self._cache[key] = score(df)
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+        return self._cache[key].copy()
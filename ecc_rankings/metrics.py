@@ -0,0 +1,141 @@
+"""Run instrumentation: per-stage timers and counters, reported as JSON and Prometheus text.
+
+    with timer("fetch.http"):
+        ...
+    count("pages.browser")
+
+Stages are dotted names: fetch.http, fetch.browser, page_ready, parse.rows, parse.tables,
+parse.scorecards, names, score.batting, score.bowling, score.allrounder, score.fantasy, render,
+write, write.store. Stage seconds are summed across threads, so concurrent fetches can add up to
+more than the wall time, and stages may nest (fetch.browser includes page_ready).
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+from .atomic import atomic_write
+from .config import METRICS_DIR, PROM_TEXTFILE_DIR
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.time()
+            self._t0 = time.perf_counter()
+            self.stages: dict[str, list[float]] = {}  # stage -> [calls, seconds, max seconds]
+            self.counters: dict[str, float] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            s = self.stages.setdefault(stage, [0, 0.0, 0.0])
+            s[0] += 1
+            s[1] += seconds
+            s[2] = max(s[2], seconds)
+
+    def count(self, name: str, n: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str) -> Callable:
+        """Decorator form of `timer`."""
+        def wrap(fn: Callable) -> Callable:
+            @wraps(fn)
+            def inner(*args: Any, **kwargs: Any) -> Any:
+                with self.timer(stage):
+                    return fn(*args, **kwargs)
+            return inner
+        return wrap
+
+    def run(self, job: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """fn(*args, **kwargs) as one reported run: reset first, `emit` afterwards even if it fails."""
+        self.reset()
+        status = "failed"
+        try:
+            result = fn(*args, **kwargs)
+            status = "ok"
+            return result
+        finally:
+            self.emit(job, status)
+
+    def report(self, job: str, status: str = "ok") -> dict[str, Any]:
+        with self._lock:
+            return {
+                "job": job,
+                "status": status,
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(self.started)),
+                "wall_seconds": round(time.perf_counter() - self._t0, 4),
+                "stages": {k: {"calls": int(c), "seconds": round(t, 4), "max_seconds": round(m, 4)}
+                           for k, (c, t, m) in sorted(self.stages.items())},
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def prometheus(self, job: str, status: str = "ok") -> str:
+        """Node-exporter textfile format (gauges describing the last run of `job`)."""
+        r = self.report(job, status)
+        lines = []
+
+        def gauge(name: str, help_: str, samples: list[tuple[dict[str, str], float]]) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                text = ",".join(f'{k}="{_label(v)}"' for k, v in {"run": job, **labels}.items())
+                lines.append(f"{name}{{{text}}} {value:g}")
+
+        stages = r["stages"].items()
+        gauge("ecc_run_wall_seconds", "Wall time of the last run.", [({}, r["wall_seconds"])])
+        gauge("ecc_run_success", "1 if the last run succeeded.", [({}, 1 if status == "ok" else 0)])
+        gauge("ecc_run_timestamp_seconds", "Start of the last run (unix time).", [({}, round(self.started))])
+        gauge("ecc_stage_seconds", "Seconds spent per stage in the last run (summed across threads).",
+              [({"stage": k}, v["seconds"]) for k, v in stages])
+        gauge("ecc_stage_calls", "Timed calls per stage in the last run.", [({"stage": k}, v["calls"]) for k, v in stages])
+        gauge("ecc_stage_max_seconds", "Slowest single call per stage in the last run.",
+              [({"stage": k}, v["max_seconds"]) for k, v in stages])
+        gauge("ecc_count", "Counters from the last run.", [({"name": k}, v) for k, v in r["counters"].items()])
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        with self._lock:
+            top = sorted(self.stages.items(), key=lambda kv: -kv[1][1])
+            return " | ".join(f"{k} {t:.2f}s/{int(c)}" for k, (c, t, _) in top)
+
+    def emit(self, job: str, status: str = "ok", metrics_dir: str = METRICS_DIR,
+             textfile_dir: str = PROM_TEXTFILE_DIR) -> None:
+        """Print the stage summary and write `<metrics_dir>/<job>.json` / `<textfile_dir>/ecc_<job>.prom` if set."""
+        print(f"[ecc] Timings: {self.summary() or 'none recorded'}")
+        if metrics_dir:
+            path = os.path.join(metrics_dir, f"{job}.json")
+            atomic_write(path, json.dumps(self.report(job, status), indent=2))
+            print(f"[ecc] Run report: {path}")
+        if textfile_dir:
+            # The textfile collector must never see a half-written file
+            atomic_write(os.path.join(textfile_dir, f"ecc_{job}.prom"), self.prometheus(job, status))
+
+
+def _label(value: str) -> str:
+    return re.sub(r'(["\\])', r"\\\1", str(value)).replace("\n", r"\n")
+
+
+# Process-wide registry shared by every module
+METRICS = Metrics()
+timer = METRICS.timer
+timed = METRICS.timed
+count = METRICS.count
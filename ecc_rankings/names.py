@@ -0,0 +1,176 @@
+"""Scorecard name -> club player resolution.
+
+A `NameIndex` is compiled once from a name map ("a manohar" -> "aarav manohar"). Each scorecard
+label goes through:
+
+1. exact lookup of its canonical form (casefolded, dots to spaces, whitespace collapsed);
+2. the same after normalizing "Surname, First", captain/keeper markers and punctuation, against
+   both the map's keys and its full names;
+3. an initials-only label ("P. K. Patil") stops there: it must equal a map key with the initials
+   spaced or joined ("p k patil" / "pk patil"), since "K Singh" may be any K Singh;
+4. players with the same first initial and exactly the same surname, where the first names must
+   have a `difflib` ratio of at least `cutoff` ("Pradeepp Patil" -> "pradeep patil"). A different
+   surname is never matched, since "Amit Rajan" is not "amit ranjan".
+
+Labels that still don't match keep their cleaned text (they are usually players missing from the
+map) and are counted in `unresolved`; matches made by steps 2-4 are listed in `fuzzy`, and both
+show in `report()` so a wrong merge can be overridden with a map entry. Canonical forms and
+per-label results are LRU-cached, so repeated names across scorecards cost a dict lookup.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter, OrderedDict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any
+
+import pandas as pd
+
+# Bump when resolution changes what a label maps to (fantasy ledgers built under another version reset)
+RESOLVER_VERSION = 4
+
+# How a label was resolved (cached per label)
+_EXACT, _FUZZY, _UNRESOLVED = "exact", "fuzzy", "unresolved"
+
+_NON_PLAYER_RE = re.compile("extras|total|did not bat|fall of wickets|yet to bat")
+_MARKERS_RE = re.compile(r"\((?:c|wk|c\s*&\s*wk|capt|captain)\)|[†*]")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=65536)
+def canon(label: str) -> str:
+    """Casefolded, dots as spaces, whitespace collapsed (the form the name map is keyed by)."""
+    return _SPACE_RE.sub(" ", label.strip().casefold().replace(".", " "))
+
+
+def clean_label(label: str) -> str:
+    return _SPACE_RE.sub(" ", label.strip())
+
+
+def _normalized(c: str) -> str:
+    """"patil, pradeep (c)" -> "pradeep patil"."""
+    s = _MARKERS_RE.sub(" ", c)
+    if "," in s:
+        last, _, first = s.partition(",")
+        s = f"{first} {last}"
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", s)).strip()
+
+
+class NameIndex:
+    def __init__(self, name_map: dict[str, str], cutoff: float = 0.9, cache_size: int = 65536):
+        self.aliases = {canon(k): v for k, v in name_map.items()}
+        self.cutoff = cutoff
+        self.cache_size = cache_size
+        self.unresolved: Counter[str] = Counter()
+        self.fuzzy: dict[str, str] = {}  # label -> player, for matches beyond the exact lookup
+        self._cache: OrderedDict[str, tuple[str | None, str]] = OrderedDict()
+
+        # Exact targets after normalization: map keys and the full names themselves
+        self._exact = {**{_normalized(k): v for k, v in self.aliases.items()},
+                       **{_normalized(canon(v)): v for v in self.aliases.values()}}
+        # (first initial, surname) -> {player: first names}, for matching misspelt first names
+        self._by_initial_surname: dict[tuple[str, str], dict[str, str]] = {}
+        for player in self._exact.values():
+            tokens = _normalized(canon(player)).split()
+            if len(tokens) > 1:
+                block = self._by_initial_surname.setdefault((tokens[0][0], tokens[-1]), {})
+                block[player] = " ".join(tokens[:-1])
+
+    def resolve(self, label: Any) -> str | None:
+        """Club player for a scorecard label; None for non-player rows (extras, totals, blanks)."""
+        raw = str(label) if label else ""
+        hit = self._cache.get(raw)
+        if hit is None:
+            hit = self._cache[raw] = self._lookup(raw)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(raw)
+        player, how = hit
+        if how == _UNRESOLVED:
+            self.unresolved[player] += 1
+        elif how == _FUZZY:
+            self.fuzzy[clean_label(raw)] = player
+        return player
+
+    def resolve_series(self, s: pd.Series) -> pd.Series:
+        """`resolve` over a column, once per distinct label."""
+        raw = s.where(s.astype(bool), "").astype(str)
+        lookup = {label: self.resolve(label) for label in pd.unique(raw)}
+        return raw.map(lookup).astype(object)
+
+    def _lookup(self, raw: str) -> tuple[str | None, str]:
+        """(player or cleaned label or None, how it was found: exact, fuzzy or unresolved)."""
+        c = canon(raw)
+        if _NON_PLAYER_RE.search(c) or c in ("", "nan", "none"):
+            return None, _EXACT
+        if c in self.aliases:
+            return self.aliases[c] or None, _EXACT
+        player = self._match(_normalized(c))
+        if player is not None:
+            return player, _FUZZY
+        label = clean_label(raw) or None
+        return label, _UNRESOLVED if label else _EXACT
+
+    def _match(self, form: str) -> str | None:
+        tokens = form.split()
+        if not tokens:
+            return None
+        if form in self._exact:
+            return self._exact[form]
+        if len(tokens) == 2 and f"{tokens[1]} {tokens[0]}" in self._exact:  # "Patil Pradeep"
+            return self._exact[f"{tokens[1]} {tokens[0]}"]
+        if len(tokens) < 2:
+            return None  # a lone word ("Umesh") only matches exactly
+        surname = tokens[-1]
+        if all(len(t) == 1 for t in tokens[:-1]):
+            # Initials only: exact key with joined initials ("j k singh" -> "jk singh") or nothing
+            return self._exact.get(f"{''.join(tokens[:-1])} {surname}")
+        # Same surname exactly; only the first names may differ
+        first = " ".join(tokens[:-1])
+        best, best_ratio, runner_up = None, 0.0, 0.0
+        for player, player_first in self._by_initial_surname.get((first[0], surname), {}).items():
+            m = SequenceMatcher(None, first, player_first)
+            if m.real_quick_ratio() < self.cutoff or m.quick_ratio() < self.cutoff:
+                continue
+            r = m.ratio()
+            if r > best_ratio:
+                best, best_ratio, runner_up = player, r, best_ratio
+            elif r > runner_up:
+                runner_up = r
+        # Two near-equal candidates are too close to call
+        return best if best_ratio >= self.cutoff and best_ratio - runner_up > 0.02 else None
+
+    def report(self, top: int = 10) -> str:
+        """Unresolved labels (most frequent first) and labels matched beyond the map keys."""
+        names = ", ".join(f"{n} ({k})" for n, k in self.unresolved.most_common(top))
+        out = f"{len(self.unresolved)} unresolved" + (f": {names}" if names else "")
+        if self.fuzzy:
+            loose = ", ".join(f"{label} -> {player}" for label, player in sorted(self.fuzzy.items())[:top])
+            out += f"; {len(self.fuzzy)} matched outside the map: {loose}"
+        return out
+
+
+_INDEXES_MAX = 4
+_indexes: OrderedDict[str, NameIndex] = OrderedDict()
+
+
+def _map_fingerprint(name_map: dict[str, str]) -> str:
+    """sha1 over the map's items (order-independent)."""
+    return hashlib.sha1(repr(sorted(name_map.items())).encode("utf-8")).hexdigest()
+
+
+def name_index(name_map: dict[str, str]) -> NameIndex:
+    """The compiled index for `name_map`, built once per process per map content (small LRU)."""
+    key = _map_fingerprint(name_map)
+    idx = _indexes.get(key)
+    if idx is None:
+        idx = _indexes[key] = NameIndex(name_map)
+        if len(_indexes) > _INDEXES_MAX:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(key)
+    return idx
@@ -0,0 +1,119 @@
+"""Rebuild every artifact in one command: batting, bowling and fantasy run concurrently.
+
+    python -m ecc_rankings.orchestrate
+
+Blocking work (HTTP, Selenium, pandas) runs on a thread executor while the event loop schedules,
+times out and cancels tasks. The leaderboard pages are published once both batting and bowling
+are in. A timed-out task stops being waited for; its worker thread runs on until its next browser
+call, which raises BrowserClosed once the shared pool has closed (no Chrome is relaunched). The exit status is 0 only when every task succeeded.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from . import run, run_fantasy
+from .config import TASK_TIMEOUT
+from .fetch import Fetcher, make_fetcher
+from .metrics import METRICS
+from .pipeline import BATTING, BOWLING, assemble, run_side
+from .pool import DriverPool
+
+
+@dataclass
+class TaskResult:
+    name: str
+    status: str = "pending"  # ok | failed | timeout | cancelled | skipped
+    seconds: float = 0.0
+    error: str | None = None
+
+
+class Orchestrator:
+    def __init__(self, pool: DriverPool | None = None, timeout: float = TASK_TIMEOUT):
+        self.pool = pool
+        self.timeout = timeout
+        self.results: dict[str, TaskResult] = {}
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ecc-task")
+
+    async def _step(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) on the executor under the task timeout; None unless it succeeded."""
+        result = self.results[name] = TaskResult(name, "running")
+        start = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(self._executor, fn, *args),
+                                           self.timeout)
+            result.status = "ok"
+            return value
+        except asyncio.TimeoutError:
+            result.status, result.error = "timeout", f"no result after {self.timeout:.0f}s"
+        except asyncio.CancelledError:
+            result.status = "cancelled"
+            raise
+        except Exception as e:
+            result.status, result.error = "failed", f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+        finally:
+            result.seconds = time.perf_counter() - start
+        return None
+
+    async def _leaderboards(self, fetcher: Fetcher, docs_dir: str) -> None:
+        batting, bowling, allr, consumers = run.publishers(docs_dir)
+        bat, bowl = await asyncio.gather(self._step("batting", run_side, fetcher, BATTING, batting),
+                                         self._step("bowling", run_side, fetcher, BOWLING, bowling))
+        if bat is None or bowl is None:
+            self.results["publish"] = TaskResult("publish", "skipped", error="batting or bowling did not finish")
+            return
+
+        def publish():
+            tables = assemble(bat, bowl, allr)
+            for consume in consumers:
+                consume(tables)
+
+        await self._step("publish", publish)
+
+    async def run(self, fetcher: Fetcher, docs_dir: str) -> int:
+        try:
+            # One fetcher (and so one page cache) for every task in the run
+            await asyncio.gather(self._leaderboards(fetcher, docs_dir),
+                                 self._step("fantasy", run_fantasy.main, self.pool, fetcher))
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        return self.exit_status()
+
+    def exit_status(self) -> int:
+        return 0 if self.results and all(r.status == "ok" for r in self.results.values()) else 1
+
+    def report(self) -> str:
+        return "\n".join(f"[ecc] {r.name:<8} {r.status:<9} {r.seconds:6.1f}s" + (f"  {r.error}" if r.error else "")
+                         for r in self.results.values())
+
+
+def main(pool: DriverPool | None = None) -> int:
+    docs_dir = run._abs_docs_dir()
+    os.makedirs(docs_dir, exist_ok=True)
+    METRICS.reset()
+    with DriverPool() if pool is None else nullcontext(pool) as shared, make_fetcher(shared) as fetcher:
+        orch = Orchestrator(shared)
+        try:
+            code = asyncio.run(orch.run(fetcher, docs_dir))
+        except KeyboardInterrupt:
+            for r in orch.results.values():
+                if r.status in ("pending", "running"):
+                    r.status = "cancelled"
+            code = 130
+        print(orch.report())
+    for r in orch.results.values():
+        METRICS.observe(f"task.{r.name}", r.seconds)
+    METRICS.emit("orchestrate", status="ok" if code == 0 else "failed")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""On-disk cache of fetched pages.
+
+Bodies are stored content-addressed (sha256 of the HTML) with their parsed rows/tables beside them
+as JSON (tables as columns + dtypes + values, so loading never executes anything from the cache);
+`index.json` maps each URL to its object plus freshness metadata:
+
+    {url: {"sha", "size", "fetched_at", "last_access", "final", "etag", "last_modified"}}
+
+The index is written every `flush_every` changes and on `flush()` (which `Fetcher.close()` calls),
+not on every `put`; objects are written atomically, so an index entry never points at a torn file.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+import pandas as pd
+
+from .atomic import atomic_write
+from .config import PAGE_CACHE_DIR, PAGE_CACHE_MAX_MB, PAGE_CACHE_TTL
+from .fetch import ALL_ROWS, ROWS, TABLES, Page
+
+
+# One lock per cache directory, so PageCache instances sharing a root never interleave index writes
+_LOCKS: dict[str, threading.RLock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _root_lock(root: str) -> threading.RLock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(os.path.realpath(root), threading.RLock())
+
+
+class PageCache:
+    def __init__(self, root: str, ttl: float = PAGE_CACHE_TTL, max_bytes: int = int(PAGE_CACHE_MAX_MB * 1024 * 1024),
+                 flush_every: int = 100):
+        self.root = root
+        self.ttl = float(ttl)
+        self.max_bytes = int(max_bytes)
+        self.flush_every = flush_every
+        self._index_path = os.path.join(root, "index.json")
+        self._lock = _root_lock(root)
+        self._index: dict[str, dict] = self._load_index()
+        self._dirty = 0  # index changes not yet flushed
+        # Running size of the distinct objects the index points at (URLs may share an object)
+        self._refs: Counter[str] = Counter(e["sha"] for e in self._index.values())
+        self._sizes: dict[str, int] = {e["sha"]: e["size"] for e in self._index.values()}
+        self._bytes = sum(self._sizes.values())
+
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def flush(self) -> None:
+        """Write `index.json` if anything changed since the last flush."""
+        with self._lock:
+            if self._dirty:
+                atomic_write(self._index_path, json.dumps(self._index))
+                self._dirty = 0
+
+    def _changed(self) -> None:
+        self._dirty += 1
+        if self._dirty >= self.flush_every:
+            self.flush()
+
+    def _ref(self, sha: str, size: int) -> None:
+        if self._refs[sha]:
+            self._bytes += size - self._sizes[sha]
+        else:
+            self._bytes += size
+        self._refs[sha] += 1
+        self._sizes[sha] = size
+
+    def _drop(self, url: str) -> bool:
+        """Remove `url` from the index; True if its object is no longer referenced."""
+        sha = self._index.pop(url)["sha"]
+        self._refs[sha] -= 1
+        if self._refs[sha]:
+            return False
+        del self._refs[sha]
+        self._bytes -= self._sizes.pop(sha)
+        return True
+
+    def _obj(self, sha: str, suffix: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], sha + suffix)
+
+    # --- lookup ---
+    def get(self, url: str) -> dict | None:
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None and not os.path.isfile(self._obj(entry["sha"], ".html")):
+                self._drop(url)
+                self._changed()
+                return None
+            if entry is not None:
+                entry["last_access"] = time.time()
+            return entry
+
+    def is_fresh(self, entry: dict, now: float | None = None) -> bool:
+        return bool(entry.get("final")) or ((now or time.time()) - entry["fetched_at"]) < self.ttl
+
+    def load(self, url: str, entry: dict, backend: str = "cache") -> Page:
+        sha = entry["sha"]
+        with open(self._obj(sha, ".html"), encoding="utf-8") as f:
+            page = Page(url, f.read(), backend)
+        try:
+            with open(self._obj(sha, ".rows.json"), encoding="utf-8") as f:
+                page.rows = json.load(f)
+        except (OSError, ValueError):
+            pass
+        try:
+            with open(self._obj(sha, ".tables.json"), encoding="utf-8") as f:
+                page._tables = [_table_from_json(t) for t in json.load(f)]
+        except (OSError, ValueError, TypeError, KeyError):
+            pass  # re-parsed from the HTML on demand
+        return page
+
+    # --- store ---
+    def put(self, page: Page, kind: str, final: bool = False) -> None:
+        if page.backend not in ("http", "browser") or not page.has_data(kind):
+            return
+        sha = hashlib.sha256(page.html.encode("utf-8")).hexdigest()
+        html_path = self._obj(sha, ".html")
+        if not os.path.isfile(html_path):
+            atomic_write(html_path, page.html)
+        if kind in (ROWS, ALL_ROWS):
+            atomic_write(self._obj(sha, ".rows.json"), json.dumps(page.stat_rows()))
+        elif kind == TABLES:
+            try:
+                text = json.dumps([_table_to_json(t) for t in page.tables()])
+            except (TypeError, ValueError):
+                text = None  # cells JSON can't hold: the HTML alone is cached
+            if text is not None:
+                atomic_write(self._obj(sha, ".tables.json"), text)
+        size = sum(os.path.getsize(p) for p in (self._obj(sha, s) for s in _SUFFIXES) if os.path.isfile(p))
+        now = time.time()
+        with self._lock:
+            if page.url in self._index:
+                self._drop(page.url)  # re-pointed below; files are only removed by _evict
+            self._ref(sha, size)
+            self._index[page.url] = {
+                "sha": sha,
+                "size": size,
+                "fetched_at": now,
+                "last_access": now,
+                "final": bool(final),
+                "etag": page.etag,
+                "last_modified": page.last_modified,
+            }
+            self._evict()
+            self._changed()
+
+    def touch(self, url: str) -> None:
+        """Mark a stale entry fresh again after a 304 Not Modified."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None:
+                entry["fetched_at"] = entry["last_access"] = time.time()
+                self._changed()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def _evict(self) -> None:
+        # Least recently used first; an object is deleted once no URL points at it
+        if self._bytes <= self.max_bytes:
+            return
+        for url in sorted(self._index, key=lambda u: self._index[u]["last_access"]):
+            if self._bytes <= self.max_bytes:
+                break
+            sha = self._index[url]["sha"]
+            if self._drop(url):
+                for suffix in _SUFFIXES:
+                    try:
+                        os.remove(self._obj(sha, suffix))
+                    except OSError:
+                        pass
+
+
+_SUFFIXES = (".html", ".rows.json", ".tables.json")
+
+
+def _table_to_json(df: pd.DataFrame) -> dict:
+    multi = isinstance(df.columns, pd.MultiIndex)
+    return {
+        "columns": [list(c) for c in df.columns] if multi else list(df.columns),
+        "multi": multi,
+        "dtypes": [str(t) for t in df.dtypes],
+        "values": [df.iloc[:, i].tolist() for i in range(df.shape[1])],
+    }
+
+
+def _table_from_json(data: dict) -> pd.DataFrame:
+    columns = data["columns"]
+    df = pd.DataFrame({i: pd.Series(v, dtype=t) for i, (v, t) in enumerate(zip(data["values"], data["dtypes"]))})
+    if data["multi"]:
+        df.columns = pd.MultiIndex.from_tuples([tuple(c) for c in columns])
+    elif columns:
+        df.columns = pd.Index(columns)
+    return df
+
+
+def default_page_cache() -> PageCache | None:
+    """PageCache at PAGE_CACHE_DIR, or None when caching is disabled."""
+    return PageCache(PAGE_CACHE_DIR) if PAGE_CACHE_DIR else None
@@ -0,0 +1,68 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .config import LAZY_LOAD_TIMEOUT, PAGE_READY_POLL, PAGE_READY_TIMEOUT, STATS_ROWS_XPATH
+from .metrics import count, timer
+
+# Locators that signal a page has rendered its data
+STATS_ROWS = (By.XPATH, STATS_ROWS_XPATH)
+SCORECARD_TABLE = (By.TAG_NAME, "table")
+MATCH_LINKS = (By.CSS_SELECTOR, "a[href*='/match/'], a[href*='period=']")
+
+def _present(driver, locators: tuple[tuple[str, str], ...], min_count: int) -> bool:
+    return any(len(driver.find_elements(by, value)) >= min_count for by, value in locators)
+
+
+def wait_until_ready(driver, locators: tuple[tuple[str, str], ...], timeout: float | None = None,
+                     poll: float | None = None, min_count: int = 1) -> float | None:
+    """Poll until any locator matches at least `min_count` elements.
+
+    Returns the seconds waited, or None if `timeout` expired first. Drivers without
+    element lookup (static HTML stand-ins) are treated as ready immediately.
+    """
+    if not hasattr(driver, "find_elements"):
+        return 0.0
+    timeout = PAGE_READY_TIMEOUT if timeout is None else timeout
+    poll = PAGE_READY_POLL if poll is None else poll
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(lambda d: _present(d, locators, min_count))
+    except TimeoutException:
+        return None
+    return time.perf_counter() - start
+
+
+def load_page(driver, url: str, locators: tuple[tuple[str, str], ...], timeout: float | None = None,
+              poll: float | None = None, min_count: int = 1) -> float | None:
+    """driver.get(url) and wait for readiness; time-to-ready is recorded as the "page_ready" stage.
+
+    A timeout is not an error (it is counted as page_ready.timeouts): the caller reads whatever
+    has rendered so far.
+    """
+    driver.get(url)
+    with timer("page_ready"):
+        elapsed = wait_until_ready(driver, locators, timeout=timeout, poll=poll, min_count=min_count)
+    if elapsed is None:
+        count("page_ready.timeouts")
+        print(f"[ecc] Not ready after {PAGE_READY_TIMEOUT if timeout is None else timeout:.1f}s, reading as-is: {url}")
+    else:
+        print(f"[ecc] Ready in {elapsed:.2f}s: {url}")
+    return elapsed
+
+
+def scroll_until_stable(driver, locator: tuple[str, str], timeout: float | None = None, poll: float | None = None,
+                        max_rounds: int = 200) -> int:
+    """Scroll to the bottom until no more `locator` elements lazy-load within `timeout`; returns the final count."""
+    if not hasattr(driver, "execute_script"):
+        return 0
+    timeout = LAZY_LOAD_TIMEOUT if timeout is None else timeout
+    n_rows = len(driver.find_elements(*locator))
+    for _ in range(max_rounds):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        if wait_until_ready(driver, (locator,), timeout=timeout, poll=poll, min_count=n_rows + 1) is None:
+            break
+        n_rows = len(driver.find_elements(*locator))
+    return n_rows
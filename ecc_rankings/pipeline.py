@@ -0,0 +1,174 @@
+"""Staged leaderboard pipeline: fetch -> parse -> normalize -> score -> render.
+
+Fetch and parse are generators joined by bounded buffers, so klasse pages keep downloading while
+earlier ones are parsed, and never more than `depth` pages wait in memory. Normalize and score
+are the barrier (scoring merges players across klassen), and each scored table is computed once
+in a `SeasonTables` that every consumer (HTML pages, all-rounder board, store, ...) reads.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import Callable, Iterable, Iterator, TypeVar
+
+import pandas as pd
+
+from .all_rounder import AllRounderLeaderboard
+from .batting import BattingScraper
+from .bowling import BowlingScraper
+from .config import BATTING_URLS, BOWLING_URLS, FULL_LEAGUE, HTTP_POOL_SIZE
+from .fetch import ROWS, Fetcher, Page
+from .league import club_rows, iter_league_pages
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BATTING, BOWLING = "batting", "bowling"
+
+
+@dataclass
+class SeasonTables:
+    batting_rows: pd.DataFrame    # as scraped (whole league in full mode)
+    bowling_rows: pd.DataFrame
+    batting: pd.DataFrame         # club rows merged + scored once (combine_and_score)
+    bowling: pd.DataFrame         # club rows scored once (calculate_icc_points)
+    allrounder: pd.DataFrame
+
+
+def bounded_map(fn: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """Lazy, ordered `map` on a thread pool with at most `workers` calls in flight ahead of the consumer."""
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        pending: deque = deque()
+        for item in items:
+            pending.append(ex.submit(fn, item))
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+_DONE = object()
+
+
+def prefetch(items: Iterable[T], depth: int) -> Iterator[T]:
+    """Drive `items` on a background thread, buffering at most `depth` results ahead of the consumer.
+
+    If the consumer stops early (break, exception, close()), the producer stops after the item it
+    is working on instead of blocking on a full buffer forever.
+    """
+    buf: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def _put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buf.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce():
+        try:
+            for item in items:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:  # re-raised in the consumer
+            _put((_DONE, e))
+            return
+        _put((_DONE, None))
+
+    threading.Thread(target=_produce, daemon=True, name="ecc-prefetch").start()
+    try:
+        while True:
+            item, err = buf.get()
+            if item is _DONE:
+                if err is not None:
+                    raise err
+                return
+            yield item
+    finally:
+        stop.set()
+        # Free a producer waiting on the full buffer right away
+        while True:
+            try:
+                buf.get_nowait()
+            except queue.Empty:
+                break
+
+
+# --- stages ---
+def fetch_stage(fetcher: Fetcher, full: bool = FULL_LEAGUE, depth: int = HTTP_POOL_SIZE,
+                sides: tuple[str, ...] = (BOWLING, BATTING)) -> Iterator[tuple[str, str, Page]]:
+    """(side, klasse, page) for every klasse page of each side in turn, in URL order."""
+    urls = {BOWLING: BOWLING_URLS, BATTING: BATTING_URLS}
+    if full:
+        pages = chain.from_iterable(((side, k, p) for k, p in iter_league_pages(fetcher, urls[side])) for side in sides)
+        return prefetch(pages, depth)
+    jobs = [(side, k, u) for side in sides for k, u in urls[side].items()]
+    return bounded_map(lambda job: (job[0], job[1], fetcher.fetch_all([job[2]], kind=ROWS)[0]), jobs, depth)
+
+
+def parse_stage(pages: Iterable[tuple[str, str, Page]], scrapers: dict[str, BattingScraper | BowlingScraper],
+                full: bool = FULL_LEAGUE) -> Iterator[tuple[str, dict]]:
+    """(side, row dict) for every stats row, as each page arrives."""
+    for side, klasse, page in pages:
+        for row in scrapers[side]._parse_klasse(klasse, page.stat_rows(), full=full):
+            yield side, row
+
+
+def normalize_stage(rows: Iterable[tuple[str, dict]], sides: tuple[str, ...] = (BOWLING, BATTING),
+                    chunk_rows: int = 5000) -> dict[str, pd.DataFrame]:
+    """Collect rows into one frame per side (the pipeline's barrier).
+
+    Rows are packed into columnar chunks of `chunk_rows` as they arrive, so a full league never
+    sits in memory as one dict per row.
+    """
+    pending: dict[str, list[dict]] = {side: [] for side in sides}
+    chunks: dict[str, list[pd.DataFrame]] = {side: [] for side in sides}
+    for side, row in rows:
+        pending[side].append(row)
+        if len(pending[side]) >= chunk_rows:
+            chunks[side].append(pd.DataFrame(pending[side]))
+            pending[side] = []
+    out = {}
+    for side in sides:
+        if pending[side] or not chunks[side]:
+            chunks[side].append(pd.DataFrame(pending[side]))
+        out[side] = chunks[side][0] if len(chunks[side]) == 1 else pd.concat(chunks[side], ignore_index=True)
+    return out
+
+
+def score_side(side: str, frame: pd.DataFrame, scraper: BattingScraper | BowlingScraper) -> pd.DataFrame:
+    club = club_rows(frame)
+    return scraper.combine_and_score(club) if side == BATTING else scraper.calculate_icc_points(club)
+
+
+def run_side(fetcher: Fetcher, side: str, scraper: BattingScraper | BowlingScraper,
+             full: bool = FULL_LEAGUE) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """One side's (raw rows, scored club table), e.g. to run batting and bowling as separate tasks."""
+    rows = parse_stage(fetch_stage(fetcher, full=full, sides=(side,)), {side: scraper}, full=full)
+    frame = normalize_stage(rows, sides=(side,))[side]
+    return frame, score_side(side, frame, scraper)
+
+
+def assemble(batting: tuple[pd.DataFrame, pd.DataFrame], bowling: tuple[pd.DataFrame, pd.DataFrame],
+             allrounder: AllRounderLeaderboard) -> SeasonTables:
+    """SeasonTables from each side's (raw rows, scored table); the all-rounder board is computed here."""
+    return SeasonTables(batting[0], bowling[0], batting[1], bowling[1], allrounder.compute(batting[1], bowling[1]))
+
+
+def run_pipeline(fetcher: Fetcher, batting: BattingScraper, bowling: BowlingScraper, allrounder: AllRounderLeaderboard,
+                 consumers: Iterable[Callable[[SeasonTables], None]] = (), full: bool = FULL_LEAGUE) -> SeasonTables:
+    """Run every stage once and hand the scored tables to each consumer in turn."""
+    scrapers = {BATTING: batting, BOWLING: bowling}
+    frames = normalize_stage(parse_stage(fetch_stage(fetcher, full=full), scrapers, full=full))
+    tables = assemble(*((frames[side], score_side(side, frames[side], scrapers[side])) for side in (BATTING, BOWLING)),
+                      allrounder)
+    for consume in consumers:
+        consume(tables)
+    return tables
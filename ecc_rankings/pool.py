@@ -0,0 +1,84 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from .config import CHROME_PATH, DRIVER_POOL_SIZE, HEADLESS, WINDOW_SIZE
+from .driver import BrowserClosed, BrowserSession, get_driver
+
+
+class DriverPool:
+    """Bounded pool of browser sessions shared by every scraper in a run.
+
+    Sessions are started lazily (never more than `size`, never more than there is work for)
+    and reused across `map` calls until `close()`. A session is only relaunched after a
+    WebDriver error (see `BrowserSession.run`). After `close()` every acquire or relaunch raises
+    BrowserClosed, so work abandoned by a timed-out caller cannot start browsers outside the pool.
+    """
+
+    def __init__(self, size: int = DRIVER_POOL_SIZE, factory: Callable[[], Any] | None = None):
+        self.size = max(1, int(size))
+        self._factory = factory or (lambda: get_driver(CHROME_PATH, HEADLESS, WINDOW_SIZE))
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._sessions: list[BrowserSession] = []
+        self._lock = threading.Lock()
+        self.closed = threading.Event()
+
+    def _acquire(self) -> BrowserSession:
+        # Concurrent map() calls (e.g. leaderboards and fantasy at once) share the `size` sessions
+        while not self.closed.is_set():
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if len(self._sessions) < self.size and not self.closed.is_set():
+                    session = BrowserSession(self._factory, closed=self.closed)
+                    self._sessions.append(session)
+                    return session
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        raise BrowserClosed("driver pool is closed")
+
+    @property
+    def launches(self) -> int:
+        return sum(s.launches for s in self._sessions)
+
+    def map(self, fn: Callable[[Any, Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Run fn(driver, item) for every item concurrently; results keep the input order."""
+        items = list(items)
+        if not items:
+            return []
+
+        def _run(item):
+            session = self._acquire()
+            try:
+                return session.run(fn, item)
+            finally:
+                self._idle.put(session)
+
+        with ThreadPoolExecutor(max_workers=min(self.size, len(items))) as ex:
+            return list(ex.map(_run, items))
+
+    def close(self):
+        with self._lock:
+            self.closed.set()
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def map_with_pool(pool: DriverPool | None, fn: Callable[[Any, Any], Any], items: Iterable[Any]) -> list[Any]:
+    """pool.map(...) on a shared pool, or on a throwaway pool closed before returning."""
+    if pool is not None:
+        return pool.map(fn, items)
+    with DriverPool() as own:
+        return own.map(fn, items)
@@ -0,0 +1,198 @@
+"""Shared HTML renderer for the leaderboard pages.
+
+Table markup matches `DataFrame.to_html(index=False, escape=False)` cell for cell, but the header
+(with sortable columns marked for Tablesort) and the row pattern are compiled once per column
+set, cells are formatted a column at a time, and pages are produced as a stream of chunks.
+`write_if_changed` streams those chunks to disk and only replaces a file whose bytes differ, so
+unchanged pages keep their mtime and are not re-deployed.
+
+Tables longer than `page_rows` are paged: the HTML holds the first page, every row goes to
+`<page>.ndjson` (one JSON array of cell strings per line) and `<page>.index.json` holds the row
+order for each sortable column, computed here so the browser never sorts the full table.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+import pandas as pd
+from pandas.io.formats.format import format_array
+
+from .atomic import AtomicFile
+from .metrics import METRICS, count
+
+# Marks where a page's table goes in its template text
+TABLE_SLOT = "<!--ecc:table-->"
+
+_TABLE_OPEN = '<table border="1" class="dataframe">\n  <thead>\n    <tr style="text-align: right;">\n'
+
+
+@lru_cache(maxsize=64)
+def _compiled(columns: tuple[str, ...], sortable: frozenset[str], method: str = "number") -> tuple[str, str]:
+    head = _TABLE_OPEN + "".join(
+        f'      <th data-sort-method="{method}">{c}</th>\n' if c in sortable else f"      <th>{c}</th>\n" for c in columns
+    ) + "    </tr>\n  </thead>\n  <tbody>\n"
+    row = "    <tr>\n" + "      <td>{}</td>\n" * len(columns) + "    </tr>\n"
+    return head, row
+
+
+def _cells(values) -> list[str]:
+    return [v.strip() for v in format_array(values, None, leading_space=False)]
+
+
+def _columns(df: pd.DataFrame) -> list[list[str]]:
+    return [_cells(df.iloc[:, i]._values) for i in range(df.shape[1])]
+
+
+def iter_table(df: pd.DataFrame, sortable: Iterable[str] = (), chunk_rows: int = 500,
+               method: str = "number") -> Iterator[str]:
+    """The table as chunks of at most `chunk_rows` rows."""
+    head, row = _compiled(tuple(str(c) for c in df.columns), frozenset(sortable), method)
+    yield head
+    cols = _columns(df)
+    for start in range(0, len(df), chunk_rows):
+        yield "".join(row.format(*cells) for cells in zip(*(c[start:start + chunk_rows] for c in cols)))
+    yield "  </tbody>\n</table>"
+
+
+class PageTemplate:
+    """Page text split once around its TABLE_SLOT."""
+
+    def __init__(self, text: str):
+        self.head, _, self.tail = text.partition(TABLE_SLOT)
+
+    def stream(self, body: Iterable[str]) -> Iterator[str]:
+        yield self.head
+        yield from body
+        yield self.tail
+
+
+def _file_sha256(path: str) -> str | None:
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                h.update(block)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def write_if_changed(path: str, chunks: Iterable[str] | str) -> bool:
+    """Stream `chunks` to `path` unless the file already holds exactly those bytes. Returns True if written.
+
+    Time spent producing chunks is recorded as the "render" stage, the rest as "write".
+    """
+    start, rendering = time.perf_counter(), 0.0
+    with AtomicFile(path) as f:
+        chunks = iter([chunks] if isinstance(chunks, str) else chunks)
+        while True:
+            t = time.perf_counter()
+            chunk = next(chunks, None)
+            rendering += time.perf_counter() - t
+            if chunk is None:
+                break
+            f.write(chunk)
+        f.close()
+        changed = _file_sha256(f.tmp) != _file_sha256(path)
+        if not changed:
+            f.discard()
+    METRICS.observe("render", rendering)
+    METRICS.observe("write", time.perf_counter() - start - rendering)
+    count("files.written" if changed else "files.unchanged")
+    return changed
+
+
+# --- paged output ---
+# Reads the NDJSON rows and sort index named on #ecc-pager; headers are marked data-sort-method="none"
+# so Tablesort leaves them to this loader.
+_LOADER = """<script>
+(async () => {
+  const nav = document.getElementById("ecc-pager");
+  const meta = await (await fetch(nav.dataset.index)).json();
+  const rows = (await (await fetch(nav.dataset.rows)).text()).split("\\n").filter(Boolean).map(l => JSON.parse(l));
+  const tbody = document.querySelector("table.dataframe tbody");
+  let order = [...rows.keys()], page = 0;
+  const pages = () => Math.max(1, Math.ceil(order.length / meta.pageRows));
+  function show() {
+    tbody.innerHTML = order.slice(page * meta.pageRows, (page + 1) * meta.pageRows)
+      .map(i => "<tr>" + rows[i].map(c => "<td>" + c + "</td>").join("") + "</tr>").join("");
+    nav.querySelector("span").textContent = (page + 1) + " / " + pages();
+  }
+  document.querySelectorAll("table.dataframe th").forEach((th, j) => {
+    const by = meta.order[meta.columns[j]];
+    if (!by) return;
+    th.addEventListener("click", () => {
+      const desc = th.dataset.dir !== "desc";
+      th.dataset.dir = desc ? "desc" : "asc";
+      order = desc ? by : [...by].reverse();
+      page = 0; show();
+    });
+  });
+  nav.querySelectorAll("button").forEach(b => b.addEventListener("click", () => {
+    page = Math.min(pages() - 1, Math.max(0, page + Number(b.dataset.step))); show();
+  }));
+  show();
+})();
+</script>"""
+
+
+def is_paged(df: pd.DataFrame, page_rows: int) -> bool:
+    return bool(page_rows) and len(df) > page_rows
+
+
+def data_paths(html_path: str) -> tuple[str, str]:
+    """(rows, index) file paths written next to a paged page."""
+    root = os.path.splitext(html_path)[0]
+    return root + ".ndjson", root + ".index.json"
+
+
+def iter_ndjson(df: pd.DataFrame, chunk_rows: int = 500) -> Iterator[str]:
+    """One JSON array of formatted cells per row (the same strings as the HTML table)."""
+    cols = _columns(df)
+    for start in range(0, len(df), chunk_rows):
+        yield "".join(json.dumps(list(cells), ensure_ascii=False) + "\n"
+                      for cells in zip(*(c[start:start + chunk_rows] for c in cols)))
+
+
+def sort_index(df: pd.DataFrame, columns: Iterable[str]) -> dict[str, list[int]]:
+    """Row positions ordered by each column, highest first (ties keep table order, blanks last)."""
+    d = df.reset_index(drop=True)
+    return {c: d[c].sort_values(ascending=False, kind="stable", na_position="last").index.tolist()
+            for c in columns if c in d.columns}
+
+
+def paged_body(df: pd.DataFrame, html_path: str, page_rows: int) -> Iterator[str]:
+    """First page as a static table, then the pager and the loader for the remaining rows."""
+    rows, index = (os.path.basename(p) for p in data_paths(html_path))
+    yield from iter_table(df.iloc[:page_rows], [str(c) for c in df.columns], method="none")
+    n_pages = -(-len(df) // page_rows)
+    yield (f'\n<div id="ecc-pager" data-rows="{rows}" data-index="{index}">'
+           f'<button data-step="-1">&lsaquo;</button> <span>1 / {n_pages}</span> '
+           f'<button data-step="1">&rsaquo;</button></div>\n')
+    yield _LOADER
+
+
+def table_body(df: pd.DataFrame, sortable: Iterable[str], html_path: str, page_rows: int = 0) -> Iterator[str]:
+    """The whole table, or `paged_body` once it is longer than `page_rows`."""
+    if is_paged(df, page_rows):
+        return paged_body(df, html_path, page_rows)
+    return iter_table(df, sortable)
+
+
+def publish_table(html_path: str, page: PageTemplate, df: pd.DataFrame, sortable: Iterable[str],
+                  page_rows: int = 0) -> bool:
+    """Write the page (plus its rows and sort index when paged); True if any file changed."""
+    changed = False
+    if is_paged(df, page_rows):
+        rows_path, index_path = data_paths(html_path)
+        sortable = list(sortable)
+        meta = {"columns": [str(c) for c in df.columns], "rows": len(df), "pageRows": page_rows,
+                "order": sort_index(df, sortable)}
+        changed |= write_if_changed(rows_path, iter_ndjson(df))
+        changed |= write_if_changed(index_path, json.dumps(meta, ensure_ascii=False, separators=(",", ":")))
+    return write_if_changed(html_path, page.stream(table_body(df, sortable, html_path, page_rows))) | changed
@@ -0,0 +1,49 @@
+"""Record/replay of fetched pages, so scrapers and fantasy scoring run without Chrome or network.
+
+A record run (ECC_RECORD=1) writes one JSON snapshot per URL with its page source and rendered
+row text; a replay run (ECC_FETCH_MODE=replay) serves those snapshots back from disk.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from .atomic import atomic_write
+from .config import FETCH_MODE, RECORD_SNAPSHOTS, SNAPSHOT_DIR
+from .fetch import Page
+
+
+class SnapshotStore:
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.root, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def save(self, page: Page) -> None:
+        if page.backend in ("none", "replay"):
+            return
+        snap = {"url": page.url, "backend": page.backend, "html": page.html, "rows": page.stat_rows()}
+        atomic_write(self._path(page.url), json.dumps(snap, ensure_ascii=False))
+
+    def load(self, url: str) -> Page | None:
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                snap = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return Page(url, snap.get("html", ""), "replay", rows=snap.get("rows"))
+
+    def urls(self) -> list[str]:
+        out = []
+        for name in sorted(os.listdir(self.root)) if os.path.isdir(self.root) else []:
+            if name.endswith(".json"):
+                with open(os.path.join(self.root, name), encoding="utf-8") as f:
+                    out.append(json.load(f)["url"])
+        return out
+
+
+def default_snapshot_store() -> SnapshotStore | None:
+    """SnapshotStore at SNAPSHOT_DIR when recording or replaying, else None."""
+    return SnapshotStore(SNAPSHOT_DIR) if RECORD_SNAPSHOTS or FETCH_MODE == "replay" else None
@@ -1,5 +1,6 @@
 # ecc_rankings/run.py
 import os, sys, traceback
+from contextlib import nullcontext
 
 # --- import shim so it works as module or script ---
 if __package__ in (None, "",):
@@ -8,11 +9,23 @@ if __package__ in (None, "",):
     from ecc_rankings.bowling import BowlingScraper
     from ecc_rankings.batting import BattingScraper
     from ecc_rankings.all_rounder import AllRounderLeaderboard  # adjust name if your file is allrounder.py
+    from ecc_rankings.pool import DriverPool
+    from ecc_rankings.fetch import make_fetcher
+    from ecc_rankings.store import default_store
+    from ecc_rankings.pipeline import SeasonTables, run_pipeline
+    from ecc_rankings.render import write_if_changed
+    from ecc_rankings.metrics import METRICS
 else:
     from .config import OUTPUT_DIR as OUTPUT_DIR_CFG, SEASON, CLUB_NAME
     from .bowling import BowlingScraper
     from .batting import BattingScraper
     from .all_rounder import AllRounderLeaderboard
+    from .pool import DriverPool
+    from .fetch import make_fetcher
+    from .store import default_store
+    from .pipeline import SeasonTables, run_pipeline
+    from .render import write_if_changed
+    from .metrics import METRICS
 
 def _abs_docs_dir():
     # Put docs alongside the package directory, not wherever you launched Python
@@ -21,47 +34,47 @@ def _abs_docs_dir():
     out = os.environ.get("ECC_OUTPUT_DIR", OUTPUT_DIR_CFG or "docs")
     return out if os.path.isabs(out) else os.path.join(root_dir, out)
 
-def _write(path: str, content: str):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✔ Wrote {path} ({os.path.getsize(path)} bytes)")
+def _write(path: str, content):
+    # content: a string or an iterable of chunks; an identical file is left untouched
+    _report(path, write_if_changed(path, content))
 
-def main():
-    docs_dir = _abs_docs_dir()
-    print(f"[ecc] CWD: {os.getcwd()}")
-    print(f"[ecc] Repo docs dir: {docs_dir}")
-    os.makedirs(docs_dir, exist_ok=True)
+def _report(path: str, changed: bool):
+    if changed:
+        print(f"✔ Wrote {path} ({os.path.getsize(path)} bytes)")
+    else:
+        print(f"= Unchanged {path}")
 
+def publishers(docs_dir: str):
+    """(batting, bowling, all-rounder, consumers) writing every leaderboard artifact into docs_dir."""
     bowling_out = os.path.join(docs_dir, f"kncb_bowling_stats_{SEASON}.html")
     batting_out = os.path.join(docs_dir, f"kncb_batting_stats_{SEASON}.html")
     allr_out    = os.path.join(docs_dir, f"kncb_allrounder_stats_{SEASON}.html")
 
-    try:
-        bowling = BowlingScraper(html_path=bowling_out)
-        batting = BattingScraper(html_path=batting_out)
-
-        # --- Scrape ---
-        df_bowling = bowling.scrape()
-        df_batting = batting.scrape()
-        print(f"[ecc] Bowling rows: {df_bowling.shape}")
-        print(f"[ecc] Batting rows: {df_batting.shape}")
-
-        # --- Pages ---
-        _write(bowling_out, bowling.generate_html(df_bowling))
-        _write(batting_out, batting.generate_html(df_batting))
-
-        # --- All-rounder: merged batting + scored bowling ---
-        df_bat_merged  = batting.combine_and_score(df_batting)
-        df_bowl_scored = bowling.calculate_icc_points(df_bowling)
-        print(f"[ecc] Merged batting rows (unique players): {df_bat_merged.shape}")
-
-        allr = AllRounderLeaderboard(season=SEASON, club=CLUB_NAME, html_path=allr_out)
-        df_allr = allr.compute(df_bat_merged, df_bowl_scored)
-        _write(allr_out, allr.generate_html(df_allr))
-
-        # --- index.html ---
-        index_html = f"""<!doctype html>
+    bowling = BowlingScraper(html_path=bowling_out)
+    batting = BattingScraper(html_path=batting_out)
+    allr = AllRounderLeaderboard(season=SEASON, club=CLUB_NAME, html_path=allr_out)
+    store = default_store()
+
+    # --- Consumers: each reads the tables scored once by the pipeline ---
+    def write_pages(t: "SeasonTables"):
+        # Boards longer than PAGE_ROWS also get <page>.ndjson + <page>.index.json
+        _report(bowling_out, bowling.write_html(t.bowling))
+        _report(batting_out, batting.write_html(t.batting))
+        _report(allr_out, allr.write_html(t.allrounder))
+        write_index(docs_dir)
+
+    def write_store(t: "SeasonTables"):
+        # Raw rows are the whole league in full-league mode
+        store.write("batting_raw", t.batting_rows)
+        store.write("bowling_raw", t.bowling_rows)
+        store.write("batting_scored", t.batting)
+        store.write("bowling_scored", t.bowling)
+        print(f"[ecc] Season store updated: {store.root}")
+
+    return batting, bowling, allr, [write_pages] + ([write_store] if store is not None else [])
+
+def write_index(docs_dir: str):
+    index_html = f"""<!doctype html>
                     <html><head>
                       <meta charset="utf-8" />
                       <title>ECC Rankings {SEASON}</title>
@@ -74,7 +87,26 @@ def main():
                       <p style="color:#666">Generated by ecc_rankings.</p>
                     </body></html>
                 """
-        _write(os.path.join(docs_dir, "index.html"), index_html)
+    _write(os.path.join(docs_dir, "index.html"), index_html)
+
+def main(pool: "DriverPool | None" = None):
+    docs_dir = _abs_docs_dir()
+    print(f"[ecc] CWD: {os.getcwd()}")
+    print(f"[ecc] Repo docs dir: {docs_dir}")
+    os.makedirs(docs_dir, exist_ok=True)
+
+    try:
+        batting, bowling, allr, consumers = publishers(docs_dir)
+
+        # --- Fetch -> parse -> score (one browser pool for the whole run; a caller-owned pool is left open) ---
+        with DriverPool() if pool is None else nullcontext(pool) as shared, make_fetcher(shared) as fetcher:
+            tables = run_pipeline(fetcher, batting, bowling, allr, consumers=consumers)
+            print(f"[ecc] Pages served by: {fetcher.report()}; browser launches: {shared.launches}")
+        print(f"[ecc] Bowling rows: {tables.bowling_rows.shape}")
+        print(f"[ecc] Batting rows: {tables.batting_rows.shape}")
+        print(f"[ecc] Merged batting rows (unique players): {tables.batting.shape}")
+        METRICS.count("rows.batting", len(tables.batting_rows))
+        METRICS.count("rows.bowling", len(tables.bowling_rows))
 
         print("\nAll done 🎉 Open this folder in Explorer:")
         print(docs_dir)
@@ -85,4 +117,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    METRICS.run("leaderboards", main)
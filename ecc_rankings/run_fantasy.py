@@ -1,9 +1,17 @@
 import os
-from .config import OUTPUT_DIR, SEASON
+from contextlib import nullcontext
+from .config import DRIVER_POOL_SIZE, FIXTURES_URL, OUTPUT_DIR, SEASON
+from .discovery import discover_scorecards
+from .fantasy_ledger import default_fantasy_ledger
 from .fantasy_points import save_fantasy_points_json
+from .fetch import Fetcher, make_fetcher
+from .metrics import METRICS
+from .pool import DriverPool
+from .store import default_store
 
 
-def main():
+def main(pool: DriverPool | None = None, fetcher: Fetcher | None = None):
+    """Score every scorecard and write the fantasy JSON; `fetcher` (e.g. the orchestrator's) is used and left open."""
     root = os.path.dirname(os.path.dirname(__file__))
     out_dir = os.environ.get("ECC_OUTPUT_DIR", OUTPUT_DIR)
     if not os.path.isabs(out_dir):
@@ -11,9 +19,24 @@ def main():
     os.makedirs(out_dir, exist_ok=True)
 
     out = os.path.join(out_dir, f"ecc_fantasy_points_{SEASON}.json")
-    save_fantasy_points_json(path=out)
+    ledger = default_fantasy_ledger()
+    # One pool for every browser fallback (fixture pages, match pages, scorecards), as run.main does
+    with DriverPool(DRIVER_POOL_SIZE) if pool is None else nullcontext(pool) as shared, \
+            make_fetcher(shared) if fetcher is None else nullcontext(fetcher) as fetcher:
+        urls = {}
+        if FIXTURES_URL:
+            seen = ledger.matches() if ledger else frozenset()
+            found = discover_scorecards(fetcher, seen_matches=seen)
+            # Nothing found and nothing already in the ledger (site layout changed, offline, tabs not
+            # recognised): keep the configured lists. A week with no new matches scores no new innings;
+            # the ledger's totals are still written.
+            if found.batting_urls or found.bowling_urls or any(m in seen for m in found.matches):
+                urls = {"batting_urls": found.batting_urls, "bowling_urls": found.bowling_urls}
+            else:
+                print("[ecc] Discovery found no innings and no match in the ledger; using SCORECARD_*_URLS")
+        save_fantasy_points_json(path=out, pool=shared, fetcher=fetcher, store=default_store(), ledger=ledger, **urls)
     print(f"Saved fantasy points: {out}")
 
 
 if __name__ == "__main__":
-    main()
+    METRICS.run("fantasy", main)
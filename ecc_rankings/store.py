@@ -0,0 +1,124 @@
+"""Partitioned columnar store (Parquet) for raw and scored rows.
+
+Each table lives under `<root>/<table>/` as a hive-partitioned dataset, e.g.
+`batting_raw/Season=2025/Klasse=Eerste_Klasse/batting_raw-0.parquet`. Writing a frame replaces
+the partitions it covers, so re-running a season is idempotent. Frames without a Season column
+(e.g. scored tables aggregated across klasses) are written under the store's season. Reads prune columns and push
+filters down to the partition directories and Parquet row groups.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from .config import SEASON, STORE_DIR
+from .metrics import timed
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    partition_by: tuple[str, ...]
+    types: dict[str, pa.DataType] = field(default_factory=dict)
+
+
+_INT, _FLOAT, _STR = pa.int64(), pa.float64(), pa.string()
+
+TABLES: dict[str, TableSpec] = {
+    "batting_raw": TableSpec(("Season", "Klasse"), {
+        "KNCB Ranking": _INT, "Player": _STR, "Team": _STR, "matches": _INT, "innings": _INT, "not_outs": _INT,
+        "Runs": _INT, "highest": _STR, "average": _FLOAT, "strike_rate": _FLOAT,
+    }),
+    "batting_scored": TableSpec(("Season",), {
+        "Player": _STR, "Runs": _INT, "innings": _INT, "not_outs": _INT, "matches": _INT, "highest": _INT,
+        "average": _FLOAT, "strike_rate": _FLOAT, "Klasse Mix": _STR, "Klasse Weight": _FLOAT, "Points": _INT,
+    }),
+    "bowling_raw": TableSpec(("Season", "Klasse"), {
+        "KNCB Ranking": _INT, "Player": _STR, "Team": _STR, "Matches": _INT, "Wickets": _INT, "Best": _STR,
+        "Avg": _FLOAT, "Eco": _FLOAT, "Strike Rate": _FLOAT,
+    }),
+    "bowling_scored": TableSpec(("Season", "Klasse"), {
+        "KNCB Ranking": _INT, "Player": _STR, "Matches": _INT, "Wickets": _INT, "Best": _STR,
+        "Avg": _FLOAT, "Eco": _FLOAT, "Strike Rate": _FLOAT, "matches": _INT, "BestWkts": _INT, "Points": _INT,
+    }),
+    # One row per player per scorecard period, before merging across matches
+    "fantasy_innings": TableSpec(("Season", "match_id"), {
+        "player_name": _STR, "period": _STR, "side": _STR, "runs": _INT, "Four": _INT, "Sixes": _INT, "Balls": _INT,
+        "Overs": _FLOAT, "Maiden": _INT, "Runs": _INT, "Economy": _FLOAT, "wickets": _INT,
+    }),
+    "fantasy_points": TableSpec(("Season",), {
+        "player_name": _STR, "team_name": _STR, "runs": _INT, "Overs": _FLOAT, "Economy": _FLOAT,
+        "wickets": _INT, "fantasy_points": _INT,
+    }),
+}
+
+
+def _typed(df: pd.DataFrame, spec: TableSpec) -> pa.Table:
+    d = df.copy()
+    for col in spec.partition_by:
+        d[col] = d[col].astype(str)
+    schema = []
+    for col in d.columns:
+        typ = spec.types.get(col)
+        if typ == _INT:
+            d[col] = pd.to_numeric(d[col].astype(str).str.extract(r"(-?\d+)", expand=False), errors="coerce").astype("Int64")
+        elif typ == _FLOAT:
+            d[col] = pd.to_numeric(d[col], errors="coerce").astype(float)
+        elif typ == _STR or col in spec.partition_by:
+            typ = _STR
+            d[col] = d[col].astype("string")
+        schema.append(pa.field(str(col), typ) if typ is not None else None)
+    table = pa.Table.from_pandas(d, preserve_index=False)
+    return table.cast(pa.schema([f or table.schema.field(i) for i, f in enumerate(schema)]))
+
+
+class SeasonStore:
+    def __init__(self, root: str = STORE_DIR, season: str = SEASON):
+        self.root = root
+        self.season = season
+
+    def _partitioning(self, spec: TableSpec) -> ds.Partitioning:
+        return ds.partitioning(pa.schema([(c, _STR) for c in spec.partition_by]), flavor="hive")
+
+    @timed("write.store")
+    def write(self, table: str, df: pd.DataFrame) -> str:
+        """Write `df` into `table`, replacing the partitions it covers. Returns the table directory."""
+        spec = TABLES[table]
+        base = os.path.join(self.root, table)
+        if df is None or df.empty:
+            return base
+        if "Season" in spec.partition_by and "Season" not in df.columns:
+            df = df.assign(Season=self.season)
+        missing = [c for c in spec.partition_by if c not in df.columns]
+        if missing:
+            raise ValueError(f"{table}: missing partition columns {missing}")
+        ds.write_dataset(
+            _typed(df, spec), base, format="parquet", partitioning=self._partitioning(spec),
+            existing_data_behavior="delete_matching", basename_template=f"{table}-{{i}}.parquet",
+        )
+        return base
+
+    def load(self, table: str, columns: list[str] | None = None,
+             filters: dict[str, Any] | ds.Expression | None = None) -> pd.DataFrame:
+        """Read `table` with column pruning; `filters` is an arrow expression or {column: value | [values]}."""
+        spec = TABLES[table]
+        base = os.path.join(self.root, table)
+        if not os.path.isdir(base):
+            return pd.DataFrame(columns=columns or [])
+        if isinstance(filters, dict):
+            expr = None
+            for col, val in filters.items():
+                term = ds.field(col).isin(list(val)) if isinstance(val, (list, tuple, set)) else ds.field(col) == val
+                expr = term if expr is None else expr & term
+            filters = expr
+        dataset = ds.dataset(base, format="parquet", partitioning=self._partitioning(spec))
+        return dataset.to_table(columns=columns, filter=filters).to_pandas()
+
+
+def default_store() -> SeasonStore | None:
+    """SeasonStore at STORE_DIR, or None when the store is disabled."""
+    return SeasonStore(STORE_DIR) if STORE_DIR else None
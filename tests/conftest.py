@@ -6,3 +6,57 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def translate_path(self, path):
+        # "/dir/?page=2" is served from "dir/page=2.html" when that file exists
+        base, _, query = path.partition("?")
+        local = super().translate_path(base)
+        if query and os.path.isdir(local) and os.path.isfile(os.path.join(local, query.split("#")[0] + ".html")):
+            return os.path.join(local, query.split("#")[0] + ".html")
+        return local
+
+
+def stats_page(rows, next_href=None):
+    """KNCB stats page markup: one div of spans per row (header first), optionally a "Next" link."""
+    body = "".join("<div>" + "".join(f"<span>{c}</span>" for c in r) + "</div>" for r in rows)
+    nav = f'<a href="{next_href}">Next</a>' if next_href else ""
+    return ('<html><body><div id="page-wrap"><div></div><div></div><div></div>'
+            f"<div><div><div></div><div></div><div></div><div><div>{body}</div></div></div></div></div>{nav}</body></html>")
+
+
+@pytest.fixture(autouse=True)
+def _no_page_cache(monkeypatch):
+    """Keep tests off any configured page cache: every fetcher made during a test starts uncached."""
+    from ecc_rankings import fetch, page_cache
+
+    monkeypatch.setattr(page_cache, "PAGE_CACHE_DIR", "")
+    monkeypatch.setattr(fetch, "_default", None)
+
+
+@pytest.fixture
+def serve_dir():
+    """Start a local HTTP stand-in for a directory; yields a function returning its base URL."""
+    servers = []
+
+    def _serve(directory: str) -> str:
+        handler = functools.partial(_QuietHandler, directory=directory)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield _serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
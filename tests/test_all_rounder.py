@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from ecc_rankings.all_rounder import AllRounderLeaderboard
+
+
+def _scored(rng, n):
+    return pd.DataFrame({
+        "Player": [f"P{i}" for i in rng.integers(0, 40, n)],
+        "Points": rng.integers(0, 400, n),
+        "Klasse": rng.choice(["Eerste_Klasse", "Tweede_Klasse"], n),
+    })
+
+
+def _reference_ari(bat, bowl, wb, ww):
+    best = lambda d: d.groupby("Player")["Points"].max()
+    allr = pd.concat([best(bat).rename("bat"), best(bowl).rename("bowl")], axis=1).fillna(0)
+    pct = lambda s: s.where(s > 0).rank(pct=True, method="max").fillna(0.0)
+    return (1000.0 * (wb * pct(allr["bat"]) + ww * pct(allr["bowl"]))).round(0).astype(int)
+
+
+def test_compute_uses_configured_weights():
+    rng = np.random.default_rng(1)
+    bat, bowl = _scored(rng, 80), _scored(rng, 60)
+    board = AllRounderLeaderboard("2025", "Eindhoven CC", "", bat_weight=0.7, bowl_weight=0.3)
+    got = board.compute(bat, bowl).set_index("Player")["ARI"].sort_index()
+    assert got.to_dict() == _reference_ari(bat, bowl, 0.7, 0.3).sort_index().to_dict()
+    assert "0.7 × Bat %ile + 0.3 × Bowl %ile" in board.generate_html(board.compute(bat, bowl))
+
+
+def test_sweep_matches_compute_per_weight_pair():
+    rng = np.random.default_rng(2)
+    bat, bowl = _scored(rng, 120), _scored(rng, 90)
+    board = AllRounderLeaderboard("2025", "Eindhoven CC", "")
+    index = board.index(bat, bowl)
+    weights = [(w, round(1 - w, 2)) for w in np.linspace(0, 1, 11)]
+    table = index.sensitivity(weights)
+    assert list(table.columns) == ["Player"] + [f"{b:g}/{w:g}" for b, w in weights]
+    for (b, w), col in zip(weights, table.columns[1:]):
+        ref = _reference_ari(bat, bowl, b, w)
+        assert table.set_index("Player")[col].to_dict() == ref.to_dict()
+    # A league index ranks any points without re-ranking
+    bat_pct, _ = index.percentiles([0, 10_000, index.bat_sorted[0]], [0, 0, 0])
+    assert bat_pct[0] == 0.0 and bat_pct[1] == 1.0 and 0 < bat_pct[2] <= 1
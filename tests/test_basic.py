@@ -27,3 +27,37 @@ def test_generate_html_contains_player():
     scraper = BattingScraper(html_path="")
     html = scraper.generate_html(sample)
     assert "Charlie" in html
+
+
+def test_combine_and_score_merges_klassen_per_player():
+    sample = pd.DataFrame([
+        {"Klasse": "Eerste_Klasse", "Player": "Alice", "matches": "4", "innings": "4", "not_outs": "1", "Runs": "180", "highest": "92*", "average": "60.0", "strike_rate": "120.0"},
+        {"Klasse": "Tweede_Klasse", "Player": "Alice", "matches": "6", "innings": "5", "not_outs": "0", "Runs": "150", "highest": "101", "average": "30.0", "strike_rate": "0"},
+        {"Klasse": "Vierde_Klasse", "Player": "Bob", "matches": "2", "innings": "2", "not_outs": "0", "Runs": "40", "highest": "25", "average": "20.0", "strike_rate": "80.0"},
+    ])
+    out = BattingScraper(html_path="").combine_and_score(sample)
+    assert out.to_dict("records") == [
+        {"Player": "Alice", "Runs": 330, "innings": 9, "not_outs": 1, "matches": 10, "highest": 101, "average": 41.25,
+         "strike_rate": 220.0, "Klasse Mix": "Tweede_Klasse", "Klasse Weight": 1.102, "Points": 615, "Season": "2025"},
+        {"Player": "Bob", "Runs": 40, "innings": 2, "not_outs": 0, "matches": 2, "highest": 25, "average": 20.0,
+         "strike_rate": 80.0, "Klasse Mix": "Vierde_Klasse", "Klasse Weight": 1.0, "Points": 71, "Season": "2025"},
+    ]
+
+
+def test_scoring_is_memoized_per_content():
+    sample = pd.DataFrame([
+        {"KNCB Ranking": "1", "Klasse": "1e klasse", "Player": "Alice", "matches": "2", "innings": "2", "not_outs": "0", "Runs": "80", "highest": "80", "average": "40.0", "strike_rate": "80.0", "Season": 2025},
+        {"KNCB Ranking": "1", "Klasse": "1e klasse", "Player": "Bob", "matches": "1", "innings": "1", "not_outs": "0", "Runs": "10", "highest": "10", "average": "10.0", "strike_rate": "50.0", "Season": 2025},
+    ])
+    scraper = BattingScraper(html_path="")
+    first = scraper.combine_and_score(sample)
+    first.loc[0, "Points"] = -1  # callers get their own copy
+    again = scraper.combine_and_score(sample.copy())
+    assert (scraper.scores.misses, scraper.scores.hits) == (1, 1)
+    assert (again["Points"] >= 0).all()
+    html = scraper.generate_html(sample)
+    assert scraper.scores.misses == 1 and "Alice" in html
+
+    changed = sample.assign(Runs=["81", "10"])
+    scraper.combine_and_score(changed)
+    assert scraper.scores.misses == 2
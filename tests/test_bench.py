@@ -0,0 +1,33 @@
+from ecc_rankings import bench
+
+
+def test_every_case_runs_on_small_synthetic_data():
+    results = bench.run_benchmarks(sizes=(30,), repeat=1)
+    assert set(results) == {c.name for c in bench._cases("")}
+    assert all(r["30"] > 0 for r in results.values())
+
+
+def test_synthetic_rows_score_like_scraped_ones():
+    assert len(bench.batting_rows(300)) == 300
+    scored = bench.BattingScraper("")._combine_and_score(bench.batting_rows(300))
+    assert 0 < len(scored) <= 100 and scored["Points"].gt(0).any()
+    bat_html, bowl_html = bench.scorecard_html(30)
+    assert bat_html.count("<table>") == bowl_html.count("<table>") == 3
+
+
+def test_real_pages_are_cycled_to_size():
+    page = bench.Page("bench", bench.real_page(bench.REAL_PAGES[0], 75), "http")
+    [table] = page.tables()
+    assert len(table) == 75 and "Player" in table.columns
+
+
+def test_baseline_roundtrip_and_regressions(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    bench.save_baseline({"a": {"100": 0.010}, "b": {"100": 0.001}}, path)
+    bench.save_baseline({"a": {"10000": 0.5}}, path)  # merges, keeps other sizes
+    baseline = bench.load_baseline(path)
+    assert baseline == {"a": {"100": 0.010, "10000": 0.5}, "b": {"100": 0.001}}
+    current = {"a": {"100": 0.011, "10000": 0.9}, "b": {"100": 0.004}, "new": {"100": 1.0}}
+    # a@100 within tolerance, b under the noise floor, "new" has no baseline
+    assert bench.compare(current, baseline, tolerance=0.25) == ["a @ 10000 rows: 900.0 ms vs baseline 500.0 ms"]
+    assert bench.main(["--sizes", "30", "--repeat", "1", "--only", "points_batch", "--baseline", path]) == 0
@@ -0,0 +1,102 @@
+import os
+
+from ecc_rankings.discovery import discover_scorecards, innings_links, match_links
+from ecc_rankings.fantasy_points import build_fantasy_points_json
+from ecc_rankings.fetch import Fetcher
+
+
+def _write(root, rel, html):
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"<html><body>{html}</body></html>")
+
+
+def _fixture(match_id, result):
+    return (f'<div class="fixture"><a href="/match/{match_id}/">Eindhoven CC v Opponents</a>'
+            f'<span>{result}</span><a href="/team/9/">Opponents</a></div>')
+
+
+def _site(root):
+    _write(root, "fixtures/index.html",
+           _fixture("1-100", "Eindhoven CC won by 20 runs") + _fixture("1-101", "Sat 14:00")
+           + '<a href="/fixtures/?page=2">Next</a>')
+    _write(root, "fixtures/page=2.html",
+           _fixture("1-102", "Opponents won by 3 wickets") + _fixture("1-100", "Eindhoven CC won by 20 runs")
+           + '<a href="/fixtures/">Prev</a>')
+    for match_id, (bat, bowl) in {"1-100": ("11", "12"), "1-102": ("22", "21")}.items():
+        _write(root, f"match/{match_id}/scorecard/index.html",
+               f'<a href="?period={bat}">Eindhoven CC 1st innings</a><a href="?period={bowl}">Opponents 1st innings</a>')
+        _write(root, f"match/{match_id}/scorecard/period={bat}.html",
+               "<p>won by</p><table><tr><th>Batter</th><th>R</th><th>B</th><th>4s</th><th>6s</th></tr>"
+               "<tr><td>A Manohar</td><td>40</td><td>30</td><td>4</td><td>1</td></tr></table>")
+        _write(root, f"match/{match_id}/scorecard/period={bowl}.html",
+               "<p>won by</p><table><tr><th>Bowler</th><th>O</th><th>M</th><th>R</th><th>W</th><th>Econ</th></tr>"
+               "<tr><td>A Manohar</td><td>4</td><td>0</td><td>24</td><td>2</td><td>6.0</td></tr></table>")
+
+
+def test_match_and_innings_links_parsing():
+    html = _fixture("1-7", "Match tied") + _fixture("1-8", "Upcoming")
+    assert match_links(html, "https://x.test/fixtures/") == {
+        "https://x.test/match/1-7/scorecard/": True,
+        "https://x.test/match/1-8/scorecard/": False,
+    }
+    tabs = '<a href="?period=5">Eindhoven CC</a><a href="?period=6">VRA</a><a href="?period=5">again</a>'
+    assert innings_links(tabs, "https://x.test/match/1-7/scorecard/") == (
+        ["https://x.test/match/1-7/scorecard/?period=5"], ["https://x.test/match/1-7/scorecard/?period=6"]
+    )
+
+
+def test_discovery_feeds_fantasy_pipeline(tmp_path, serve_dir):
+    _site(str(tmp_path))
+    base = serve_dir(str(tmp_path))
+    with Fetcher(mode="http") as f:
+        found = discover_scorecards(f, fixtures_url=f"{base}/fixtures/")
+        assert found.matches == ["1-100", "1-102"] and not found.skipped
+        assert found.batting_urls == [f"{base}/match/1-100/scorecard/?period=11", f"{base}/match/1-102/scorecard/?period=22"]
+        payload = build_fantasy_points_json(match_date="2025-09-01", fetcher=f,
+                                            batting_urls=found.batting_urls, bowling_urls=found.bowling_urls)
+        again = discover_scorecards(f, fixtures_url=f"{base}/fixtures/", seen_matches={"1-100"})
+
+    [player] = payload["playersWithPoints"]
+    assert (player["runs"], player["wickets"], player["Overs"]) == (80, 4, 8.0)
+    assert again.matches == ["1-100", "1-102"]
+    assert again.bowling_urls == [f"{base}/match/1-102/scorecard/?period=21"]
+
+
+def test_run_fantasy_falls_back_to_configured_urls_when_no_innings_found(tmp_path, monkeypatch):
+    from ecc_rankings import run_fantasy
+    from ecc_rankings.discovery import Scorecards
+
+    calls = {}
+    monkeypatch.setenv("ECC_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(run_fantasy, "FIXTURES_URL", "https://x.test/fixtures/")
+    monkeypatch.setattr(run_fantasy, "default_fantasy_ledger", lambda: None)
+    monkeypatch.setattr(run_fantasy, "default_store", lambda: None)
+    # Every completed match skipped: innings tabs not recognised
+    monkeypatch.setattr(run_fantasy, "discover_scorecards",
+                        lambda fetcher, seen_matches: Scorecards(matches=["1-1"], skipped=["1-1"]))
+    monkeypatch.setattr(run_fantasy, "save_fantasy_points_json", lambda **kw: calls.update(kw))
+    run_fantasy.main()
+    assert "batting_urls" not in calls and "bowling_urls" not in calls
+    assert calls["pool"] is not None and calls["fetcher"].pool is calls["pool"]
+
+
+def test_run_fantasy_scores_nothing_new_when_every_match_is_in_the_ledger(tmp_path, monkeypatch):
+    from ecc_rankings import run_fantasy
+    from ecc_rankings.discovery import Scorecards
+    from ecc_rankings.fantasy_ledger import FantasyLedger
+
+    calls = {}
+    ledger = FantasyLedger(str(tmp_path / "ledger.json"))
+    monkeypatch.setattr(ledger, "matches", lambda: {"1-1"})
+    monkeypatch.setenv("ECC_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(run_fantasy, "FIXTURES_URL", "https://x.test/fixtures/")
+    monkeypatch.setattr(run_fantasy, "default_fantasy_ledger", lambda: ledger)
+    monkeypatch.setattr(run_fantasy, "default_store", lambda: None)
+    monkeypatch.setattr(run_fantasy, "discover_scorecards",
+                        lambda fetcher, seen_matches: Scorecards(matches=sorted(seen_matches)))
+    monkeypatch.setattr(run_fantasy, "save_fantasy_points_json", lambda **kw: calls.update(kw))
+    run_fantasy.main()
+    # No fallback to SCORECARD_*_URLS: the ledger's totals are rebuilt from nothing new
+    assert calls["batting_urls"] == [] and calls["bowling_urls"] == [] and calls["ledger"] is ledger
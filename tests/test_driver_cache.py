@@ -0,0 +1,37 @@
+import os
+import stat
+
+from ecc_rankings import driver as drv
+
+
+def _fake_chromedriver(path):
+    path.write_text("#!/bin/sh\necho 'ChromeDriver 126.0'\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def test_resolved_driver_path_is_cached_until_binary_changes(tmp_path, monkeypatch):
+    exe = _fake_chromedriver(tmp_path / "chromedriver")
+    cache = str(tmp_path / "cache" / "chromedriver.json")
+    calls = []
+    real_verify = drv.verify_executable
+    monkeypatch.setattr(drv, "verify_executable", lambda p: calls.append(p) or real_verify(p))
+
+    assert drv.resolve_driver_path(exe, cache) == exe
+    verified = len(calls)
+    assert drv.resolve_driver_path(exe, cache) == exe
+    assert len(calls) == verified  # served from cache, no --version subprocess
+
+    with open(exe, "a") as f:
+        f.write("# upgraded\n")
+    assert drv.resolve_driver_path(exe, cache) == exe
+    assert len(calls) == verified + 1
+
+
+def test_cache_entry_dropped_when_verification_fails(tmp_path):
+    exe = _fake_chromedriver(tmp_path / "chromedriver")
+    cache = str(tmp_path / "chromedriver.json")
+    drv.remember_driver_path(exe, exe, cache)
+    os.remove(exe)
+    assert drv._cached_driver_path(exe, cache) is None
+    assert drv._load_cache(cache) == {}
@@ -1,6 +1,14 @@
 import pandas as pd
 
-from ecc_rankings.fantasy_points import FantasyRules, _choose_col, _name_aliases, _points_from_row, _resolve_name, _safe_read_tables
+from ecc_rankings.fantasy_points import (
+    FantasyRules,
+    _choose_col,
+    _name_aliases,
+    _points_from_row,
+    _resolve_name,
+    _safe_read_tables,
+    build_fantasy_points_json,
+)
 
 
 class _FakeDriver:
@@ -62,7 +70,8 @@ def test_safe_read_tables_falls_back_to_driver_html(monkeypatch):
 
     monkeypatch.setattr("pandas.read_html", _fake_read_html)
     html = "<table><tr><th>Player</th><th>R</th></tr><tr><td>A Manohar</td><td>50</td></tr></table>"
-    tables = _safe_read_tables("http://dummy", driver=_FakeDriver(html))
+    # Nothing listens on the discard port: the HTTP attempt fails at once, without a DNS lookup
+    tables = _safe_read_tables("http://127.0.0.1:9/scorecard", driver=_FakeDriver(html))
     assert len(tables) == 1
     assert isinstance(tables[0], pd.DataFrame)
     assert list(tables[0].columns) == ["Player", "R"]
@@ -79,3 +88,115 @@ def test_choose_col_handles_fuzzy_headers():
     assert _choose_col(df, ("R", "Runs")) == "Batting R"
     assert _choose_col(df, ("B", "BF")) == "Balls (B)"
     assert _choose_col(df, ("W", "Wkts")) == "Wickets W"
+
+
+def test_header_schema_is_shared_per_layout():
+    from ecc_rankings.fantasy_points import _schema
+
+    bat = pd.DataFrame(columns=["Batter", "dismissal", "R", "B", "4s", "6s", "SR"])
+    bowl = pd.DataFrame(columns=["Bowler", "O", "M", "R", "W", "Econ"])
+    schema = _schema(bat)
+    assert (schema.runs, schema.balls, schema.fours, schema.sixes) == ("R", "B", "4s", "6s")
+    assert schema.batting and not schema.bowling
+    assert _schema(bat.copy()) is schema  # same header layout, cached mapping
+    assert _schema(bowl).bowling and _schema(bowl).economy == "Econ" and _schema(bowl).balls is None
+
+
+def test_batting_tables_parse_columnwise_with_positional_fallback():
+    from ecc_rankings.fantasy_points import _batting_from_tables
+
+    df = pd.DataFrame(
+        [["A. Manohar", "c X b Y", "54*", "40", "7", "1"], ["Extras", "", "12", "", "", ""], ["New  Player", "b Z", "-", "3", "0", "0"]],
+        columns=["Batter", "dismissal", "R", "B", "x", "y"],  # no 4s/6s headers: k-th numeric cell
+    )
+    out = _batting_from_tables([df], _name_aliases())
+    assert out["player_name"].tolist() == ["aarav manohar", "New Player"]
+    assert out[["runs", "Balls", "Four", "Sixes", "50 runs"]].values.tolist() == [[54, 40, 7, 1, 1], [0, 3, 0, 0, 0]]
+
+
+def test_points_batch_agrees_with_row_reference():
+    import numpy as np
+
+    from ecc_rankings.fantasy_points import _points_batch, score_rule_sets
+
+    rng = np.random.default_rng(2025)
+    n = 5000
+    table = pd.DataFrame({
+        "runs": rng.integers(0, 160, n),
+        "Four": rng.integers(0, 20, n),
+        "Sixes": rng.integers(0, 12, n),
+        "Overs": rng.choice([0, 1.3, 3.5, 4, 4.0, 6.2, 10], n),
+        "Maiden": rng.integers(0, 4, n),
+        "Economy": rng.choice([0, 2.99, 3, 6, 6.01, 8, 8.5, 12, 12.5, 20], n),
+        "wickets": rng.integers(0, 12, n),
+        "catches": rng.integers(0, 4, n),
+        "run_outs_direct": rng.integers(0, 2, n),
+        "run_outs_shared": rng.integers(0, 2, n),
+    })
+    table["runs"] = table["runs"].astype(object)
+    table.loc[::7, "runs"] = "45*"
+    lenient = FantasyRules(wicket=25, econ_over6=0, fifty_bonus=8)
+    for rules in (FantasyRules(), lenient):
+        expected = [_points_from_row(r, rules) for r in table.to_dict("records")]
+        assert _points_batch(table, rules).tolist() == expected
+
+    sweep = score_rule_sets(table, {"default": FantasyRules(), "lenient": lenient})
+    assert sweep["lenient"].tolist() == _points_batch(table, lenient).tolist()
+
+
+def test_merge_numeric_sums_across_scorecards_in_one_pass():
+    from ecc_rankings.fantasy_points import _merge_numeric
+
+    bat = [
+        pd.DataFrame({"player_name": ["b", "a"], "runs": [10, 5], "Four": [1, 0]}),
+        pd.DataFrame({"player_name": ["a", "a"], "runs": [20, 1], "Four": [2, 0]}),
+        pd.DataFrame({"player_name": ["c"], "runs": [7], "Four": [1]}),
+    ]
+    bowl = [pd.DataFrame({"player_name": ["a", "d"], "Overs": [4.0, 2.5], "wickets": [2, 1]})]
+    merged = _merge_numeric(bat + [pd.DataFrame()] + bowl)
+    assert list(merged.columns) == ["player_name", "runs", "Four", "Overs", "wickets"]
+    assert merged["player_name"].tolist() == ["a", "b", "c", "d"]
+    assert merged["runs"].tolist() == [26, 10, 7, 0]
+    assert merged["wickets"].tolist() == [2, 0, 0, 1]
+    assert merged["runs"].dtype.kind == "i" and merged["Overs"].dtype.kind == "f"
+
+
+def _scorecard(kind, rows, done=True):
+    head = ["Batter", "R", "B", "4s", "6s"] if kind == "bat" else ["Bowler", "O", "M", "R", "W", "Econ"]
+    body = "".join("<tr>" + "".join(f"<td>{c}</td>" for c in r) + "</tr>" for r in rows)
+    result = "<p>Eindhoven CC won by 5 wickets</p>" if done else ""
+    return f"<html><body>{result}<table><tr>{''.join(f'<th>{h}</th>' for h in head)}</tr>{body}</table></body></html>"
+
+
+def test_incremental_ledger_matches_full_rebuild(tmp_path):
+    from ecc_rankings.fantasy_ledger import FantasyLedger
+    from ecc_rankings.fetch import Fetcher, Page
+    from ecc_rankings.replay import SnapshotStore
+
+    snaps = SnapshotStore(str(tmp_path / "snaps"))
+    bat = [f"https://matchcentre.kncb.nl/match/1-{i}/scorecard/?period={10 + i}" for i in range(3)]
+    bowl = [f"https://matchcentre.kncb.nl/match/1-{i}/scorecard/?period={20 + i}" for i in range(3)]
+    for i, url in enumerate(bat):
+        snaps.save(Page(url, _scorecard("bat", [["A Manohar", 30 + i, 20, 3, i], ["Saqib Saleem", 5 * i, 9, 0, 0]]), "http"))
+    for i, url in enumerate(bowl):
+        snaps.save(Page(url, _scorecard("bowl", [["A Manohar", 4, i % 2, 20 + i, i, 5.0 + i / 4]], done=i != 1), "http"))
+
+    def run(b, w, ledger=None):
+        with Fetcher(mode="replay", snapshots=snaps) as f:
+            out = build_fantasy_points_json(match_date="2025-09-01", batting_urls=b, bowling_urls=w,
+                                            fetcher=f, ledger=ledger)
+            return out["playersWithPoints"], dict(f.served)
+
+    full, _ = run(bat, bowl)
+    path = str(tmp_path / "ledger.json")
+    run(bat[:2], bowl[:2], FantasyLedger(path))
+    incremental, served = run(bat, bowl, FantasyLedger(path))
+
+    assert incremental == full
+    # Only the new match plus the still-unfinished bowling card are fetched again
+    assert sorted(served) == sorted([bat[2], bowl[1], bowl[2]])
+    assert sorted(FantasyLedger(path).processed) == sorted(
+        [f"bat:1-{i}:{10 + i}" for i in range(3)] + [f"bowl:1-{i}:{20 + i}" for i in (0, 2)]
+    )
+    # 1-1 only has its batting card folded, so discovery still lists it and retries the bowling card
+    assert FantasyLedger(path).matches() == {"1-0", "1-2"}
@@ -0,0 +1,59 @@
+import os
+
+from ecc_rankings.fetch import ROWS, TABLES, Fetcher
+
+DOCS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs")
+
+_ROWS_HTML = """<html><body><div id="page-wrap"><div></div><div></div><div></div>
+<div><div><div></div><div></div><div></div><div><div>
+  <div><span>#</span><span>Player</span><span>Team</span></div>
+  <div><span>1</span><span>A Manohar</span><span>Eindhoven CC</span></div>
+</div></div></div></div></div></body></html>"""
+
+
+class _FakeDriver:
+    def __init__(self, html: str):
+        self.page_source = html
+
+    def get(self, _url: str):
+        return None
+
+
+def test_http_backend_serves_docs_fixture_tables(serve_dir):
+    base = serve_dir(DOCS)
+    url = f"{base}/kncb_batting_stats_2025.html"
+    with Fetcher(mode="auto") as f:
+        page = f.fetch(url, kind=TABLES)
+        assert page.backend == "http"
+        assert "Player" in page.tables()[0].columns
+        assert f.served == {url: "http"}
+
+
+def test_rows_parsed_from_served_html(tmp_path, serve_dir):
+    (tmp_path / "stats.html").write_text(_ROWS_HTML)
+    base = serve_dir(str(tmp_path))
+    with Fetcher(mode="http") as f:
+        [page] = f.fetch_all([f"{base}/stats.html"], kind=ROWS)
+    assert page.stat_rows()[1] == ["1", "A Manohar", "Eindhoven CC"]
+
+
+def test_falls_back_to_browser_per_url(serve_dir):
+    base = serve_dir(DOCS)
+    html = "<table><tr><th>Player</th><th>R</th></tr><tr><td>A Manohar</td><td>50</td></tr></table>"
+    with Fetcher(mode="auto") as f:
+        page = f.fetch(f"{base}/missing.html", kind=TABLES, driver=_FakeDriver(html))
+    assert page.backend == "browser"
+    assert list(page.tables()[0].columns) == ["Player", "R"]
+
+
+def test_fetch_all_renders_misses_only_on_its_pool(serve_dir):
+    from ecc_rankings.pool import DriverPool
+
+    base = serve_dir(DOCS)
+    urls = [f"{base}/kncb_batting_stats_2025.html", f"{base}/missing.html"]
+    html = "<table><tr><th>Player</th><th>R</th></tr><tr><td>A Manohar</td><td>50</td></tr></table>"
+    with Fetcher(mode="auto") as f:  # no pool: like fetch(), a miss is an empty page, no browser
+        assert [p.backend for p in f.fetch_all(urls)] == ["http", "none"]
+    with DriverPool(1, factory=lambda: _FakeDriver(html)) as pool, Fetcher(mode="auto", pool=pool) as f:
+        assert [p.backend for p in f.fetch_all(urls)] == ["http", "browser"]
+        assert pool.launches == 1
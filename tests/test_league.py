@@ -0,0 +1,52 @@
+import os
+
+import pandas as pd
+
+from ecc_rankings import batting as batting_mod
+from ecc_rankings.batting import BattingScraper
+from ecc_rankings.fetch import Fetcher
+from ecc_rankings.league import club_rows, next_page_url
+
+from conftest import stats_page
+
+HEADER = ["#", "Player", "Team", "M", "I", "NO", "R", "HS", "Avg", "SR"]
+
+
+def _player(i, team):
+    return [str(i), f"Player {i}", team, "5", "5", "1", str(300 - i), "80*", "50.0", "120.0"]
+
+
+def _write(root, rel, html):
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def test_next_page_url():
+    assert next_page_url('<a rel="next" href="?page=3">3</a>', "https://x.test/s?page=2") == "https://x.test/s?page=3"
+    assert next_page_url('<a href="/s?page=2">Volgende</a>', "https://x.test/s") == "https://x.test/s?page=2"
+    assert next_page_url('<a href="/other">Previous</a>', "https://x.test/s") is None
+
+
+def test_full_league_streams_every_page(tmp_path, serve_dir, monkeypatch):
+    teams = ["Eindhoven CC", "VRA", "HCC"]
+    _write(str(tmp_path), "eerste/index.html",
+           stats_page([HEADER] + [_player(i, teams[i % 3]) for i in range(1, 31)], next_href="?page=2"))
+    _write(str(tmp_path), "eerste/page=2.html", stats_page([HEADER] + [_player(i, teams[i % 3]) for i in range(31, 46)]))
+    _write(str(tmp_path), "tweede/index.html", stats_page([HEADER] + [_player(i, "VRA") for i in range(1, 4)]))
+    base = serve_dir(str(tmp_path))
+    monkeypatch.setattr(batting_mod, "BATTING_URLS", {"Eerste_Klasse": f"{base}/eerste/", "Tweede_Klasse": f"{base}/tweede/"})
+
+    scraper, throughput = BattingScraper(html_path=""), []
+    with Fetcher(mode="http") as f:
+        rows = scraper.iter_rows(f, full=True, throughput=throughput)
+        first = next(rows)
+        assert len(f.served) == 1  # later pages are only fetched once the consumer gets there
+        league = [first] + list(rows)
+        club = scraper.scrape(fetcher=f, full=False)
+
+    assert len(league) == 48
+    assert [t["rows"] for t in throughput] == [30, 15, 3]
+    assert {r["Team"] for r in league} == set(teams)
+    pd.testing.assert_frame_equal(club_rows(pd.DataFrame(league)), club)
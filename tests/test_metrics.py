@@ -0,0 +1,57 @@
+import json
+import os
+
+import pytest
+
+from ecc_rankings.batting import BattingScraper
+from ecc_rankings.config import BATTING_URLS
+from ecc_rankings.fetch import Fetcher, Page
+from ecc_rankings.metrics import METRICS, Metrics
+from ecc_rankings.replay import SnapshotStore
+
+
+def test_report_json_and_prometheus_textfile(tmp_path):
+    m = Metrics()
+    for _ in range(2):
+        with m.timer("fetch.http"):
+            pass
+    m.count("pages.http", 3)
+    with pytest.raises(RuntimeError):
+        m.run("fantasy", m.timed("score.fantasy")(_boom))
+    assert m.stages["score.fantasy"][0] == 1 and "fetch.http" not in m.stages  # run() starts from a reset
+
+    m.count("pages.http", 3)
+    with m.timer("fetch.http"):
+        pass
+    m.emit("fantasy", metrics_dir=str(tmp_path / "reports"), textfile_dir=str(tmp_path / "prom"))
+    report = json.load(open(tmp_path / "reports" / "fantasy.json", encoding="utf-8"))
+    assert report["status"] == "ok" and report["counters"] == {"pages.http": 3}
+    assert report["stages"]["fetch.http"]["calls"] == 1
+    prom = open(tmp_path / "prom" / "ecc_fantasy.prom", encoding="utf-8").read()
+    assert 'ecc_stage_calls{run="fantasy",stage="fetch.http"} 1\n' in prom
+    assert 'ecc_count{run="fantasy",name="pages.http"} 3\n' in prom
+    assert 'ecc_run_success{run="fantasy"} 1\n' in prom
+    assert not [f for f in os.listdir(tmp_path / "prom") if f.endswith(".tmp")]
+
+
+def _boom():
+    raise RuntimeError("boom")
+
+
+def test_scrape_score_and_write_are_timed(tmp_path):
+    snapshots = SnapshotStore(str(tmp_path / "snapshots"))
+    header = ["#", "Player", "Team", "M", "I", "NO", "R", "HS", "Avg", "SR"]
+    for klasse, url in BATTING_URLS.items():
+        body = "".join("<div>" + "".join(f"<span>{c}</span>" for c in r) + "</div>"
+                       for r in [header, ["1", f"Bat {klasse}", "Eindhoven CC", "5", "5", "1", "200", "80*", "50.0", "120.0"]])
+        html = ('<html><body><div id="page-wrap"><div></div><div></div><div></div>'
+                f"<div><div><div></div><div></div><div></div><div><div>{body}</div></div></div></div></div></body></html>")
+        snapshots.save(Page(url, html, "browser"))
+
+    METRICS.reset()
+    scraper = BattingScraper(html_path=str(tmp_path / "batting.html"))
+    with Fetcher(mode="replay", snapshots=snapshots) as f:
+        scraper.write_html(scraper.combine_and_score(scraper.scrape(fetcher=f)))
+    assert {"score.batting", "render", "write"} <= set(METRICS.stages)
+    assert METRICS.counters["pages.replay"] == len(BATTING_URLS)
+    assert METRICS.counters["files.written"] == 1
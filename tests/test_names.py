@@ -0,0 +1,53 @@
+import pandas as pd
+
+from ecc_rankings.config import EINDHOVEN_NAME_MAP
+from ecc_rankings.names import NameIndex, name_index
+
+
+def test_index_resolves_variants_beyond_the_map_keys():
+    idx = NameIndex(EINDHOVEN_NAME_MAP)
+    assert idx.resolve("A Manohar") == "aarav manohar"  # exact key
+    assert idx.resolve("Aarav Manohar") == "aarav manohar"  # full name
+    assert idx.resolve("A. Manohar (c)") == "aarav manohar"
+    assert idx.resolve("Patil, Pradeep") == "pradeep patil"
+    assert idx.resolve("Pradeepp Patil") == "pradeep patil"  # first-name typo
+    assert idx.resolve("J.K. Singh") == "jk singh"  # initials spaced or joined as in a map key
+    assert idx.resolve("Total") is None
+    assert idx.fuzzy["Patil, Pradeep"] == "pradeep patil"
+    assert "matched outside the map: " in idx.report() and "Pradeepp Patil -> pradeep patil" in idx.report()
+
+
+def test_initials_and_near_names_do_not_merge_different_players():
+    idx = NameIndex(EINDHOVEN_NAME_MAP)
+    # "k kumar singh" / "jk singh" are keys, but a bare "K Singh" or "J Singh" could be anyone
+    for label in ("K Singh", "J Singh", "K. K. Singh", "Saurav Singh"):
+        assert idx.resolve(label) == label
+    assert set(idx.unresolved) == {"K Singh", "J Singh", "K. K. Singh", "Saurav Singh"} and not idx.fuzzy
+
+
+def test_different_surnames_and_close_first_names_stay_unresolved():
+    idx = NameIndex({"a shinde": "aryan shinde", "a ranjan": "amit ranjan", "s singh": "saurabh singh",
+                     "v krishnan": "vijay krishnan", "z farooq": "zahid farooq"})
+    labels = ("Karan Shinde", "Amit Rajan", "Sourabh Singh", "Vijay Krishna", "Zahid Farooqi",
+              "Pradeep Patill")
+    for label in labels:
+        assert idx.resolve(label) == label
+    assert set(idx.unresolved) == set(labels) and not idx.fuzzy
+
+
+def test_name_index_is_shared_per_map_content_and_bounded():
+    first = name_index({"a b": "ab c"})
+    assert name_index({"a b": "ab c"}) is first
+    for i in range(10):
+        name_index({f"x{i}": "y"})
+    assert name_index({"a b": "ab c"}) is not first  # evicted, not kept alive
+
+
+def test_unmatched_labels_keep_their_text_and_are_reported():
+    idx = NameIndex(EINDHOVEN_NAME_MAP)
+    s = pd.Series(["New  Player", "A Manohar", "New  Player", None, "Zz Opponent"] * 1000)
+    out = idx.resolve_series(s)
+    assert out.iloc[:5].tolist() == ["New Player", "aarav manohar", "New Player", None, "Zz Opponent"]
+    # Counted once per distinct label per column
+    assert idx.unresolved == {"New Player": 1, "Zz Opponent": 1}
+    assert idx.report().startswith("2 unresolved: ")
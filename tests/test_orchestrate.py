@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+from ecc_rankings import orchestrate
+
+
+def _patch(monkeypatch, side_delay, fantasy, published):
+    def run_side(fetcher, side, scraper):
+        time.sleep(max(side_delay[side], 0))
+        if side_delay[side] < 0:
+            raise RuntimeError(f"{side} broke")
+        return side, side
+
+    monkeypatch.setattr(orchestrate, "run_side", run_side)
+    monkeypatch.setattr(orchestrate, "assemble", lambda bat, bowl, allr: (bat, bowl))
+    monkeypatch.setattr(orchestrate.run, "publishers", lambda docs: ("bat", "bowl", None, [published.append]))
+    monkeypatch.setattr(orchestrate.run_fantasy, "main", fantasy)
+
+
+def test_tasks_run_concurrently_and_publish_once(monkeypatch):
+    published = []
+    fetchers = []
+
+    def fantasy(pool, fetcher):
+        fetchers.append(fetcher)
+        time.sleep(0.3)
+
+    _patch(monkeypatch, {"batting": 0.3, "bowling": 0.3}, fantasy, published)
+    orch = orchestrate.Orchestrator(timeout=5)
+    start = time.perf_counter()
+    shared = object()
+    code = asyncio.run(orch.run(fetcher=shared, docs_dir=""))
+    assert time.perf_counter() - start < 0.8
+    assert code == 0
+    assert fetchers == [shared]  # fantasy reuses the run's fetcher (one page cache per run)
+    assert published == [(("batting", "batting"), ("bowling", "bowling"))]
+    assert {r.name: r.status for r in orch.results.values()} == {
+        "batting": "ok", "bowling": "ok", "fantasy": "ok", "publish": "ok"}
+
+
+def test_timeout_and_failure_give_unified_exit_status(monkeypatch):
+    published = []
+    _patch(monkeypatch, {"batting": 0.0, "bowling": -1}, lambda pool, fetcher: time.sleep(1.0), published)
+    orch = orchestrate.Orchestrator(timeout=0.2)
+    code = asyncio.run(orch.run(fetcher=None, docs_dir=""))
+    status = {r.name: r.status for r in orch.results.values()}
+    assert code == 1 and not published
+    assert status == {"batting": "ok", "bowling": "failed", "fantasy": "timeout", "publish": "skipped"}
+    assert "bowling broke" in orch.report()
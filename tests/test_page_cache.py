@@ -0,0 +1,63 @@
+import os
+
+import pandas as pd
+
+from ecc_rankings.fetch import TABLES, Fetcher, Page
+from ecc_rankings.page_cache import PageCache
+
+DOCS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs")
+
+
+def test_fresh_then_revalidated_with_last_modified(tmp_path, serve_dir):
+    url = f"{serve_dir(DOCS)}/kncb_bowling_stats_2025.html"
+
+    with Fetcher(mode="auto", cache=PageCache(str(tmp_path))) as f:
+        assert f.fetch(url, kind=TABLES).backend == "http"
+        cached = f.fetch(url, kind=TABLES)
+        assert cached.backend == "cache"
+        assert "Player" in cached.tables()[0].columns
+
+    # Stale entry: the stand-in honours If-Modified-Since and answers 304
+    with Fetcher(mode="auto", cache=PageCache(str(tmp_path), ttl=0)) as f:
+        page = f.fetch(url, kind=TABLES)
+        assert page.backend == "revalidated"
+        assert "Player" in page.tables()[0].columns
+
+
+def test_final_entries_never_expire_and_lru_evicts(tmp_path):
+    cache = PageCache(str(tmp_path), ttl=0, max_bytes=5_000)
+    table = "<table><tr><th>Player</th><th>R</th></tr><tr><td>{}</td><td>1</td></tr></table>"
+    for i in range(40):
+        cache.put(Page(f"http://x/{i}", table.format(f"P{i}"), "http"), TABLES, final=(i == 39))
+    assert cache.total_bytes() <= 5_000
+    assert cache.get("http://x/0") is None
+    last = cache.get("http://x/39")
+    assert last is not None and cache.is_fresh(last)
+
+
+def test_tables_are_cached_as_json_not_pickle(tmp_path):
+    cache = PageCache(str(tmp_path))
+    html = "<table><tr><th>Player</th><th>R</th><th>SR</th></tr><tr><td>A</td><td>12</td><td>1.5</td></tr></table>"
+    page = Page("http://x/sc", html, "http")
+    cache.put(page, TABLES)
+    files = [os.path.join(d, n) for d, _, names in os.walk(tmp_path) for n in names]
+    assert any(n.endswith(".tables.json") for n in files) and not any(n.endswith((".pkl", ".tmp")) for n in files)
+    loaded = cache.load(page.url, cache.get(page.url))
+    assert loaded._tables is not None
+    pd.testing.assert_frame_equal(loaded.tables()[0], page.tables()[0])
+
+
+def test_index_is_written_in_batches_and_on_flush(tmp_path):
+    cache = PageCache(str(tmp_path), flush_every=3)
+    table = "<table><tr><th>Player</th><th>R</th></tr><tr><td>{}</td><td>1</td></tr></table>"
+    index = tmp_path / "index.json"
+    cache.put(Page("http://x/0", table.format("P0"), "http"), TABLES)
+    cache.put(Page("http://x/1", table.format("P0"), "http"), TABLES)  # same body: one object
+    assert not index.exists()
+    cache.put(Page("http://x/2", table.format("P2"), "http"), TABLES)
+    assert index.exists()
+    cache.put(Page("http://x/3", table.format("P3"), "http"), TABLES)
+    cache.flush()
+    reloaded = PageCache(str(tmp_path))
+    assert set(reloaded._index) == {f"http://x/{i}" for i in range(4)}
+    assert reloaded.total_bytes() == cache.total_bytes() == sum({e["sha"]: e["size"] for e in cache._index.values()}.values())
@@ -0,0 +1,30 @@
+from ecc_rankings.metrics import METRICS
+from ecc_rankings.page_ready import STATS_ROWS, load_page, wait_until_ready
+
+
+class _SlowDriver:
+    def __init__(self, ready_after: int):
+        self.calls = 0
+        self.ready_after = ready_after
+
+    def get(self, _url: str):
+        return None
+
+    def find_elements(self, _by, _value):
+        self.calls += 1
+        return ["header", "row"] if self.calls > self.ready_after else []
+
+
+def test_load_page_records_time_to_ready():
+    METRICS.reset()
+    driver = _SlowDriver(ready_after=2)
+    elapsed = load_page(driver, "http://stats", (STATS_ROWS,), timeout=2, poll=0.01, min_count=2)
+    assert elapsed is not None and elapsed < 2
+    calls, seconds, _ = METRICS.stages["page_ready"]
+    assert calls == 1 and seconds >= elapsed
+    assert "page_ready.timeouts" not in METRICS.counters
+
+
+def test_wait_until_ready_times_out_cleanly():
+    driver = _SlowDriver(ready_after=10_000)
+    assert wait_until_ready(driver, (STATS_ROWS,), timeout=0.05, poll=0.01) is None
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from ecc_rankings.all_rounder import AllRounderLeaderboard
+from ecc_rankings.batting import BattingScraper
+from ecc_rankings.bowling import BowlingScraper
+from ecc_rankings.config import BATTING_URLS, BOWLING_URLS
+from ecc_rankings.fetch import Fetcher, Page
+from ecc_rankings.pipeline import bounded_map, normalize_stage, prefetch, run_pipeline
+from ecc_rankings.replay import SnapshotStore
+
+from conftest import stats_page
+
+
+def _snapshots(root):
+    store = SnapshotStore(root)
+    bat_head = ["#", "Player", "Team", "M", "I", "NO", "R", "HS", "Avg", "SR"]
+    bowl_head = ["#", "Player", "Team", "M", "I", "O", "W", "BBI", "Avg", "Eco", "SR"]
+    for n, url in enumerate(BATTING_URLS.values()):
+        rows = [[str(i), f"Bat {i}", "Eindhoven CC", "5", "5", "1", str(40 * i + n), "80*", "30.5", "101.2"] for i in range(1, 5)]
+        store.save(Page(url, stats_page([bat_head] + rows), "browser"))
+    for n, url in enumerate(BOWLING_URLS.values()):
+        rows = [[str(i), f"Bat {i}", "Eindhoven CC", "6", "6", "20", str(i + n), f"{i}/12", "15.5", "4.2", "18.0"] for i in range(1, 4)]
+        store.save(Page(url, stats_page([bowl_head] + rows), "browser"))
+    return store
+
+
+def test_pipeline_scores_once_and_matches_step_by_step_run(tmp_path, monkeypatch):
+    snaps = _snapshots(str(tmp_path))
+    batting, bowling = BattingScraper(html_path=""), BowlingScraper(html_path="")
+    allr = AllRounderLeaderboard(season="2025", club="Eindhoven CC", html_path="")
+
+    with Fetcher(mode="replay", snapshots=snaps) as f:
+        df_bat, df_bowl = batting.scrape(fetcher=f), bowling.scrape(fetcher=f)
+    expected = {
+        "batting": batting.generate_html(df_bat),
+        "bowling": bowling.generate_html(df_bowl),
+        "allrounder": allr.generate_html(allr.compute(batting.combine_and_score(df_bat), bowling.calculate_icc_points(df_bowl))),
+    }
+
+    calls = {"bat": 0, "bowl": 0}
+    orig_bat, orig_bowl = BattingScraper.combine_and_score, BowlingScraper.calculate_icc_points
+    monkeypatch.setattr(BattingScraper, "combine_and_score",
+                        lambda self, df: calls.__setitem__("bat", calls["bat"] + 1) or orig_bat(self, df))
+    monkeypatch.setattr(BowlingScraper, "calculate_icc_points",
+                        lambda self, df: calls.__setitem__("bowl", calls["bowl"] + 1) or orig_bowl(self, df))
+
+    got = {}
+    consumers = [
+        lambda t: got.update(batting=batting.render_html(t.batting), bowling=bowling.render_html(t.bowling)),
+        lambda t: got.update(allrounder=allr.generate_html(t.allrounder)),
+    ]
+    with Fetcher(mode="replay", snapshots=snaps) as f:
+        tables = run_pipeline(f, batting, bowling, allr, consumers=consumers, full=False)
+
+    assert calls == {"bat": 1, "bowl": 1}
+    assert got == expected
+    pd.testing.assert_frame_equal(tables.batting_rows, df_bat)
+
+
+def test_bounded_map_keeps_order_and_limits_inflight():
+    live, peak, lock = [0], [0], threading.Lock()
+
+    def work(i):
+        with lock:
+            live[0] += 1
+            peak[0] = max(peak[0], live[0])
+        time.sleep(0.01 * (i % 3))
+        with lock:
+            live[0] -= 1
+        return i * i
+
+    assert list(bounded_map(work, range(12), workers=3)) == [i * i for i in range(12)]
+    assert peak[0] <= 3
+
+
+def test_prefetch_buffers_and_reraises():
+    produced = []
+
+    def gen():
+        for i in range(10):
+            produced.append(i)
+            yield i
+        raise ValueError("boom")
+
+    it = prefetch(gen(), depth=2)
+    assert next(it) == 0
+    time.sleep(0.05)
+    assert len(produced) <= 4  # one handed out, two buffered, one blocked on put
+    with pytest.raises(ValueError):
+        list(it)
+
+
+def test_prefetch_producer_stops_when_consumer_stops_early():
+    def endless():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    for i in prefetch(endless(), depth=2):
+        if i == 3:
+            break
+    deadline = time.time() + 2
+    while any(t.name == "ecc-prefetch" for t in threading.enumerate()) and time.time() < deadline:
+        time.sleep(0.01)
+    assert not any(t.name == "ecc-prefetch" for t in threading.enumerate())
+
+
+def test_normalize_packs_rows_in_chunks_without_changing_frames():
+    rows = [("batting" if i % 3 else "bowling", {"Player": f"P{i}", "Runs": str(i), "Team": f"T{i % 7}"})
+            for i in range(2500)]
+    chunked = normalize_stage(iter(rows), chunk_rows=100)
+    whole = normalize_stage(iter(rows), chunk_rows=10**9)
+    for side in ("batting", "bowling"):
+        pd.testing.assert_frame_equal(chunked[side], whole[side])
+    assert normalize_stage(iter([]))["batting"].empty
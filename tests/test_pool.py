@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from ecc_rankings.pool import DriverPool
+
+
+class _Driver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_map_keeps_order_and_bounds_drivers():
+    created = []
+    lock = threading.Lock()
+
+    def factory():
+        d = _Driver()
+        with lock:
+            created.append(d)
+        return d
+
+    def work(driver, n):
+        time.sleep(0.01 * (5 - n % 5))
+        return n * 10
+
+    with DriverPool(size=3, factory=factory) as pool:
+        assert pool.map(work, range(12)) == [n * 10 for n in range(12)]
+        assert pool.map(work, [1]) == [10]
+    assert 1 <= len(created) <= 3
+    assert all(d.quit_called for d in created)
+
+
+def test_session_is_reused_and_recycled_only_after_error():
+    from selenium.common.exceptions import WebDriverException
+
+    created = []
+
+    def factory():
+        created.append(_Driver())
+        return created[-1]
+
+    calls = {"n": 0}
+
+    def flaky(driver, n):
+        calls["n"] += 1
+        if calls["n"] == 2:
+            raise WebDriverException("tab crashed")
+        return n
+
+    with DriverPool(size=1, factory=factory) as pool:
+        assert pool.map(flaky, [1]) == [1]
+        assert pool.map(flaky, [2, 3]) == [2, 3]
+        assert len(created) == 2
+        assert created[0].quit_called and not created[1].quit_called
+    assert created[1].quit_called
+
+
+def test_closed_pool_refuses_to_launch_or_relaunch():
+    from selenium.common.exceptions import WebDriverException
+
+    from ecc_rankings.driver import BrowserClosed
+
+    created = []
+    pool = DriverPool(size=1, factory=lambda: created.append(_Driver()) or created[-1])
+    started, release = threading.Event(), threading.Event()
+
+    def crash_after_close(driver, n):
+        # An abandoned task still running when its pool shuts down: the browser dies under it
+        started.set()
+        release.wait(2)
+        raise WebDriverException("session deleted")
+
+    errors = []
+
+    def run():
+        try:
+            pool.map(crash_after_close, [1])
+        except BrowserClosed as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    started.wait(2)
+    pool.close()
+    release.set()
+    worker.join(2)
+    assert not worker.is_alive() and len(errors) == 1
+    assert len(created) == 1 and created[0].quit_called
+    with pytest.raises(BrowserClosed):
+        pool.map(lambda d, n: n, [1])
+    assert len(created) == 1
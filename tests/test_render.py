@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from ecc_rankings.render import PageTemplate, TABLE_SLOT, iter_table, write_if_changed
+
+
+def _legacy_table(df, sortable):
+    html = df.to_html(index=False, escape=False)
+    for col in sortable:
+        html = html.replace(f"<th>{col}</th>", f'<th data-sort-method="number">{col}</th>')
+    return html
+
+
+def test_iter_table_matches_to_html():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        "Club Ranking": np.arange(1, 1201),
+        "Badge": ["🥇", "🥈", "🥉"] + [""] * 1197,
+        "Player": [f"P{i} <b>" for i in range(1200)],
+        "average": rng.random(1200) * 100,
+        "Eco": np.where(rng.random(1200) > 0.9, np.nan, rng.random(1200) * 8),
+        "Points": rng.integers(0, 900, 1200),
+    })
+    sortable = ("Club Ranking", "Points", "Eco", "missing")
+    chunks = list(iter_table(df, sortable, chunk_rows=500))
+    assert len(chunks) == 5  # header, 3 row chunks, footer
+    assert "".join(chunks) == _legacy_table(df, sortable)
+    assert "".join(iter_table(df.iloc[:0], sortable)) == _legacy_table(df.iloc[:0], sortable)
+
+
+def test_write_if_changed(tmp_path):
+    page = PageTemplate(f"<html>{TABLE_SLOT}</html>")
+    path = os.path.join(tmp_path, "docs", "page.html")
+    assert write_if_changed(path, page.stream(["<p>a</p>", "<p>b</p>"]))
+    mtime = os.stat(path).st_mtime_ns
+    assert not write_if_changed(path, page.stream(["<p>a</p><p>b</p>"]))
+    assert os.stat(path).st_mtime_ns == mtime and not os.path.exists(path + ".tmp")
+    assert write_if_changed(path, "<html>changed</html>")
+    assert open(path, encoding="utf-8").read() == "<html>changed</html>"
+
+
+def test_paged_board_writes_rows_and_sort_index(tmp_path):
+    import json
+
+    from ecc_rankings.batting import BattingScraper
+    from ecc_rankings.render import data_paths
+
+    rng = np.random.default_rng(3)
+    n = 1234
+    scored = pd.DataFrame({
+        "Player": [f"Player {i}" for i in range(n)],
+        "Runs": rng.integers(0, 800, n),
+        "matches": rng.integers(1, 15, n),
+        "average": np.round(rng.random(n) * 60, 2),
+        "strike_rate": np.round(rng.random(n) * 150, 2),
+        "Points": rng.integers(0, 900, n),
+    })
+    path = os.path.join(tmp_path, "batting.html")
+    scraper = BattingScraper(html_path=path)
+    assert scraper.write_html(scored, page_rows=100)
+    rows_path, index_path = data_paths(path)
+
+    table = scraper.table(scored)
+    rows = [json.loads(line) for line in open(rows_path, encoding="utf-8")]
+    assert len(rows) == n and rows[0][:3] == ["1", "🥇", table["Player"][0]]
+    meta = json.load(open(index_path, encoding="utf-8"))
+    assert meta["rows"] == n and meta["pageRows"] == 100 and meta["columns"] == list(table.columns)
+    runs = table["Runs"].to_numpy()
+    assert list(runs[meta["order"]["Runs"]]) == sorted(runs, reverse=True)
+    assert set(meta["order"]) == set(scraper.SORTABLE)
+
+    html = open(path, encoding="utf-8").read()
+    assert html.count("    <tr>\n") == 100 and 'data-rows="batting.ndjson"' in html and "1 / 13" in html
+    assert not scraper.write_html(scored, page_rows=100)
+    # Short boards stay a single Tablesort table
+    assert scraper.render_html(scored.head(50), page_rows=100) == scraper.render_html(scored.head(50))
@@ -0,0 +1,61 @@
+import os
+
+from ecc_rankings.batting import BattingScraper
+from ecc_rankings.config import BATTING_URLS, SCORECARD_BATTING_URLS, SCORECARD_BOWLING_URLS
+from ecc_rankings.fantasy_points import build_fantasy_points_json
+from ecc_rankings.fetch import TABLES, Fetcher, Page
+from ecc_rankings.replay import SnapshotStore
+from ecc_rankings.store import SeasonStore
+
+from conftest import stats_page
+
+DOCS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs")
+
+
+def test_record_then_replay_without_network(tmp_path, serve_dir):
+    store = SnapshotStore(str(tmp_path))
+    url = f"{serve_dir(DOCS)}/kncb_allrounder_stats_2025.html"
+    with Fetcher(mode="http", snapshots=store) as f:
+        f.fetch(url, kind=TABLES)
+    assert store.urls() == [url]
+
+    with Fetcher(mode="replay", snapshots=store) as f:
+        page = f.fetch(url, kind=TABLES)
+    assert page.backend == "replay"
+    assert "ARI" in page.tables()[0].columns
+
+
+def test_scrapers_and_fantasy_replay_end_to_end(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    header = ["#", "Player", "Team", "M", "I", "NO", "R", "HS", "Avg", "SR"]
+    for klasse, url in BATTING_URLS.items():
+        rows = [header, ["1", f"Bat {klasse}", "Eindhoven CC", "5", "5", "1", "200", "80*", "50.0", "120.0"]]
+        store.save(Page(url, stats_page(rows), "browser"))
+    bat = ("<table><tr><th>Batter</th><th>R</th><th>B</th><th>4s</th><th>6s</th></tr>"
+           "<tr><td>A Manohar</td><td>55</td><td>40</td><td>6</td><td>2</td></tr></table>")
+    bowl = ("<table><tr><th>Bowler</th><th>O</th><th>M</th><th>R</th><th>W</th><th>Econ</th></tr>"
+            "<tr><td>A Manohar</td><td>4</td><td>1</td><td>10</td><td>3</td><td>2.5</td></tr></table>")
+    for url in SCORECARD_BATTING_URLS:
+        store.save(Page(url, bat, "http"))
+    for url in SCORECARD_BOWLING_URLS:
+        store.save(Page(url, bowl, "http"))
+
+    with Fetcher(mode="replay", snapshots=store) as f:
+        df = BattingScraper(html_path="").scrape(fetcher=f)
+        payload = build_fantasy_points_json(fetcher=f, match_date="2025-09-01",
+                                            batting_urls=SCORECARD_BATTING_URLS[:1],
+                                            bowling_urls=SCORECARD_BOWLING_URLS[:1],
+                                            store=SeasonStore(str(tmp_path / "store")))
+        assert set(f.served.values()) == {"replay"}
+
+    assert len(df) == len(BATTING_URLS)
+    assert df["Runs"].tolist() == ["200"] * len(BATTING_URLS)
+    [player] = payload["playersWithPoints"]
+    assert player["player_name"] == "aarav manohar"
+    assert (player["runs"], player["wickets"], player["fantasy_points"]) == (55, 3, 55 + 6 + 4 + 4 + 60 + 2 + 4 + 2)
+
+    innings = SeasonStore(str(tmp_path / "store")).load("fantasy_innings", columns=["match_id", "period", "side", "runs", "wickets"])
+    assert sorted(innings["period"]) == ["2820388", "2821922"]
+    bat, bowl = (innings[innings["side"] == side] for side in ("bat", "bowl"))
+    assert bat["runs"].tolist() == [55] and bowl["wickets"].tolist() == [3]
+    assert set(innings["match_id"]) == {"134453-7258356"}
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+
+from ecc_rankings.batting import BattingScraper
+from ecc_rankings.bowling import BowlingScraper
+from ecc_rankings.store import SeasonStore
+
+
+def _batting(season, klasse, players):
+    return pd.DataFrame([
+        {"KNCB Ranking": str(i + 1), "Klasse": klasse, "Player": p, "matches": "4", "innings": "4", "not_outs": "1",
+         "Runs": str(100 + i), "highest": "64*", "average": "33.3", "strike_rate": "110.5", "Season": season}
+        for i, p in enumerate(players)
+    ])
+
+
+def test_write_load_roundtrip_with_pruning_and_filters(tmp_path):
+    store = SeasonStore(str(tmp_path))
+    store.write("batting_raw", pd.concat([_batting(2024, "Eerste_Klasse", ["A", "B"]),
+                                          _batting(2025, "Eerste_Klasse", ["A"]),
+                                          _batting(2025, "Tweede_Klasse", ["C", "D"])]))
+    assert os.path.isdir(tmp_path / "batting_raw" / "Season=2025" / "Klasse=Tweede_Klasse")
+
+    df = store.load("batting_raw", columns=["Player", "Runs", "highest"], filters={"Season": "2025"})
+    assert list(df.columns) == ["Player", "Runs", "highest"]
+    assert sorted(df["Player"]) == ["A", "C", "D"]
+    assert str(df["Runs"].dtype) == "int64" and df["highest"].iloc[0] == "64*"
+
+    two = store.load("batting_raw", filters={"Season": "2025", "Klasse": ["Tweede_Klasse"]})
+    assert sorted(two["Player"]) == ["C", "D"]
+
+
+def test_rewrite_replaces_only_covered_partitions(tmp_path):
+    store = SeasonStore(str(tmp_path))
+    store.write("batting_raw", pd.concat([_batting(2025, "Eerste_Klasse", ["A", "B"]),
+                                          _batting(2025, "Tweede_Klasse", ["C"])]))
+    store.write("batting_raw", _batting(2025, "Eerste_Klasse", ["Z"]))
+    df = store.load("batting_raw", columns=["Klasse", "Player"])
+    assert sorted(zip(df["Klasse"], df["Player"])) == [("Eerste_Klasse", "Z"), ("Tweede_Klasse", "C")]
+    assert store.load("bowling_raw").empty
+
+
+def test_scored_frames_roundtrip(tmp_path):
+    store = SeasonStore(str(tmp_path))
+    raw = _batting(2025, "Eerste_Klasse", ["A", "B"])
+    scored = BattingScraper(html_path="").combine_and_score(raw)
+    store.write("batting_scored", scored)  # no Season column: the store's season
+    assert os.path.isdir(tmp_path / "batting_scored" / "Season=2025")
+    back = store.load("batting_scored", columns=list(scored.columns)).sort_values("Player", ignore_index=True)
+    assert back["Points"].tolist() == scored["Points"].tolist()
+    assert back["Klasse Weight"].tolist() == scored["Klasse Weight"].tolist()
+
+    bowl = pd.DataFrame([{"KNCB Ranking": "1", "Klasse": "Eerste_Klasse", "Player": "A", "Matches": "5",
+                          "Wickets": "9", "Best": "4/12", "Avg": "11.2", "Eco": "4.1", "Strike Rate": "16.4",
+                          "Season": 2025}])
+    store.write("bowling_scored", BowlingScraper(html_path="").calculate_icc_points(bowl))
+    assert store.load("bowling_scored", columns=["BestWkts"])["BestWkts"].tolist() == [4]